@@ -0,0 +1,141 @@
+import gzip
+import logging
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # brotli は任意依存（未インストールなら gzip のみ）
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# 圧縮する Content-Type（画像などの圧縮済み形式は対象外）
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "image/svg+xml")
+
+
+def supported_encodings() -> tuple[str, ...]:
+    """サーバーが返せる Content-Encoding（優先順）"""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """
+    Accept-Encoding から返す Content-Encoding を選ぶ
+
+    q値が最大のものを選び、同値ならサーバーの優先順（br > gzip）に従う。
+    q=0 は拒否、"*" は明示されていない符号化すべてに適用する。
+    """
+    if not accept_encoding:
+        return None
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    best, best_q = None, 0.0
+    for encoding in supported_encodings():
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(body: bytes, encoding: str, precompressed: bool = False) -> bytes:
+    """
+    ボディを圧縮する
+
+    precompressed=True はスナップショット用（内容が変わるまで1回しか圧縮しないため最大圧縮率）。
+    """
+    if encoding == "br":
+        quality = settings.COMPRESSION_SNAPSHOT_BROTLI_QUALITY if precompressed else settings.COMPRESSION_BROTLI_QUALITY
+        return brotli.compress(body, quality=quality)
+    if encoding == "gzip":
+        level = settings.COMPRESSION_SNAPSHOT_GZIP_LEVEL if precompressed else settings.COMPRESSION_GZIP_LEVEL
+        # mtime=0 で同じ内容から同じバイト列を作る
+        return gzip.compress(body, compresslevel=level, mtime=0)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def is_compressible(content_type: str | None) -> bool:
+    if not content_type:
+        return False
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """
+    レスポンスを Accept-Encoding に応じて gzip / brotli で圧縮するASGIミドルウェア
+
+    COMPRESSION_MIN_SIZE 未満のボディ、圧縮済み（Content-Encoding あり）のレスポンス、
+    ストリーミングレスポンスはそのまま返す。スナップショットのレスポンスは
+    事前圧縮済みの Content-Encoding 付きで届くため、ここでは再圧縮しない。
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message.get("headers", []))
+                if "content-encoding" in headers or not is_compressible(headers.get("content-type")):
+                    passthrough = True
+                    await send(message)
+                else:
+                    # ボディを見て圧縮するか決めるまで開始メッセージを保留
+                    start = message
+                return
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < self.minimum_size:
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding)
+            headers = MutableHeaders(raw=start.setdefault("headers", []))
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+if settings.COMPRESSION_ENABLED and brotli is None:
+    logger.info("brotli is not installed; responses are compressed with gzip only")
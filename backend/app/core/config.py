@@ -1,6 +1,6 @@
 import os
 from pydantic import BaseSettings, validator, EmailStr
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 class Settings(BaseSettings):
     API_PREFIX: str = ""
@@ -9,6 +9,94 @@ class Settings(BaseSettings):
     # Supabase
     SUPABASE_URL: str
     SUPABASE_KEY: str
+    SUPABASE_TIMEOUT: float = 10.0
+    SUPABASE_CONNECT_TIMEOUT: float = 5.0
+    SUPABASE_POOL_MAX_CONNECTIONS: int = 20
+    SUPABASE_POOL_MAX_KEEPALIVE: int = 10
+    SUPABASE_POOL_KEEPALIVE_EXPIRY: float = 30.0
+    # "async": 非同期PostgRESTクライアント / "thread": 同期クライアント＋スレッドプール
+    SUPABASE_REPOSITORY_MODE: str = "async"
+    SUPABASE_THREADPOOL_SIZE: int = 10
+    # UseCaseから見た1問い合わせあたりのタイムアウト（秒）
+    UPSTREAM_CALL_TIMEOUT: float = 5.0
+    # 1回の問い合わせ（再試行を含む）の期限と、1回の試行の期限（秒）
+    UPSTREAM_DEADLINE: float = 8.0
+    UPSTREAM_ATTEMPT_TIMEOUT: float = 3.0
+    # 読み取りの一時的な失敗の再試行回数とバックオフ（秒、full jitter）
+    UPSTREAM_RETRIES: int = 2
+    UPSTREAM_RETRY_BACKOFF: float = 0.05
+    UPSTREAM_RETRY_BACKOFF_MAX: float = 1.0
+    # この秒数以内に応答がなければ同じ読み取りをもう1本送る（未設定ならヘッジしない）
+    UPSTREAM_HEDGE_DELAY: Optional[float] = None
+    # 直近 WINDOW 秒の失敗率が FAILURE_RATE 以上（MIN_CALLS 件以上）で OPEN_SECONDS 秒間問い合わせを止める
+    CIRCUIT_BREAKER_ENABLED: bool = True
+    CIRCUIT_BREAKER_FAILURE_RATE: float = 0.5
+    CIRCUIT_BREAKER_MIN_CALLS: int = 10
+    CIRCUIT_BREAKER_WINDOW: float = 30.0
+    CIRCUIT_BREAKER_OPEN_SECONDS: float = 15.0
+    # /about を埋め込みリソース（about + education/experience/social_media）の1クエリで取得する
+    ABOUT_AGGREGATE_QUERY: bool = False
+    # DISTINCT済みカテゴリのビュー名（未設定なら skills を走査して重複排除）
+    SKILL_CATEGORIES_VIEW: Optional[str] = None
+
+    # インプロセスキャッシュ（TTLは秒）
+    CACHE_ENABLED: bool = True
+    CACHE_MAX_ENTRIES: int = 256
+    CACHE_STALE_TTL: float = 3600.0
+    CACHE_TTL_WORKS: float = 300.0
+    CACHE_TTL_SKILLS: float = 600.0
+    CACHE_TTL_ABOUT: float = 600.0
+    CACHE_TTL_HERO: float = 600.0
+    # Supabaseを利用できないとき、期限切れのキャッシュを返す
+    CACHE_FALLBACK_ON_OUTAGE: bool = True
+
+    # 同一ホストの複数ワーカーでキャッシュ破棄を共有するSQLiteファイル（未設定なら共有しない）
+    CACHE_COHERENCE_PATH: Optional[str] = None
+    CACHE_COHERENCE_POLL_INTERVAL: float = 0.5
+    # POST /cache/invalidate のBearerトークン（未設定なら管理APIは無効）
+    ADMIN_API_TOKEN: Optional[str] = None
+    # Supabase Realtime の変更通知を受けてキャッシュを自動破棄する
+    CHANGE_FEED_ENABLED: bool = False
+    # 未設定なら SUPABASE_URL から Realtime の WebSocket URL を組み立てる
+    CHANGE_FEED_URL: Optional[str] = None
+    CHANGE_FEED_RECONNECT_DELAY: float = 1.0
+
+    # /metrics（Prometheus形式）とリクエスト計測
+    METRICS_ENABLED: bool = True
+    # 未設定なら /metrics は認証なし
+    METRICS_TOKEN: Optional[str] = None
+    # upstream / repo / encode の処理時間を Server-Timing ヘッダーで返す
+    SERVER_TIMING_ENABLED: bool = True
+
+    # HTTPキャッシュ（Cache-Control、秒）
+    HTTP_CACHE_MAX_AGE: int = 60
+    HTTP_CACHE_S_MAXAGE: int = 300
+    HTTP_CACHE_STALE_WHILE_REVALIDATE: int = 600
+    # ルート名ごとの上書き 例: {"works": {"max_age": 30, "s_maxage": 600}}
+    HTTP_CACHE_ROUTE_POLICIES: Dict[str, Dict[str, int]] = {}
+    # GETレスポンスをエンコード済みバイト列として保持し、破棄されるまで再利用する
+    RESPONSE_SNAPSHOT_ENABLED: bool = True
+    # "orjson": 検証済みモデルを直接エンコード / "default": FastAPI標準（jsonable_encoder + json）
+    JSON_RESPONSE_CLASS: str = "orjson"
+    # Accept-Encoding に応じた gzip / brotli 圧縮（brotli は未インストールなら使わない）
+    COMPRESSION_ENABLED: bool = True
+    # これより小さいボディは圧縮しない（バイト）
+    COMPRESSION_MIN_SIZE: int = 1024
+    # 都度圧縮するレスポンスの圧縮レベル（速度優先）
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+    # スナップショットの事前圧縮レベル（内容の版ごとに1回なので圧縮率優先。
+    # brotli の 10 以上は数百KBで数秒かかるため 9）
+    COMPRESSION_SNAPSHOT_GZIP_LEVEL: int = 9
+    COMPRESSION_SNAPSHOT_BROTLI_QUALITY: int = 9
+
+    # 起動時のウォームアップ（接続を受け付ける前にキャッシュとコネクションプールを温める）
+    STARTUP_WARMUP: bool = False
+    # API_PREFIX からの相対パス
+    STARTUP_WARMUP_PATHS: List[str] = [
+        "/works", "/skills", "/skills/categories", "/about", "/hero/introduction", "/hero/timeline", "/portfolio",
+    ]
+    STARTUP_WARMUP_TIMEOUT: float = 10.0
 
     # Email
     EMAILS_ENABLED: bool = False
@@ -22,6 +110,40 @@ class Settings(BaseSettings):
     SMTP_TLS: bool = True
     EMAILS_FROM_NAME: str = "Portfolio"
     EMAILS_FROM_EMAIL: Optional[EmailStr] = None
+    # SMTP接続プール（ワーカーごと）
+    SMTP_POOL_SIZE: int = 2
+    SMTP_TIMEOUT: float = 10.0
+    SMTP_IDLE_TIMEOUT: float = 60.0
+    # 送信待ちメールの永続スプールと送信ワーカー
+    EMAIL_OUTBOX_PATH: str = "data/email_outbox.sqlite3"
+    EMAIL_OUTBOX_WORKERS: int = 2
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 5
+    EMAIL_OUTBOX_RETRY_BASE: float = 2.0
+    EMAIL_OUTBOX_RETRY_MAX: float = 300.0
+    # 終了時に送信待ちメールを送り切るまで待つ秒数
+    EMAIL_OUTBOX_DRAIN_TIMEOUT: float = 10.0
+
+    # 読み取り用テーブルをローカルのSQLiteに複製し、Supabase停止中もそこから返す
+    SNAPSHOT_ENABLED: bool = False
+    SNAPSHOT_PATH: str = "data/snapshot.sqlite3"
+    # 定期的に取り直す間隔（秒、他ワーカーがこの間に保存した版があればそれを使う）
+    SNAPSHOT_SYNC_INTERVAL: float = 60.0
+    SNAPSHOT_SYNC_TIMEOUT: float = 30.0
+    # キャッシュ破棄（管理API・変更通知）から取り直すまでの待ち時間（秒）
+    SNAPSHOT_REFRESH_DEBOUNCE: float = 1.0
+
+    # お問い合わせの流量制限（トークンバケット）と重複排除
+    CONTACT_RATE_LIMIT_ENABLED: bool = True
+    CONTACT_RATE_IP_BURST: int = 5
+    CONTACT_RATE_IP_PER_MINUTE: float = 1.0
+    CONTACT_RATE_EMAIL_BURST: int = 3
+    CONTACT_RATE_EMAIL_PER_MINUTE: float = 0.2
+    # 同一内容の再送信を重複とみなす秒数
+    CONTACT_DEDUP_WINDOW: float = 600.0
+    # IP・メールアドレス・重複判定それぞれで保持するキーの上限
+    CONTACT_RATE_MAX_KEYS: int = 10000
+    # リバースプロキシ配下で X-Forwarded-For の末尾をクライアントIPとして使う
+    TRUST_FORWARDED_FOR: bool = False
     
     @validator("BACKEND_CORS_ORIGINS", pre=True)
     def assemble_cors_origins(cls, v: Union[str, List[str]]) -> List[str]:
@@ -31,6 +153,18 @@ class Settings(BaseSettings):
             return v
         raise ValueError(v)
 
+    @validator("SUPABASE_REPOSITORY_MODE")
+    def validate_repository_mode(cls, v: str) -> str:
+        if v not in ("async", "thread"):
+            raise ValueError("SUPABASE_REPOSITORY_MODE must be 'async' or 'thread'")
+        return v
+
+    @validator("JSON_RESPONSE_CLASS")
+    def validate_json_response_class(cls, v: str) -> str:
+        if v not in ("orjson", "default"):
+            raise ValueError("JSON_RESPONSE_CLASS must be 'orjson' or 'default'")
+        return v
+
     class Config:
         env_file = ".env"
         case_sensitive = True
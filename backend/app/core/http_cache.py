@@ -0,0 +1,163 @@
+import hashlib
+from dataclasses import dataclass, replace
+from typing import Any, Awaitable, Callable
+
+import anyio
+from fastapi import Request, Response
+
+from app.core.compression import compress, negotiate_encoding, supported_encodings
+from app.core.config import settings
+from app.core.responses import dumps
+from app.domain.entity.response import is_degraded
+from app.infra.cache.cache_registry import cache_registry
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Cache-Control ヘッダーの設定値"""
+    max_age: int
+    s_maxage: int
+    stale_while_revalidate: int
+
+    @property
+    def header(self) -> str:
+        if self.max_age <= 0 and self.s_maxage <= 0:
+            return "no-cache"
+        parts = ["public", f"max-age={self.max_age}", f"s-maxage={self.s_maxage}"]
+        if self.stale_while_revalidate > 0:
+            parts.append(f"stale-while-revalidate={self.stale_while_revalidate}")
+        return ", ".join(parts)
+
+
+def cache_policy(route: str) -> CachePolicy:
+    """ルート名ごとのキャッシュ方針取得（HTTP_CACHE_ROUTE_POLICIES で上書き可能）"""
+    override = settings.HTTP_CACHE_ROUTE_POLICIES.get(route, {})
+    return CachePolicy(
+        max_age=override.get("max_age", settings.HTTP_CACHE_MAX_AGE),
+        s_maxage=override.get("s_maxage", settings.HTTP_CACHE_S_MAXAGE),
+        stale_while_revalidate=override.get("stale_while_revalidate", settings.HTTP_CACHE_STALE_WHILE_REVALIDATE),
+    )
+
+
+def compute_etag(body: bytes) -> str:
+    """レスポンスボディから強いETagを計算"""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def variant_etag(etag: str, encoding: str | None) -> str:
+    """圧縮版のETag（表現ごとに異なる強いETagにする 例: "abc-br"）"""
+    if encoding is None:
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match とETagの比較（弱い比較、圧縮版のETagも同じ内容として一致させる）"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    accepted = {etag, *(variant_etag(etag, encoding) for encoding in supported_encodings())}
+    return any(tag.removeprefix("W/") in accepted for tag in candidates)
+
+
+def encode_json(content: Any) -> bytes:
+    """レスポンスボディ用にJSONへ変換"""
+    return dumps(content)
+
+
+@dataclass(frozen=True)
+class ResponseSnapshot:
+    """エンコード済みのレスポンスボディとETag（事前圧縮したボディを含む）"""
+    body: bytes
+    etag: str
+    headers: tuple[tuple[str, str], ...] = ()
+    # Content-Encoding ごとの圧縮済みボディ
+    variants: tuple[tuple[str, bytes], ...] = ()
+    # 一部の取得に失敗して補った内容（保存せず、no-store で返す）
+    degraded: bool = False
+
+    @classmethod
+    def from_content(
+        cls, content: Any, headers: dict[str, str] | None = None, degraded: bool = False
+    ) -> "ResponseSnapshot":
+        body = encode_json(content)
+        return cls(
+            body=body,
+            etag=compute_etag(body),
+            headers=tuple((headers or {}).items()),
+            degraded=degraded or is_degraded(content),
+        )
+
+    def precompressed(self) -> "ResponseSnapshot":
+        """対応する全符号化で圧縮したボディを持つスナップショット（閾値未満なら圧縮しない）"""
+        if not _should_compress(self.body) or self.variants:
+            return self
+        variants = tuple((encoding, compress(self.body, encoding, precompressed=True)) for encoding in supported_encodings())
+        return replace(self, variants=variants)
+
+    def encoded_body(self, encoding: str) -> bytes:
+        for name, body in self.variants:
+            if name == encoding:
+                return body
+        return compress(self.body, encoding)
+
+
+def _should_compress(body: bytes) -> bool:
+    return settings.COMPRESSION_ENABLED and len(body) >= settings.COMPRESSION_MIN_SIZE
+
+
+def _render(request: Request, snapshot: ResponseSnapshot, route: str) -> Response:
+    headers = dict(snapshot.headers)
+    encoding = None
+    if _should_compress(snapshot.body):
+        headers["Vary"] = "Accept-Encoding"
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    if snapshot.degraded:
+        # 補った内容は共有キャッシュにも残させず、ETagでの再検証もさせない
+        headers["Cache-Control"] = "no-store"
+    else:
+        headers["Cache-Control"] = cache_policy(route).header
+        headers["ETag"] = variant_etag(snapshot.etag, encoding)
+        if etag_matches(request.headers.get("if-none-match"), snapshot.etag):
+            return Response(status_code=304, headers=headers)
+    if encoding is None:
+        return Response(content=snapshot.body, media_type="application/json", headers=headers)
+    headers["Content-Encoding"] = encoding
+    return Response(content=snapshot.encoded_body(encoding), media_type="application/json", headers=headers)
+
+
+async def snapshot_response(
+    request: Request,
+    route: str,
+    namespace: str,
+    build: Callable[[], Awaitable[Any]],
+    key: str | None = None,
+) -> Response:
+    """
+    エンコード済みスナップショットからレスポンスを返す
+
+    初回（または名前空間の破棄後）だけ build() の結果をJSONバイト列にして保存し、
+    以降はモデル生成・検証・シリアライズを行わずにそのバイト列を返す。
+    追加ヘッダーが必要な場合、build() は ResponseSnapshot を直接返してよい。
+    一部の取得に失敗して補った結果（degraded）は保存せず、no-store で返す。
+    保存時に gzip / brotli で圧縮したボディも作るため、圧縮も内容の版ごとに1回で済む。
+    RESPONSE_SNAPSHOT_ENABLED が無効なら毎回エンコードし、必要な符号化だけ圧縮する。
+    """
+    async def load() -> ResponseSnapshot:
+        result = await build()
+        if isinstance(result, ResponseSnapshot):
+            return result
+        return ResponseSnapshot.from_content(result)
+
+    if not settings.RESPONSE_SNAPSHOT_ENABLED:
+        return _render(request, await load(), route)
+
+    async def load_precompressed() -> ResponseSnapshot:
+        # 大きなボディの圧縮でイベントループを塞がないようスレッドで行う
+        return await anyio.to_thread.run_sync((await load()).precompressed)
+
+    cache = cache_registry.cache(f"{namespace}:snapshot")
+    snapshot = await cache.get_or_load(key or route, load_precompressed, cacheable=lambda s: not s.degraded)
+    return _render(request, snapshot, route)
@@ -0,0 +1,240 @@
+import bisect
+import functools
+import inspect
+import math
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Iterable
+
+# 秒単位のレイテンシ用バケット
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# (メトリクス名, ラベル, 値)
+Sample = tuple[str, dict[str, str], float]
+# 収集時に値を作る関数（キャッシュ統計・送信キューなど、元の値を持つ側から読む）
+Collector = Callable[[], Iterable[tuple[str, str, str, list[Sample]]]]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def samples(self) -> list[Sample]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def samples(self) -> list[Sample]:
+        return [(self.name, dict(zip(self.labelnames, k)), v) for k, v in self._values.items()]
+
+
+class Gauge(_Metric):
+    type = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def samples(self) -> list[Sample]:
+        return [(self.name, dict(zip(self.labelnames, k)), v) for k, v in self._values.items()]
+
+
+class Histogram(_Metric):
+    """累積バケットのヒストグラム（観測はバケット探索1回と加算のみ）"""
+
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # ラベル -> [バケットごとの件数..., +Inf, 合計値]
+        self._values: dict[tuple, list[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(labels)
+            if counts is None:
+                counts = self._values[labels] = [0.0] * (len(self.buckets) + 2)
+            counts[index] += 1
+            counts[-1] += value
+
+    def samples(self) -> list[Sample]:
+        result: list[Sample] = []
+        for key, counts in self._values.items():
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                result.append((f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative))
+            result.append((f"{self.name}_count", labels, cumulative))
+            result.append((f"{self.name}_sum", labels, counts[-1]))
+        return result
+
+
+class MetricsRegistry:
+    """メトリクスの登録先とPrometheusテキスト形式での出力"""
+
+    def __init__(self):
+        self._metrics: list[_Metric] = []
+        self._collectors: list[Collector] = []
+
+    def counter(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Collector) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus テキスト形式（version 0.0.4）"""
+        families = [(m.name, m.type, m.help, m.samples()) for m in self._metrics]
+        for collector in self._collectors:
+            families.extend(collector())
+        lines: list[str] = []
+        for name, type_, help, samples in families:
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {type_}")
+            lines.extend(f"{n}{_format_labels(labels)} {_format_value(v)}" for n, labels, v in samples)
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+HTTP_REQUESTS = metrics_registry.counter(
+    "http_requests_total", "HTTP requests by route and status", ("method", "route", "status")
+)
+HTTP_REQUEST_DURATION = metrics_registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency until the response body is sent", ("method", "route")
+)
+HTTP_IN_FLIGHT = metrics_registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being processed"
+)
+REPOSITORY_CALL_DURATION = metrics_registry.histogram(
+    "repository_call_duration_seconds",
+    "Supabase repository method latency (upstream round trips plus model validation)",
+    ("repository", "method"),
+)
+REPOSITORY_CALL_ERRORS = metrics_registry.counter(
+    "repository_call_errors_total", "Supabase repository method failures", ("repository", "method")
+)
+UPSTREAM_REQUEST_DURATION = metrics_registry.histogram(
+    "upstream_request_duration_seconds", "PostgREST round trip latency", ("table",)
+)
+RESPONSE_ENCODE_DURATION = metrics_registry.histogram(
+    "response_encode_duration_seconds",
+    "JSON encoding time for response bodies",
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+)
+
+
+# リクエスト内の処理時間の集計（Server-Timing 用）: 名前 -> [合計秒, 回数]
+_request_timings: ContextVar[dict[str, list[float]] | None] = ContextVar("request_timings", default=None)
+
+
+def start_request_timings() -> dict[str, list[float]]:
+    timings: dict[str, list[float]] = {}
+    _request_timings.set(timings)
+    return timings
+
+
+def record_timing(name: str, seconds: float) -> None:
+    """現在のリクエストの Server-Timing に処理時間を加算する（リクエスト外では何もしない）"""
+    timings = _request_timings.get()
+    if timings is None:
+        return
+    entry = timings.get(name)
+    if entry is None:
+        timings[name] = [seconds, 1]
+    else:
+        entry[0] += seconds
+        entry[1] += 1
+
+
+def server_timing_header(timings: dict[str, list[float]], total: float) -> str:
+    parts = [f"app;dur={total * 1000:.1f}"]
+    for name, (seconds, count) in timings.items():
+        calls = int(count)
+        parts.append(f'{name};dur={seconds * 1000:.1f};desc="{calls} call{"s" if calls != 1 else ""}"')
+    return ", ".join(parts)
+
+
+def instrument_repository(repository: str):
+    """
+    リポジトリの公開asyncメソッドの所要時間を計測するクラスデコレーター
+
+    メソッドごとのヒストグラムと、リクエストの Server-Timing（repo）に記録する。
+    """
+    def decorate(cls):
+        for attr, func in list(vars(cls).items()):
+            if attr.startswith("_") or not inspect.iscoroutinefunction(func):
+                continue
+            setattr(cls, attr, _timed(func, repository, attr))
+        return cls
+    return decorate
+
+
+def _timed(func, repository: str, method: str):
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any):
+        started = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        except Exception:
+            REPOSITORY_CALL_ERRORS.inc(repository, method)
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            REPOSITORY_CALL_DURATION.observe(elapsed, repository, method)
+            record_timing("repo", elapsed)
+    return wrapper
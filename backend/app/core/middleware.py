@@ -0,0 +1,71 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+    HTTP_IN_FLIGHT,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    server_timing_header,
+    start_request_timings,
+)
+
+# ルートに一致しなかったリクエストのラベル（パスをそのまま使うと系列が増え続けるため）
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    リクエストごとのレイテンシ・件数・処理中リクエスト数を記録するASGIミドルウェア
+
+    ルートはパスのテンプレート（/works/{work_id}）で集計する。server_timing=True の
+    とき、リクエスト内で記録した処理時間（upstream / repo / encode）を
+    Server-Timing ヘッダーで返す。
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool = True):
+        self.app = app
+        self.server_timing = server_timing
+        self._route_templates: dict = {}
+
+    def _route_label(self, scope: Scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        label = self._route_templates.get(endpoint)
+        if label is None:
+            label = UNMATCHED_ROUTE
+            for route in scope["app"].routes:
+                if getattr(route, "endpoint", None) is endpoint:
+                    label = route.path
+                    break
+            self._route_templates[endpoint] = label
+        return label
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        timings = start_request_timings()
+        status = 500
+        HTTP_IN_FLIGHT.inc()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.server_timing:
+                    header = server_timing_header(timings, time.perf_counter() - started)
+                    message["headers"] = [*message.get("headers", []), (b"server-timing", header.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            route = self._route_label(scope)
+            method = scope["method"]
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, method, route)
+            HTTP_REQUESTS.inc(method, route, str(status))
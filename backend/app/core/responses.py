@@ -0,0 +1,73 @@
+import json
+import logging
+import time
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.metrics import RESPONSE_ENCODE_DURATION, record_timing
+
+try:
+    import orjson
+except ImportError:  # orjson は任意依存
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _orjson_default(obj: Any) -> Any:
+    """orjson が直接扱えない型の変換（検証済みのpydanticモデルは dict にするだけ）"""
+    if isinstance(obj, BaseModel):
+        return obj.dict(by_alias=True)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def use_orjson() -> bool:
+    """JSON_RESPONSE_CLASS が orjson で、かつ orjson が利用可能か"""
+    return settings.JSON_RESPONSE_CLASS == "orjson" and orjson is not None
+
+
+def dumps(content: Any) -> bytes:
+    """
+    レスポンス用JSONエンコード
+
+    orjson 利用時は jsonable_encoder を通さず、モデルを dict 化してそのまま
+    エンコードする。それ以外は JSONResponse と同じ出力にする。
+    """
+    started = time.perf_counter()
+    if use_orjson():
+        body = orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        body = json.dumps(
+            jsonable_encoder(content),
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
+    elapsed = time.perf_counter() - started
+    RESPONSE_ENCODE_DURATION.observe(elapsed)
+    record_timing("encode", elapsed)
+    return body
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    dumps() でエンコードするJSONレスポンス（アプリ既定のレスポンスクラス）
+
+    ルートがモデルや dict を返すと、FastAPI は render() の前に response_model での
+    検証と jsonable_encoder を行う。検証済みのモデルを返すルートはこのクラスを
+    直接返し、その処理を省く（response_model はスキーマの記述にだけ使われる）。
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+if settings.JSON_RESPONSE_CLASS == "orjson" and orjson is None:
+    logger.warning("JSON_RESPONSE_CLASS=orjson but orjson is not installed; falling back to json")
@@ -0,0 +1,34 @@
+import importlib.util
+
+from uvicorn.workers import UvicornWorker as _BaseUvicornWorker
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def event_loop_impl() -> str:
+    """uvloop があれば使う（Windowsなど未対応環境では asyncio）"""
+    return "uvloop" if _installed("uvloop") else "asyncio"
+
+
+def http_impl() -> str:
+    """httptools があれば使う（無ければ純Pythonの h11）"""
+    return "httptools" if _installed("httptools") else "h11"
+
+
+class UvicornWorker(_BaseUvicornWorker):
+    """
+    本番用のgunicornワーカー
+
+    keep-alive・backlog は gunicorn の設定（gunicorn.conf.py）から引き継ぐ。
+    lifespan の起動に失敗したワーカーは起動させず、終了時は lifespan で
+    送信キュー・SMTP・Supabaseのコネクションプールを閉じてから抜ける。
+    """
+
+    CONFIG_KWARGS = {
+        "loop": event_loop_impl(),
+        "http": http_impl(),
+        "lifespan": "on",
+        "server_header": False,
+    }
@@ -0,0 +1,51 @@
+import asyncio
+import logging
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_up(app: FastAPI) -> None:
+    """
+    ワーカーが接続を受け付ける前にキャッシュとコネクションプールを温める
+
+    STARTUP_WARMUP_PATHS をアプリ内部（ASGI直接呼び出し）でGETし、リポジトリの
+    キャッシュ・レスポンススナップショット（事前圧縮を含む）を作り、PostgRESTへの
+    keep-alive接続を開いておく。失敗・タイムアウトしても起動は続ける
+    （初回リクエストが通常どおり読み込むだけ）。
+    """
+    started = time.perf_counter()
+    transport = httpx.ASGITransport(app=app)
+    paths = [f"{settings.API_PREFIX}{path}" for path in settings.STARTUP_WARMUP_PATHS]
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://warmup") as client:
+        async def fetch(path: str) -> str:
+            try:
+                response = await client.get(path, headers={"Accept-Encoding": "br, gzip"})
+            except Exception as e:
+                return f"{path}: {e}"
+            return "" if response.status_code < 400 else f"{path}: HTTP {response.status_code}"
+
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(*(fetch(path) for path in paths)),
+                timeout=settings.STARTUP_WARMUP_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Warm-up timed out after %.1fs", settings.STARTUP_WARMUP_TIMEOUT)
+            return
+
+    failures = [result for result in results if result]
+    for failure in failures:
+        logger.warning("Warm-up request failed: %s", failure)
+    logger.info(
+        "Warm-up finished in %.1fms (%d/%d paths)",
+        (time.perf_counter() - started) * 1000,
+        len(paths) - len(failures),
+        len(paths),
+    )
@@ -0,0 +1,23 @@
+import secrets
+
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from app.core.config import settings
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+def verify_admin_token(credentials: HTTPAuthorizationCredentials | None = Depends(_bearer)) -> None:
+    """管理APIの認証（ADMIN_API_TOKEN のBearerトークン）"""
+    if not settings.ADMIN_API_TOKEN:
+        # トークン未設定の環境では管理APIを公開しない
+        raise HTTPException(status_code=404, detail="Not Found")
+    if credentials is None or not secrets.compare_digest(
+        credentials.credentials.encode(), settings.ADMIN_API_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid admin token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
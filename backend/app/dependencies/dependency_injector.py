@@ -1,6 +1,6 @@
 from fastapi import Depends
-from supabase import create_client, Client as SupabaseClient
 from app.core.config import settings
+from app.infra.supabase_client import PostgrestClient, supabase_provider
 
 # Repository imports
 from app.infra.repository.supabase_work_repository import SupabaseWorkRepository
@@ -8,6 +8,18 @@ from app.infra.repository.supabase_skill_repository import SupabaseSkillReposito
 from app.infra.repository.supabase_about_repository import SupabaseAboutRepository
 from app.infra.repository.supabase_hero_repository import SupabaseHeroRepository
 from app.infra.repository.supabase_contact_repository import SupabaseContactRepository
+from app.infra.repository.cached_work_repository import CachedWorkRepository
+from app.infra.repository.cached_skill_repository import CachedSkillRepository
+from app.infra.repository.cached_about_repository import CachedAboutRepository
+from app.infra.repository.cached_hero_repository import CachedHeroRepository
+from app.infra.repository.snapshot_work_repository import SnapshotWorkRepository
+from app.infra.repository.snapshot_skill_repository import SnapshotSkillRepository
+from app.infra.repository.snapshot_about_repository import SnapshotAboutRepository
+from app.infra.repository.snapshot_hero_repository import SnapshotHeroRepository
+from app.infra.snapshot.sync_engine import snapshot_sync
+from app.infra.cache.cache_registry import cache_registry
+from app.infra.ratelimit.contact_guard import contact_guard
+from app.infra.search.work_search_index import work_search_index
 
 # UseCase imports
 from app.usecase.work_usecase import WorkUseCase
@@ -15,38 +27,72 @@ from app.usecase.skill_usecase import SkillUseCase
 from app.usecase.about_usecase import AboutUseCase
 from app.usecase.hero_usecase import HeroUseCase
 from app.usecase.contact_usecase import ContactUseCase
+from app.usecase.portfolio_usecase import PortfolioUseCase
 
 
-def get_supabase_client() -> SupabaseClient:
-    """Supabaseクライアント取得"""
-    return create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+def get_supabase_client() -> PostgrestClient:
+    """Supabaseクライアント取得（ワーカー内で共有）"""
+    return supabase_provider.get_repository_client()
 
 
-def get_work_usecase(client: SupabaseClient = Depends(get_supabase_client)) -> WorkUseCase:
+def _with_snapshot(repository, snapshot_class):
+    """SNAPSHOT_ENABLED のときローカルのスナップショットから読む（未取得の間は Supabase から読む）"""
+    if not settings.SNAPSHOT_ENABLED:
+        return repository
+    return snapshot_class(snapshot_sync, repository)
+
+
+def _with_cache(repository, cached_class, namespace: str):
+    """CACHE_ENABLED のときリポジトリをキャッシュ層で包む"""
+    if not settings.CACHE_ENABLED:
+        return repository
+    return cached_class(repository, cache_registry.cache(namespace))
+
+
+def get_work_usecase(client: PostgrestClient = Depends(get_supabase_client)) -> WorkUseCase:
     """WorkUseCase取得（DI）"""
-    repository = SupabaseWorkRepository(client)
-    return WorkUseCase(repository)
+    repository = _with_snapshot(SupabaseWorkRepository(client), SnapshotWorkRepository)
+    repository = _with_cache(repository, CachedWorkRepository, "works")
+    return WorkUseCase(repository, search_index=work_search_index)
 
 
-def get_skill_usecase(client: SupabaseClient = Depends(get_supabase_client)) -> SkillUseCase:
+def get_skill_usecase(client: PostgrestClient = Depends(get_supabase_client)) -> SkillUseCase:
     """SkillUseCase取得（DI）"""
-    repository = SupabaseSkillRepository(client)
+    repository = _with_snapshot(SupabaseSkillRepository(client), SnapshotSkillRepository)
+    repository = _with_cache(repository, CachedSkillRepository, "skills")
     return SkillUseCase(repository)
 
 
-def get_about_usecase(client: SupabaseClient = Depends(get_supabase_client)) -> AboutUseCase:
+def get_about_usecase(client: PostgrestClient = Depends(get_supabase_client)) -> AboutUseCase:
     """AboutUseCase取得（DI）"""
-    repository = SupabaseAboutRepository(client)
-    return AboutUseCase(repository)
+    repository = _with_snapshot(SupabaseAboutRepository(client), SnapshotAboutRepository)
+    repository = _with_cache(repository, CachedAboutRepository, "about")
+    return AboutUseCase(
+        repository,
+        call_timeout=settings.UPSTREAM_CALL_TIMEOUT,
+        use_aggregate_query=settings.ABOUT_AGGREGATE_QUERY,
+    )
 
 
-def get_hero_usecase(client: SupabaseClient = Depends(get_supabase_client)) -> HeroUseCase:
+def get_hero_usecase(client: PostgrestClient = Depends(get_supabase_client)) -> HeroUseCase:
     """HeroUseCase取得（DI）"""
-    repository = SupabaseHeroRepository(client)
+    repository = _with_snapshot(SupabaseHeroRepository(client), SnapshotHeroRepository)
+    repository = _with_cache(repository, CachedHeroRepository, "hero")
     return HeroUseCase(repository)
 
 
-def get_contact_usecase(client: SupabaseClient = Depends(get_supabase_client)) -> ContactUseCase:
+def get_contact_usecase(client: PostgrestClient = Depends(get_supabase_client)) -> ContactUseCase:
     """ContactUseCase取得（DI）"""
     repository = SupabaseContactRepository(client)
-    return ContactUseCase(repository)
+    guard = contact_guard if settings.CONTACT_RATE_LIMIT_ENABLED else None
+    return ContactUseCase(repository, guard=guard)
+
+
+def get_portfolio_usecase(client: PostgrestClient = Depends(get_supabase_client)) -> PortfolioUseCase:
+    """PortfolioUseCase取得（DI、各セクションは個別APIと同じキャッシュを共有）"""
+    return PortfolioUseCase(
+        hero=get_hero_usecase(client),
+        skill=get_skill_usecase(client),
+        work=get_work_usecase(client),
+        about=get_about_usecase(client),
+    )
@@ -2,6 +2,9 @@ from pydantic import BaseModel
 from typing import Optional
 from datetime import date
 
+from app.domain.entity.read_model import ReadModelSchema, read_model
+from app.domain.entity.response import DegradableResponse
+
 
 class About(BaseModel):
     id: int
@@ -12,7 +15,7 @@ class About(BaseModel):
     bio: str
 
 
-class Education(BaseModel):
+class Education(ReadModelSchema):
     id: int
     about_id: Optional[int] = None
     institution: str
@@ -23,7 +26,11 @@ class Education(BaseModel):
     description: Optional[str] = None
 
 
-class Experience(BaseModel):
+# リポジトリが返す学歴（検証済み・__slots__）
+EducationRecord = read_model(Education)
+
+
+class Experience(ReadModelSchema):
     id: int
     about_id: Optional[int] = None
     company: str
@@ -34,6 +41,10 @@ class Experience(BaseModel):
     achievements: Optional[list[str]] = None
 
 
+# リポジトリが返す職歴（検証済み・__slots__）
+ExperienceRecord = read_model(Experience)
+
+
 class SocialMedia(BaseModel):
     id: int
     about_id: Optional[int] = None
@@ -42,7 +53,8 @@ class SocialMedia(BaseModel):
     username: Optional[str] = None
 
 
-class AboutResponse(BaseModel):
+class AboutResponse(DegradableResponse):
+    """プロフィール全体（学歴・職歴・SNSの取得に失敗した場合は空で補い、degraded になる）"""
     about: About
     education: list[Education]
     experience: list[Experience]
@@ -0,0 +1,10 @@
+from pydantic import BaseModel, conlist
+
+
+class CacheInvalidationRequest(BaseModel):
+    # "*" / "works" / "works:<id>" など
+    targets: conlist(str, min_items=1, max_items=100)
+
+
+class CacheInvalidationResponse(BaseModel):
+    invalidated: list[str]
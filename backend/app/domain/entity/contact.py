@@ -10,3 +10,14 @@ class ContactRequest(BaseModel):
 class ContactResponse(BaseModel):
     success: bool
     message: str
+
+
+class IntakeDecision(BaseModel):
+    """お問い合わせ受付可否の判定結果"""
+    allowed: bool
+    duplicate: bool = False
+    retry_after: int = 0
+    fingerprint: str | None = None
+    # 受付に失敗したときにトークンを戻す先
+    client_ip: str | None = None
+    email_key: str | None = None
@@ -1,15 +1,21 @@
 from pydantic import BaseModel
 from typing import Optional
 
+from app.domain.entity.read_model import ReadModelSchema, read_model
+
 
 class HeroIntroduction(BaseModel):
     id: str
     content: str
 
 
-class TimelineItem(BaseModel):
+class TimelineItem(ReadModelSchema):
     id: str
     period: str
     title: str
     subtitle: Optional[str] = None
     sort_order: int
+
+
+# リポジトリが返すタイムライン項目（検証済み・__slots__）
+TimelineItemRecord = read_model(TimelineItem)
@@ -0,0 +1,20 @@
+from typing import Optional
+
+from app.domain.entity.about import AboutResponse
+from app.domain.entity.hero import HeroIntroduction, TimelineItem
+from app.domain.entity.response import DegradableResponse
+from app.domain.entity.skill import Skill
+from app.domain.entity.work import Work
+
+# まとめて取得できるセクション（fields で指定する名前）
+PORTFOLIO_SECTIONS = ("introduction", "timeline", "skills", "skill_categories", "works", "about")
+
+
+class PortfolioResponse(DegradableResponse):
+    """トップページ初回表示用のまとめ取得結果（fields 指定時は指定したセクションのみ）"""
+    introduction: Optional[HeroIntroduction] = None
+    timeline: Optional[list[TimelineItem]] = None
+    skills: Optional[list[Skill]] = None
+    skill_categories: Optional[list[str]] = None
+    works: Optional[list[Work]] = None
+    about: Optional[AboutResponse] = None
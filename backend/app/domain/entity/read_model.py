@@ -0,0 +1,66 @@
+import dataclasses
+from typing import Any, ClassVar
+
+from pydantic import BaseModel, validate_model
+
+
+class ReadModelSchema(BaseModel):
+    """
+    読み取りモデル（__slots__ 付き dataclass）を持つエンティティの基底クラス
+
+    API のスキーマ・入力検証は従来どおり pydantic モデルで行い、リポジトリから
+    読み出した行は read_model() で作った軽量な読み取りモデルとして保持する。
+    このクラスを型に持つフィールド（response_model を含む）は、読み取りモデルを
+    再検証せずにそのまま受け入れる。
+    """
+
+    __read_model__: ClassVar[type | None] = None
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls._validate_or_trust
+
+    @classmethod
+    def _validate_or_trust(cls, value: Any) -> Any:
+        if cls.__read_model__ is not None and isinstance(value, cls.__read_model__):
+            return value
+        return cls.validate(value)
+
+
+def read_model(schema: type[ReadModelSchema]) -> type:
+    """
+    pydantic モデルと同じ項目を持つ、__slots__ 付きの読み取り専用 dataclass を作る
+
+    インスタンスごとの __dict__ / __fields_set__ を持たないためメモリが小さい。
+    検証は from_row() で1回だけ行う（キャッシュに入れる時点）。orjson は dataclass を
+    直接エンコードでき、jsonable_encoder も dataclass を辞書として扱う。
+    """
+    names = tuple(schema.__fields__)
+    cls = dataclasses.make_dataclass(
+        f"{schema.__name__}Record",
+        [(name, field.outer_type_) for name, field in schema.__fields__.items()],
+        namespace={
+            "schema": schema,
+            "_names": names,
+            "from_row": classmethod(_from_row),
+            "dict": _as_dict,
+            "__doc__": f"{schema.__name__} の読み取りモデル（検証済みの行）",
+        },
+        slots=True,
+        frozen=True,
+    )
+    cls.__module__ = schema.__module__
+    schema.__read_model__ = cls
+    return cls
+
+
+def _from_row(cls, row: dict) -> Any:
+    """行を schema で検証して読み取りモデルにする（検証エラーは ValidationError）"""
+    values, _, error = validate_model(cls.schema, row)
+    if error:
+        raise error
+    return cls(**values)
+
+
+def _as_dict(self) -> dict[str, Any]:
+    return {name: getattr(self, name) for name in self._names}
@@ -0,0 +1,25 @@
+from pydantic import BaseModel, PrivateAttr
+
+
+class DegradableResponse(BaseModel):
+    """
+    一部の取得に失敗し、欠けた項目を空で補うことのあるレスポンス
+
+    補った結果は mark_degraded() で印を付ける。印はスキーマ・JSONには出ず、
+    スナップショットやHTTPキャッシュに保存しないかの判断にだけ使う。
+    """
+
+    _degraded: bool = PrivateAttr(default=False)
+
+    @property
+    def degraded(self) -> bool:
+        return self._degraded
+
+    def mark_degraded(self) -> "DegradableResponse":
+        self._degraded = True
+        return self
+
+
+def is_degraded(content: object) -> bool:
+    """一部の取得に失敗して補った結果か"""
+    return isinstance(content, DegradableResponse) and content.degraded
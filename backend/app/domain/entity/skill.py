@@ -1,11 +1,16 @@
-from pydantic import BaseModel
 from typing import Optional
 
+from app.domain.entity.read_model import ReadModelSchema, read_model
 
-class Skill(BaseModel):
+
+class Skill(ReadModelSchema):
     id: int
     name: str
     level: int
     category: str
     icon: Optional[str] = None
     description: Optional[str] = None
+
+
+# リポジトリが返すスキル（検証済み・__slots__）
+SkillRecord = read_model(Skill)
@@ -1,8 +1,10 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, conlist, create_model
 from typing import Optional
 
+from app.domain.entity.read_model import ReadModelSchema, read_model
 
-class Work(BaseModel):
+
+class Work(ReadModelSchema):
     id: str
     title: str
     description: str
@@ -17,3 +19,61 @@ class Work(BaseModel):
     duration: Optional[str] = None
     role: Optional[str] = None
     learnings: Optional[str] = None
+
+
+# リポジトリが返す作品（検証済み・__slots__）
+WorkRecord = read_model(Work)
+
+# fields 指定時の作品（指定した項目だけを返すため、すべて省略可能）
+WorkProjection = create_model(
+    "WorkProjection",
+    **{name: (Optional[field.outer_type_], None) for name, field in Work.__fields__.items()},
+)
+
+
+def project_work(row: dict, fields: list[str]) -> dict:
+    """行から指定した項目だけを取り出す（Work と同じ型で検証する）"""
+    return WorkProjection.parse_obj({field: row.get(field) for field in fields}).dict(include=set(fields))
+
+
+class InvalidCursorError(ValueError):
+    """作品一覧のカーソルが不正（クライアントの指定の誤り）"""
+
+
+class WorkQuery(BaseModel):
+    """作品一覧の取得条件"""
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
+    fields: Optional[list[str]] = None
+    category: Optional[str] = None
+    technology: Optional[str] = None
+
+
+class WorkPage(BaseModel):
+    """作品一覧の1ページ（fields 指定時は items が部分的な辞書になる）"""
+    items: list[dict]
+    next_cursor: Optional[str] = None
+
+
+class WorkBatchRequest(BaseModel):
+    """作品の一括取得リクエスト"""
+    ids: conlist(str, min_items=1, max_items=100)
+
+
+class WorkBatchResponse(BaseModel):
+    """作品の一括取得結果（works はリクエストの順序を保つ）"""
+    works: list[Work]
+    missing_ids: list[str]
+
+
+class WorkSearchHit(BaseModel):
+    """作品の検索結果1件（score は BM25 の関連度）"""
+    work: Work
+    score: float
+
+
+class WorkSearchResponse(BaseModel):
+    """作品の検索結果（total は一致した全件数、hits は関連度順の上位）"""
+    query: str
+    total: int
+    hits: list[WorkSearchHit]
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from app.domain.entity.about import About, Education, Experience, SocialMedia
+from app.domain.entity.about import About, AboutResponse, EducationRecord, ExperienceRecord, SocialMedia
 
 
 class IAboutRepository(ABC):
@@ -9,12 +9,12 @@ class IAboutRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_education(self) -> list[Education]:
+    async def get_education(self) -> list[EducationRecord]:
         """学歴取得"""
         pass
 
     @abstractmethod
-    async def get_experience(self) -> list[Experience]:
+    async def get_experience(self) -> list[ExperienceRecord]:
         """職歴取得"""
         pass
 
@@ -22,3 +22,7 @@ class IAboutRepository(ABC):
     async def get_social_media(self) -> list[SocialMedia]:
         """ソーシャルメディア取得"""
         pass
+
+    async def get_about_aggregate(self) -> AboutResponse | None:
+        """自己紹介・学歴・職歴・SNSを1回の問い合わせで取得（任意実装）"""
+        raise NotImplementedError
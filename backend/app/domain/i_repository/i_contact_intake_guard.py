@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from app.domain.entity.contact import ContactRequest, IntakeDecision
+
+
+class IContactIntakeGuard(ABC):
+    @abstractmethod
+    def check(self, client_ip: str, contact: ContactRequest) -> IntakeDecision:
+        """受付可否判定（流量制限・重複判定）"""
+        pass
+
+    @abstractmethod
+    def release(self, decision: IntakeDecision) -> None:
+        """受付に失敗した送信の判定取り消し"""
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from app.domain.entity.hero import HeroIntroduction, TimelineItem
+from app.domain.entity.hero import HeroIntroduction, TimelineItemRecord
 
 
 class IHeroRepository(ABC):
@@ -9,6 +9,6 @@ class IHeroRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_timeline(self) -> list[TimelineItem]:
+    async def get_timeline(self) -> list[TimelineItemRecord]:
         """タイムライン取得"""
         pass
@@ -1,15 +1,15 @@
 from abc import ABC, abstractmethod
-from app.domain.entity.skill import Skill
+from app.domain.entity.skill import SkillRecord
 
 
 class ISkillRepository(ABC):
     @abstractmethod
-    async def find_all(self) -> list[Skill]:
+    async def find_all(self) -> list[SkillRecord]:
         """全スキル取得"""
         pass
 
     @abstractmethod
-    async def find_by_category(self, category: str) -> list[Skill]:
+    async def find_by_category(self, category: str) -> list[SkillRecord]:
         """カテゴリ別スキル取得"""
         pass
 
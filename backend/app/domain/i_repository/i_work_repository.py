@@ -1,14 +1,24 @@
 from abc import ABC, abstractmethod
-from app.domain.entity.work import Work
+from app.domain.entity.work import WorkPage, WorkQuery, WorkRecord
 
 
 class IWorkRepository(ABC):
     @abstractmethod
-    async def find_all(self) -> list[Work]:
+    async def find_all(self) -> list[WorkRecord]:
         """全作品取得"""
         pass
 
     @abstractmethod
-    async def find_by_id(self, work_id: str) -> Work | None:
+    async def find_by_id(self, work_id: str) -> WorkRecord | None:
         """作品詳細取得"""
         pass
+
+    @abstractmethod
+    async def find_by_ids(self, work_ids: list[str]) -> list[WorkRecord]:
+        """複数作品の一括取得（順序は問わない）"""
+        pass
+
+    @abstractmethod
+    async def find_page(self, query: WorkQuery) -> WorkPage:
+        """条件付き作品一覧取得（カーソルページング・項目指定・絞り込み）"""
+        pass
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from app.domain.entity.work import WorkRecord, WorkSearchResponse
+
+
+class IWorkSearchIndex(ABC):
+    @abstractmethod
+    async def refresh(self, works: list[WorkRecord]) -> None:
+        """索引を作品一覧に合わせる（変わった作品だけ索引し直す）"""
+        pass
+
+    @abstractmethod
+    def search(self, query: str, limit: int) -> WorkSearchResponse:
+        """関連度順の検索"""
+        pass
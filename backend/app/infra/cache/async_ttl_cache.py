@@ -0,0 +1,206 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable
+
+from app.infra.resilience import UpstreamUnavailableError
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class _Entry:
+    value: Any
+    fresh_until: float
+    stale_until: float
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    loads: int = 0
+    load_errors: int = 0
+    refreshes: int = 0
+    evictions: int = 0
+    fallbacks: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / total if total else 0.0
+
+
+class AsyncTTLCache:
+    """
+    非同期ローダー向けのTTL付きLRUキャッシュ
+
+    - ttl 秒までは新鮮なエントリとしてそのまま返す
+    - その後 stale_ttl 秒までは古い値を返しつつ、裏で1回だけ再取得する
+    - 未キャッシュのキーへの同時アクセスは1回の取得にまとめる（single-flight）
+    - max_entries を超えたら最も使われていないキーから追い出す
+    - fallback_on_outage のとき、上流を利用できない（UpstreamUnavailableError）間は
+      期限切れのエントリも返す（期限切れのエントリは取得に成功するまで残す）
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        stale_ttl: float = 0.0,
+        max_entries: int = 256,
+        fallback_on_outage: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.fallback_on_outage = fallback_on_outage
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        # invalidate() 前に始まった取得結果を保存しないための世代番号
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_load(
+        self, key: Hashable, loader: Loader, cacheable: Callable[[Any], bool] | None = None
+    ) -> Any:
+        """キャッシュから取得し、無ければ loader で取得して保存する（cacheable が偽を返す値は保存しない）"""
+        now = self._clock()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if now < entry.fresh_until:
+                self.stats.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if now < entry.stale_until:
+                self.stats.stale_hits += 1
+                self._entries.move_to_end(key)
+                if key not in self._inflight:
+                    self.stats.refreshes += 1
+                    self._start_load(key, loader, cacheable)
+                return entry.value
+            if not self.fallback_on_outage:
+                del self._entries[key]
+                entry = None
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.stats.misses += 1
+            task = self._start_load(key, loader, cacheable)
+        else:
+            self.stats.coalesced += 1
+        try:
+            # 呼び出し元のキャンセルで共有の取得処理を止めない
+            return await asyncio.shield(task)
+        except UpstreamUnavailableError as e:
+            if entry is None:
+                raise
+            self.stats.fallbacks += 1
+            logger.warning(f"Serving expired cache entry ({self.name}:{key}) while upstream is unavailable: {e}")
+            return entry.value
+
+    def lookup(self, key: Hashable) -> tuple[bool, Any]:
+        """取得処理を行わずに参照する（期限内のエントリのみ。ヒット/ミスは集計する）"""
+        entry = self._entries.get(key)
+        if entry is None or self._clock() >= entry.fresh_until:
+            self.stats.misses += 1
+            return False, None
+        self.stats.hits += 1
+        self._entries.move_to_end(key)
+        return True, entry.value
+
+    def peek(self, key: Hashable) -> Any:
+        """期限切れでも保持している値を返す（無ければ KeyError）"""
+        return self._entries[key].value
+
+    @property
+    def generation(self) -> int:
+        """破棄のたびに進む世代番号（取得前に控え、set_if_generation に渡す）"""
+        return self._generation
+
+    def set_if_generation(self, key: Hashable, value: Any, generation: int) -> bool:
+        """取得を始めてから破棄が無かったときだけ保存する（破棄前の古い値を戻さない）"""
+        if generation != self._generation:
+            return False
+        self.set(key, value)
+        return True
+
+    def set(self, key: Hashable, value: Any) -> None:
+        now = self._clock()
+        self._entries[key] = _Entry(value, now + self.ttl, now + self.ttl + self.stale_ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """キー単位、または key=None で全エントリを破棄"""
+        self._generation += 1
+        if key is None:
+            self._entries.clear()
+            self._inflight.clear()
+        else:
+            self._entries.pop(key, None)
+            self._inflight.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """predicate が真になるキーをすべて破棄"""
+        self._generation += 1
+        for key in [k for k in self._entries if predicate(k)]:
+            del self._entries[key]
+        for key in [k for k in self._inflight if predicate(k)]:
+            del self._inflight[key]
+
+    def _start_load(self, key: Hashable, loader: Loader, cacheable: Callable[[Any], bool] | None = None) -> asyncio.Task:
+        task = asyncio.ensure_future(self._load(key, loader, self._generation, cacheable))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._on_load_done(key, done))
+        return task
+
+    def _on_load_done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 誰も待っていない裏の再取得でも例外を回収しておく
+        if not task.cancelled() and task.exception() is not None and key in self._entries:
+            logger.warning(f"Background refresh failed ({self.name}:{key}), keeping stale value: {task.exception()!r}")
+
+    async def _load(
+        self, key: Hashable, loader: Loader, generation: int, cacheable: Callable[[Any], bool] | None = None
+    ) -> Any:
+        self.stats.loads += 1
+        try:
+            value = await loader()
+        except Exception as e:
+            self.stats.load_errors += 1
+            logger.debug(f"Cache load failed ({self.name}:{key}): {e!r}")
+            raise
+        if cacheable is None or cacheable(value):
+            self.set_if_generation(key, value, generation)
+        return value
+
+    def snapshot_stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.stats.hits,
+            "stale_hits": self.stats.stale_hits,
+            "misses": self.stats.misses,
+            "coalesced": self.stats.coalesced,
+            "loads": self.stats.loads,
+            "load_errors": self.stats.load_errors,
+            "refreshes": self.stats.refreshes,
+            "evictions": self.stats.evictions,
+            "fallbacks": self.stats.fallbacks,
+            "hit_ratio": round(self.stats.hit_ratio, 4),
+        }
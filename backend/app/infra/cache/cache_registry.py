@@ -0,0 +1,126 @@
+import logging
+from typing import Any, Callable
+
+from app.core.config import settings
+from app.infra.cache.async_ttl_cache import AsyncTTLCache
+
+logger = logging.getLogger(__name__)
+
+# (namespace, key) -> None。key が None のときは名前空間全体の破棄
+InvalidationListener = Callable[[str, str | None], None]
+
+
+def namespace_ttl(namespace: str) -> float:
+    """名前空間ごとのTTL取得（"works:snapshot" のような派生キャッシュは親と同じ）"""
+    ttls = {
+        "works": settings.CACHE_TTL_WORKS,
+        "skills": settings.CACHE_TTL_SKILLS,
+        "about": settings.CACHE_TTL_ABOUT,
+        "hero": settings.CACHE_TTL_HERO,
+    }
+    # 複数の名前空間をまとめたキャッシュは、最も短いTTLに合わせる
+    ttls["portfolio"] = min(ttls.values())
+    return ttls.get(namespace.split(":", 1)[0], settings.CACHE_TTL_WORKS)
+
+
+class CacheRegistry:
+    """
+    名前空間（works / skills / about / hero）ごとのキャッシュをプロセス内で共有する
+
+    "works:snapshot" のように ":" で区切った名前は親名前空間の派生キャッシュとみなし、
+    親が破棄されたときはキー指定の有無にかかわらず全体を破棄する。
+    複数の名前空間から作るキャッシュ（portfolio）は add_dependency() で登録し、
+    いずれかの名前空間が破棄されたときに全体を破棄する。
+    """
+
+    def __init__(self):
+        self._caches: dict[str, AsyncTTLCache] = {}
+        self._listeners: list[InvalidationListener] = []
+        # 名前空間 -> その名前空間に依存する名前空間
+        self._dependents: dict[str, set[str]] = {}
+
+    def cache(self, name: str, ttl: float | None = None) -> AsyncTTLCache:
+        """キャッシュ取得（初回のみ生成）"""
+        cache = self._caches.get(name)
+        if cache is None:
+            cache = AsyncTTLCache(
+                name,
+                ttl=namespace_ttl(name) if ttl is None else ttl,
+                stale_ttl=settings.CACHE_STALE_TTL,
+                max_entries=settings.CACHE_MAX_ENTRIES,
+                fallback_on_outage=settings.CACHE_FALLBACK_ON_OUTAGE,
+            )
+            self._caches[name] = cache
+        return cache
+
+    def namespaces(self) -> list[str]:
+        """派生キャッシュを除いた名前空間一覧"""
+        return sorted({name.split(":", 1)[0] for name in self._caches})
+
+    def add_listener(self, listener: InvalidationListener) -> None:
+        """キャッシュ破棄の通知先を登録"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: InvalidationListener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def add_dependency(self, namespace: str, sources: tuple[str, ...]) -> None:
+        """namespace のキャッシュを sources のいずれかの破棄に合わせて破棄する"""
+        for source in sources:
+            self._dependents.setdefault(source, set()).add(namespace)
+
+    def invalidate(self, namespace: str | None = None, key: str | None = None, notify: bool = True) -> None:
+        """
+        名前空間またはキー単位でキャッシュを破棄（namespace=None で全破棄）
+
+        notify=False は自ワーカー内だけの破棄（各ワーカーが自分で同じ破棄を行う場合）。
+        """
+        targets = [namespace] if namespace else self.namespaces()
+        for name in targets:
+            cache = self._caches.get(name)
+            if cache is not None:
+                cache.invalidate(key)
+            self._invalidate_derived(name)
+            if notify:
+                self._notify(name, key)
+
+    def invalidate_entity(self, namespace: str, entity_id: str) -> None:
+        """
+        1件のエンティティに関わるキャッシュを破棄
+
+        "id:<entity_id>" のエントリと、一覧など "id:" 以外のキーのエントリを破棄し、
+        他のIDのエントリは残す。派生キャッシュは全体を破棄する。
+        """
+        key = f"id:{entity_id}"
+        cache = self._caches.get(namespace)
+        if cache is not None:
+            cache.invalidate_where(lambda k: k == key or not str(k).startswith("id:"))
+        self._invalidate_derived(namespace)
+        self._notify(namespace, key)
+
+    def _invalidate_derived(self, namespace: str) -> None:
+        for derived_name, derived in self._caches.items():
+            if derived_name.startswith(f"{namespace}:"):
+                derived.invalidate()
+        # 依存する名前空間は各ワーカーが親の破棄から導けるため、通知はしない
+        for dependent in self._dependents.get(namespace, ()):
+            cache = self._caches.get(dependent)
+            if cache is not None:
+                cache.invalidate()
+            self._invalidate_derived(dependent)
+
+    def _notify(self, namespace: str, key: str | None) -> None:
+        for listener in self._listeners:
+            try:
+                listener(namespace, key)
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener failed: {e!r}")
+
+    def stats(self) -> dict[str, Any]:
+        return {name: cache.snapshot_stats() for name, cache in self._caches.items()}
+
+
+cache_registry = CacheRegistry()
+# GET /portfolio は全名前空間の内容をまとめたスナップショット
+cache_registry.add_dependency("portfolio", ("works", "skills", "about", "hero"))
@@ -0,0 +1,195 @@
+import asyncio
+import itertools
+import json
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable
+from urllib.parse import urlencode
+
+from app.core.config import settings
+from app.infra.cache.cache_registry import cache_registry
+from app.infra.cache.invalidation import TABLE_NAMESPACES, invalidate_table_change
+
+logger = logging.getLogger(__name__)
+
+# 購読開始（再接続を含む）を表すイベント種別
+SUBSCRIBED = "SUBSCRIBED"
+
+
+@dataclass
+class ChangeEvent:
+    table: str
+    type: str
+    record_id: str | None = None
+
+
+class ChangeSource(ABC):
+    """テーブル変更通知の取得元"""
+
+    @abstractmethod
+    def events(self) -> AsyncIterator[ChangeEvent]:
+        """
+        変更通知を順に返す
+
+        購読が確立したら最初に type=SUBSCRIBED のイベントを返す。接続が切れたら例外で終える。
+        """
+
+
+class QueueChangeSource(ChangeSource):
+    """プロセス内のキューから変更通知を流す（ローカル検証用）"""
+
+    def __init__(self):
+        self._queue: asyncio.Queue[ChangeEvent | Exception] = asyncio.Queue()
+
+    def push(self, table: str, type: str = "UPDATE", record_id: str | None = None) -> None:
+        self._queue.put_nowait(ChangeEvent(table, type, record_id))
+
+    def disconnect(self, error: Exception | None = None) -> None:
+        """接続断を模擬する"""
+        self._queue.put_nowait(error or ConnectionError("fake change source disconnected"))
+
+    async def events(self) -> AsyncIterator[ChangeEvent]:
+        yield ChangeEvent("*", SUBSCRIBED)
+        while True:
+            item = await self._queue.get()
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+
+class SupabaseRealtimeSource(ChangeSource):
+    """
+    Supabase Realtime（postgres_changes）の購読
+
+    Phoenixチャネルのプロトコルで public スキーマの対象テーブルを購読する。
+    websockets は supabase（realtime）の依存として入るものを使う。
+    """
+
+    def __init__(self, url: str, api_key: str, tables: list[str], heartbeat_interval: float = 25.0):
+        self.url = url
+        self.api_key = api_key
+        self.tables = tables
+        self.heartbeat_interval = heartbeat_interval
+        self._refs = itertools.count(1)
+
+    @classmethod
+    def from_settings(cls) -> "SupabaseRealtimeSource":
+        url = settings.CHANGE_FEED_URL
+        if not url:
+            base = settings.SUPABASE_URL.rstrip("/").replace("https://", "wss://").replace("http://", "ws://")
+            url = f"{base}/realtime/v1/websocket?" + urlencode({"apikey": settings.SUPABASE_KEY, "vsn": "1.0.0"})
+        return cls(url, settings.SUPABASE_KEY, sorted(TABLE_NAMESPACES))
+
+    def _message(self, topic: str, event: str, payload: dict) -> tuple[str, str]:
+        ref = str(next(self._refs))
+        return ref, json.dumps({"topic": topic, "event": event, "payload": payload, "ref": ref})
+
+    async def _heartbeat(self, ws) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            await ws.send(self._message("phoenix", "heartbeat", {})[1])
+
+    async def events(self) -> AsyncIterator[ChangeEvent]:
+        import websockets
+
+        topic = "realtime:portfolio-cache"
+        join_ref, join = self._message(topic, "phx_join", {
+            "config": {
+                "broadcast": {"self": False},
+                "presence": {"key": ""},
+                "postgres_changes": [{"event": "*", "schema": "public", "table": t} for t in self.tables],
+            },
+            "access_token": self.api_key,
+        })
+        async with websockets.connect(self.url) as ws:
+            await ws.send(join)
+            heartbeat = asyncio.create_task(self._heartbeat(ws))
+            try:
+                async for raw in ws:
+                    message = json.loads(raw)
+                    event = message.get("event")
+                    payload = message.get("payload") or {}
+                    if event == "phx_reply" and message.get("ref") == join_ref:
+                        if payload.get("status") != "ok":
+                            raise ConnectionError(f"Realtime join failed: {payload.get('response')}")
+                        yield ChangeEvent("*", SUBSCRIBED)
+                    elif event in ("phx_error", "phx_close") and message.get("topic") == topic:
+                        raise ConnectionError(f"Realtime channel closed: {event}")
+                    elif event == "postgres_changes":
+                        data = payload.get("data") or {}
+                        record = data.get("record") or data.get("old_record") or {}
+                        record_id = record.get("id")
+                        yield ChangeEvent(data.get("table", ""), data.get("type", ""), None if record_id is None else str(record_id))
+            finally:
+                heartbeat.cancel()
+        raise ConnectionError("Realtime connection closed")
+
+
+class ChangeFeedListener:
+    """
+    変更通知を受けてキャッシュを破棄する
+
+    接続が切れたら指数バックオフで再接続する。切断中の通知は失われるため、
+    再購読できた時点でキャッシュ全体を破棄する。
+    """
+
+    def __init__(
+        self,
+        source: ChangeSource,
+        on_change: Callable[[str, str | None], str | None] = invalidate_table_change,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 60.0,
+    ):
+        self.source = source
+        self.on_change = on_change
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.subscriptions = 0
+        self.events_handled = 0
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def handle(self, event: ChangeEvent) -> None:
+        if event.type == SUBSCRIBED:
+            self.subscriptions += 1
+            if self.subscriptions > 1:
+                logger.info("Change feed resubscribed, invalidating all caches")
+                cache_registry.invalidate()
+            return
+        target = self.on_change(event.table, event.record_id)
+        self.events_handled += 1
+        logger.debug(f"Change feed {event.type} on {event.table} -> invalidated {target}")
+
+    async def _run(self) -> None:
+        delay = self.reconnect_delay
+        while True:
+            try:
+                async for event in self.source.events():
+                    self.handle(event)
+                    delay = self.reconnect_delay
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Change feed disconnected, reconnecting in {delay:.1f}s: {e!r}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+
+def build_change_feed() -> ChangeFeedListener | None:
+    """CHANGE_FEED_ENABLED のとき Supabase Realtime のリスナーを作る"""
+    if not settings.CHANGE_FEED_ENABLED:
+        return None
+    return ChangeFeedListener(
+        SupabaseRealtimeSource.from_settings(),
+        reconnect_delay=settings.CHANGE_FEED_RECONNECT_DELAY,
+    )
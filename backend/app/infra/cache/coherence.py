@@ -0,0 +1,158 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+import anyio.to_thread
+from anyio import CapacityLimiter
+
+from app.core.config import settings
+from app.infra.cache.cache_registry import CacheRegistry, cache_registry
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteInvalidationBus:
+    """
+    同一ホストの複数ワーカー間でキャッシュ破棄を共有する
+
+    自ワーカーで起きた破棄を共有のSQLiteファイルに追記し、他ワーカーが追記した
+    破棄を poll_interval 秒ごとに読み出して自ワーカーのキャッシュにも適用する。
+    """
+
+    def __init__(
+        self,
+        path: str,
+        registry: CacheRegistry = cache_registry,
+        poll_interval: float = 0.5,
+        retention: float = 3600.0,
+    ):
+        self.path = path
+        self.registry = registry
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.published = 0
+        self.applied = 0
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._last_seq = 0
+        self._outgoing: list[tuple[str, str | None]] = []
+        self._applying = False
+        self._task: asyncio.Task | None = None
+        self._limiter: CapacityLimiter | None = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_invalidations (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    origin TEXT NOT NULL,
+                    namespace TEXT NOT NULL,
+                    key TEXT,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn = conn
+        return self._conn
+
+    def _on_invalidate(self, namespace: str, key: str | None) -> None:
+        # 他ワーカーから受け取った破棄を適用している間は再送しない
+        if not self._applying:
+            self._outgoing.append((namespace, key))
+
+    def _sync(self, outgoing: list[tuple[str, str | None]]) -> list[tuple[str, str | None]]:
+        """未送信の破棄を書き込み、他ワーカーの新しい破棄を読み出す"""
+        with self._lock:
+            conn = self._connection()
+            now = time.time()
+            if outgoing:
+                conn.executemany(
+                    "INSERT INTO cache_invalidations (origin, namespace, key, created_at) VALUES (?, ?, ?, ?)",
+                    [(self.worker_id, namespace, key, now) for namespace, key in outgoing],
+                )
+            rows = conn.execute(
+                "SELECT seq, origin, namespace, key FROM cache_invalidations WHERE seq > ? ORDER BY seq",
+                (self._last_seq,),
+            ).fetchall()
+            if rows:
+                self._last_seq = rows[-1][0]
+            conn.execute("DELETE FROM cache_invalidations WHERE created_at < ?", (now - self.retention,))
+        return [(namespace, key) for _, origin, namespace, key in rows if origin != self.worker_id]
+
+    def _apply(self, namespace: str, key: str | None) -> None:
+        self._applying = True
+        try:
+            if key is not None and key.startswith("id:"):
+                self.registry.invalidate_entity(namespace, key[3:])
+            else:
+                self.registry.invalidate(namespace, key)
+        finally:
+            self._applying = False
+        self.applied += 1
+
+    async def _run_sync(self, outgoing):
+        return await anyio.to_thread.run_sync(self._sync, outgoing, limiter=self._limiter)
+
+    async def start(self) -> None:
+        """起動以前の破棄は読み飛ばし、以降の破棄の送受信を始める"""
+        if self._task is not None:
+            return
+        self._limiter = CapacityLimiter(1)
+
+        def latest_seq() -> int:
+            with self._lock:
+                return self._connection().execute("SELECT COALESCE(MAX(seq), 0) FROM cache_invalidations").fetchone()[0]
+
+        self._last_seq = await anyio.to_thread.run_sync(latest_seq, limiter=self._limiter)
+        self.registry.add_listener(self._on_invalidate)
+        self._task = asyncio.create_task(self._poll())
+
+    async def _poll(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            await self.flush()
+
+    async def flush(self) -> None:
+        outgoing, self._outgoing = self._outgoing, []
+        try:
+            incoming = await self._run_sync(outgoing)
+        except Exception as e:
+            # 共有ファイルが一時的に使えなくても次回に持ち越す
+            self._outgoing[:0] = outgoing
+            logger.warning(f"Cache coherence sync failed: {e!r}")
+            return
+        self.published += len(outgoing)
+        for namespace, key in incoming:
+            self._apply(namespace, key)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self.registry.remove_listener(self._on_invalidate)
+        # 終了直前の破棄も他ワーカーに届ける
+        await self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def build_invalidation_bus() -> SQLiteInvalidationBus | None:
+    """CACHE_COHERENCE_PATH が設定されているときワーカー間の破棄共有を有効にする"""
+    if not settings.CACHE_COHERENCE_PATH:
+        return None
+    return SQLiteInvalidationBus(settings.CACHE_COHERENCE_PATH, poll_interval=settings.CACHE_COHERENCE_POLL_INTERVAL)
@@ -0,0 +1,55 @@
+from app.infra.cache.cache_registry import CacheRegistry, cache_registry
+
+# キャッシュの名前空間
+NAMESPACES = ("works", "skills", "about", "hero")
+
+# Supabaseのテーブル -> そのテーブルの内容を含むキャッシュの名前空間
+TABLE_NAMESPACES = {
+    "works": "works",
+    "skills": "skills",
+    "about": "about",
+    "education": "about",
+    "experience": "about",
+    "social_media": "about",
+    "hero_introduction": "hero",
+    "timeline_items": "hero",
+}
+
+
+def parse_target(target: str) -> tuple[str | None, str | None]:
+    """
+    破棄対象の指定を (名前空間, ID) に分解する
+
+    "*" は全体、"works" は名前空間全体、"works:<id>" は1件。不正な指定は ValueError。
+    """
+    target = target.strip()
+    if target == "*":
+        return None, None
+    namespace, _, entity_id = target.partition(":")
+    if namespace not in NAMESPACES:
+        raise ValueError(f"Unknown cache namespace: {namespace}")
+    return namespace, entity_id or None
+
+
+def invalidate_target(target: str, registry: CacheRegistry = cache_registry) -> None:
+    """parse_target() 形式の指定でキャッシュを破棄"""
+    namespace, entity_id = parse_target(target)
+    if entity_id is None:
+        registry.invalidate(namespace)
+    else:
+        registry.invalidate_entity(namespace, entity_id)
+
+
+def invalidate_table_change(table: str, record_id: str | None = None, registry: CacheRegistry = cache_registry) -> str | None:
+    """
+    テーブルの変更に対応するキャッシュを破棄し、破棄対象を返す（対象外のテーブルは None）
+
+    works は作品ID単位で破棄できる。その他のテーブルは一覧や集約（カテゴリ・/about）に
+    影響するため名前空間全体を破棄する。
+    """
+    namespace = TABLE_NAMESPACES.get(table)
+    if namespace is None:
+        return None
+    target = f"{namespace}:{record_id}" if table == "works" and record_id else namespace
+    invalidate_target(target, registry)
+    return target
@@ -0,0 +1,87 @@
+import hashlib
+import math
+from typing import Any
+
+from app.core.config import settings
+from app.domain.entity.contact import ContactRequest, IntakeDecision
+from app.domain.i_repository.i_contact_intake_guard import IContactIntakeGuard
+from app.infra.ratelimit.token_bucket import DedupWindow, TokenBucketLimiter
+
+
+class ContactIntakeGuard(IContactIntakeGuard):
+    """
+    お問い合わせ受付前の流量制限と重複排除
+
+    IPごと・メールアドレスごとのトークンバケットと、同一内容の再送信を
+    判定する時間窓を組み合わせる。メモリ上の判定のみで、送信キューや
+    Supabaseには触れない。
+    """
+
+    def __init__(self, ip_limiter: TokenBucketLimiter, email_limiter: TokenBucketLimiter, dedup: DedupWindow):
+        self.ip_limiter = ip_limiter
+        self.email_limiter = email_limiter
+        self.dedup = dedup
+        self.rejected = 0
+        self.duplicates = 0
+
+    @staticmethod
+    def fingerprint(contact: ContactRequest) -> str:
+        """送信内容のハッシュ（空白と大文字小文字の違いは同一とみなす）"""
+        normalized = "\x00".join(
+            " ".join(part.split()).lower() for part in (contact.email, contact.name, contact.message)
+        )
+        return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+    def _reject(self, wait: float) -> IntakeDecision:
+        self.rejected += 1
+        return IntakeDecision(allowed=False, retry_after=max(1, math.ceil(wait)))
+
+    def check(self, client_ip: str, contact: ContactRequest) -> IntakeDecision:
+        wait = self.ip_limiter.acquire(client_ip)
+        if wait:
+            return self._reject(wait)
+
+        fingerprint = self.fingerprint(contact)
+        if self.dedup.seen(fingerprint):
+            self.duplicates += 1
+            return IntakeDecision(allowed=False, duplicate=True)
+
+        email_key = contact.email.lower()
+        wait = self.email_limiter.acquire(email_key)
+        if wait:
+            self.dedup.forget(fingerprint)
+            return self._reject(wait)
+        return IntakeDecision(allowed=True, fingerprint=fingerprint, client_ip=client_ip, email_key=email_key)
+
+    def release(self, decision: IntakeDecision) -> None:
+        """受付に失敗した送信を重複判定から外し、消費したトークンを戻して再送信できるようにする"""
+        if decision.fingerprint is not None:
+            self.dedup.forget(decision.fingerprint)
+        if decision.client_ip is not None:
+            self.ip_limiter.refund(decision.client_ip)
+        if decision.email_key is not None:
+            self.email_limiter.refund(decision.email_key)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "tracked_ips": len(self.ip_limiter),
+            "tracked_emails": len(self.email_limiter),
+            "dedup_entries": len(self.dedup),
+            "rejected": self.rejected,
+            "duplicates": self.duplicates,
+        }
+
+
+contact_guard = ContactIntakeGuard(
+    ip_limiter=TokenBucketLimiter(
+        rate=settings.CONTACT_RATE_IP_PER_MINUTE / 60,
+        burst=settings.CONTACT_RATE_IP_BURST,
+        max_keys=settings.CONTACT_RATE_MAX_KEYS,
+    ),
+    email_limiter=TokenBucketLimiter(
+        rate=settings.CONTACT_RATE_EMAIL_PER_MINUTE / 60,
+        burst=settings.CONTACT_RATE_EMAIL_BURST,
+        max_keys=settings.CONTACT_RATE_MAX_KEYS,
+    ),
+    dedup=DedupWindow(window=settings.CONTACT_DEDUP_WINDOW, max_entries=settings.CONTACT_RATE_MAX_KEYS),
+)
@@ -0,0 +1,111 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable
+
+
+@dataclass
+class _Bucket:
+    tokens: float
+    updated_at: float
+
+
+class TokenBucketLimiter:
+    """
+    キーごとのトークンバケット
+
+    各キーは最大 burst 個のトークンを持ち、毎秒 rate 個ずつ回復する。
+    バケットは max_keys 件までのLRUで保持し、溢れたら最も古いキーから捨てる
+    （捨てられたキーは満タンの状態から再開する）。操作はすべて O(1)。
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        max_keys: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets: OrderedDict[Hashable, _Bucket] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def acquire(self, key: Hashable, cost: float = 1.0) -> float:
+        """
+        トークンを消費する
+
+        消費できたら 0.0、できなければ次に消費できるまでの秒数を返す（消費はしない）。
+        """
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = _Bucket(self.burst, now)
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated_at) * self.rate)
+            bucket.updated_at = now
+            self._buckets.move_to_end(key)
+
+        if bucket.tokens >= cost:
+            bucket.tokens -= cost
+            return 0.0
+        if self.rate <= 0:
+            return float("inf")
+        return (cost - bucket.tokens) / self.rate
+
+    def refund(self, key: Hashable, cost: float = 1.0) -> None:
+        """後段で処理しなかったリクエストの分を戻す"""
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket.tokens = min(self.burst, bucket.tokens + cost)
+
+
+class DedupWindow:
+    """
+    一定時間内に同じキーが来たかを判定する
+
+    キーは登録順に並ぶため、期限切れは先頭から順に捨てるだけでよい。
+    max_entries を超えた場合も先頭（最も古いもの）から捨てる。
+    """
+
+    def __init__(
+        self,
+        window: float,
+        max_entries: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.window = window
+        self.max_entries = max_entries
+        self._clock = clock
+        self._expires: OrderedDict[Hashable, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._expires)
+
+    def _expire(self, now: float) -> None:
+        while self._expires:
+            key, expires_at = next(iter(self._expires.items()))
+            if expires_at > now:
+                break
+            del self._expires[key]
+
+    def seen(self, key: Hashable) -> bool:
+        """期間内に登録済みなら True、そうでなければ登録して False"""
+        now = self._clock()
+        self._expire(now)
+        if key in self._expires:
+            return True
+        self._expires[key] = now + self.window
+        if len(self._expires) > self.max_entries:
+            self._expires.popitem(last=False)
+        return False
+
+    def forget(self, key: Hashable) -> None:
+        self._expires.pop(key, None)
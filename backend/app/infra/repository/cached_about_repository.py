@@ -0,0 +1,31 @@
+from app.domain.i_repository.i_about_repository import IAboutRepository
+from app.domain.entity.about import About, AboutResponse, EducationRecord, ExperienceRecord, SocialMedia
+from app.infra.cache.async_ttl_cache import AsyncTTLCache
+
+
+class CachedAboutRepository(IAboutRepository):
+    """IAboutRepository の読み取り結果をキャッシュするラッパー"""
+
+    def __init__(self, repository: IAboutRepository, cache: AsyncTTLCache):
+        self.repository = repository
+        self.cache = cache
+
+    async def get_about(self) -> About | None:
+        """自己紹介取得"""
+        return await self.cache.get_or_load("about", self.repository.get_about)
+
+    async def get_education(self) -> list[EducationRecord]:
+        """学歴取得"""
+        return await self.cache.get_or_load("education", self.repository.get_education)
+
+    async def get_experience(self) -> list[ExperienceRecord]:
+        """職歴取得"""
+        return await self.cache.get_or_load("experience", self.repository.get_experience)
+
+    async def get_social_media(self) -> list[SocialMedia]:
+        """ソーシャルメディア取得"""
+        return await self.cache.get_or_load("social_media", self.repository.get_social_media)
+
+    async def get_about_aggregate(self) -> AboutResponse | None:
+        """About情報全体を一括取得"""
+        return await self.cache.get_or_load("aggregate", self.repository.get_about_aggregate)
@@ -0,0 +1,19 @@
+from app.domain.i_repository.i_hero_repository import IHeroRepository
+from app.domain.entity.hero import HeroIntroduction, TimelineItemRecord
+from app.infra.cache.async_ttl_cache import AsyncTTLCache
+
+
+class CachedHeroRepository(IHeroRepository):
+    """IHeroRepository の読み取り結果をキャッシュするラッパー"""
+
+    def __init__(self, repository: IHeroRepository, cache: AsyncTTLCache):
+        self.repository = repository
+        self.cache = cache
+
+    async def get_introduction(self) -> HeroIntroduction | None:
+        """ヒーロー自己紹介取得"""
+        return await self.cache.get_or_load("introduction", self.repository.get_introduction)
+
+    async def get_timeline(self) -> list[TimelineItemRecord]:
+        """タイムライン取得"""
+        return await self.cache.get_or_load("timeline", self.repository.get_timeline)
@@ -0,0 +1,30 @@
+from app.domain.i_repository.i_skill_repository import ISkillRepository
+from app.domain.entity.skill import SkillRecord
+from app.infra.cache.async_ttl_cache import AsyncTTLCache
+
+
+class CachedSkillRepository(ISkillRepository):
+    """ISkillRepository の読み取り結果をキャッシュするラッパー"""
+
+    def __init__(self, repository: ISkillRepository, cache: AsyncTTLCache):
+        self.repository = repository
+        self.cache = cache
+
+    async def find_all(self) -> list[SkillRecord]:
+        """全スキル取得"""
+        return await self.cache.get_or_load("all", self.repository.find_all)
+
+    async def find_by_category(self, category: str) -> list[SkillRecord]:
+        """カテゴリ別スキル取得（キャッシュ済みの全スキルから絞り込む）"""
+        return await self.cache.get_or_load(f"category:{category}", lambda: self._filter_by_category(category))
+
+    async def get_categories(self) -> list[str]:
+        """カテゴリ一覧取得（全スキルから一度だけ算出し、スキル更新時に作り直す）"""
+        return await self.cache.get_or_load("categories", self._build_categories)
+
+    async def _filter_by_category(self, category: str) -> list[SkillRecord]:
+        # find_all は category, name 順なので、絞り込み後も name 順が保たれる
+        return [skill for skill in await self.find_all() if skill.category == category]
+
+    async def _build_categories(self) -> list[str]:
+        return sorted({skill.category for skill in await self.find_all()})
@@ -0,0 +1,43 @@
+from app.domain.i_repository.i_work_repository import IWorkRepository
+from app.domain.entity.work import WorkPage, WorkQuery, WorkRecord
+from app.infra.cache.async_ttl_cache import AsyncTTLCache
+
+
+class CachedWorkRepository(IWorkRepository):
+    """IWorkRepository の読み取り結果をキャッシュするラッパー"""
+
+    def __init__(self, repository: IWorkRepository, cache: AsyncTTLCache):
+        self.repository = repository
+        self.cache = cache
+
+    async def find_all(self) -> list[WorkRecord]:
+        """全作品取得"""
+        return await self.cache.get_or_load("all", self.repository.find_all)
+
+    async def find_by_id(self, work_id: str) -> WorkRecord | None:
+        """作品詳細取得"""
+        return await self.cache.get_or_load(f"id:{work_id}", lambda: self.repository.find_by_id(work_id))
+
+    async def find_by_ids(self, work_ids: list[str]) -> list[WorkRecord]:
+        """複数作品の一括取得（作品IDごとのキャッシュを共有し、未キャッシュ分だけ取得）"""
+        works: list[WorkRecord] = []
+        misses: list[str] = []
+        for work_id in work_ids:
+            found, work = self.cache.lookup(f"id:{work_id}")
+            if not found:
+                misses.append(work_id)
+            elif work is not None:
+                works.append(work)
+        if misses:
+            generation = self.cache.generation
+            fetched = await self.repository.find_by_ids(misses)
+            # 取得中に破棄された場合は保存しない。見つからなかったIDは保存しない
+            # （存在しないIDの一括取得で、一覧や実在する作品のエントリを追い出さないため）
+            for work in fetched:
+                self.cache.set_if_generation(f"id:{work.id}", work, generation)
+            works.extend(fetched)
+        return works
+
+    async def find_page(self, query: WorkQuery) -> WorkPage:
+        """条件付き作品一覧取得"""
+        return await self.cache.get_or_load(f"page:{query.json()}", lambda: self.repository.find_page(query))
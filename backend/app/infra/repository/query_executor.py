@@ -0,0 +1,71 @@
+import inspect
+import time
+
+import anyio
+from postgrest import APIResponse
+
+from app.core.config import settings
+from app.core.metrics import UPSTREAM_REQUEST_DURATION, record_timing
+from app.infra.resilience import CircuitBreaker, ResiliencePolicy
+
+_limiter: anyio.CapacityLimiter | None = None
+
+# 期限切れで待つのをやめたスレッドを置き去りにする引数（anyio 4 で cancellable から改名）
+_ABANDON_ON_CANCEL = (
+    "abandon_on_cancel" if "abandon_on_cancel" in inspect.signature(anyio.to_thread.run_sync).parameters else "cancellable"
+)
+
+# Supabase 全体で共有するサーキットブレーカーと、全リポジトリの問い合わせに適用する方針
+supabase_breaker = CircuitBreaker(
+    "supabase",
+    failure_rate=settings.CIRCUIT_BREAKER_FAILURE_RATE,
+    min_calls=settings.CIRCUIT_BREAKER_MIN_CALLS,
+    window=settings.CIRCUIT_BREAKER_WINDOW,
+    open_seconds=settings.CIRCUIT_BREAKER_OPEN_SECONDS,
+)
+upstream_policy = ResiliencePolicy(
+    breaker=supabase_breaker if settings.CIRCUIT_BREAKER_ENABLED else None,
+    deadline=settings.UPSTREAM_DEADLINE,
+    attempt_timeout=settings.UPSTREAM_ATTEMPT_TIMEOUT,
+    retries=settings.UPSTREAM_RETRIES,
+    backoff=settings.UPSTREAM_RETRY_BACKOFF,
+    backoff_max=settings.UPSTREAM_RETRY_BACKOFF_MAX,
+    hedge_delay=settings.UPSTREAM_HEDGE_DELAY,
+)
+
+
+def _get_limiter() -> anyio.CapacityLimiter:
+    """同期クライアント用スレッドプールの同時実行数制限"""
+    global _limiter
+    if _limiter is None:
+        _limiter = anyio.CapacityLimiter(settings.SUPABASE_THREADPOOL_SIZE)
+    return _limiter
+
+
+async def execute(query) -> APIResponse:
+    """
+    PostgRESTクエリをイベントループを塞がずに実行する
+
+    期限・サーキットブレーカーを適用し、読み取り（GET）は一時的な失敗を再試行する
+    （upstream_policy）。上流を利用できないときは UpstreamUnavailableError を送出する。
+    """
+    idempotent = getattr(query, "http_method", "GET").upper() in ("GET", "HEAD")
+    return await upstream_policy.call(lambda: _execute_once(query), idempotent=idempotent)
+
+
+async def _execute_once(query) -> APIResponse:
+    """
+    1回の問い合わせ
+
+    非同期クライアントのクエリはそのままawaitし、同期クライアントのクエリは
+    上限付きスレッドプールへ退避して実行する。往復時間はテーブル別に計測する。
+    """
+    started = time.perf_counter()
+    try:
+        if inspect.iscoroutinefunction(query.execute):
+            return await query.execute()
+        return await anyio.to_thread.run_sync(query.execute, limiter=_get_limiter(), **{_ABANDON_ON_CANCEL: True})
+    finally:
+        elapsed = time.perf_counter() - started
+        UPSTREAM_REQUEST_DURATION.observe(elapsed, getattr(query, "path", "").lstrip("/"))
+        record_timing("upstream", elapsed)
@@ -0,0 +1,55 @@
+from app.core.metrics import instrument_repository
+from app.infra.snapshot.sync_engine import SnapshotSyncEngine
+from app.domain.i_repository.i_about_repository import IAboutRepository
+from app.domain.entity.about import About, AboutResponse, EducationRecord, ExperienceRecord, SocialMedia
+
+
+@instrument_repository("about_snapshot")
+class SnapshotAboutRepository(IAboutRepository):
+    """ローカルのスナップショットから読む（スナップショットがまだなければ fallback から読む）"""
+
+    def __init__(self, snapshots: SnapshotSyncEngine, fallback: IAboutRepository):
+        self.snapshots = snapshots
+        self.fallback = fallback
+
+    async def get_about(self) -> About | None:
+        """自己紹介取得"""
+        snapshot = self.snapshots.current
+        if snapshot is None:
+            return await self.fallback.get_about()
+        return snapshot.about
+
+    async def get_education(self) -> list[EducationRecord]:
+        """学歴取得（新しい順）"""
+        snapshot = self.snapshots.current
+        if snapshot is None:
+            return await self.fallback.get_education()
+        return list(snapshot.education)
+
+    async def get_experience(self) -> list[ExperienceRecord]:
+        """職歴取得（新しい順）"""
+        snapshot = self.snapshots.current
+        if snapshot is None:
+            return await self.fallback.get_experience()
+        return list(snapshot.experience)
+
+    async def get_social_media(self) -> list[SocialMedia]:
+        """ソーシャルメディア取得"""
+        snapshot = self.snapshots.current
+        if snapshot is None:
+            return await self.fallback.get_social_media()
+        return list(snapshot.social_media)
+
+    async def get_about_aggregate(self) -> AboutResponse | None:
+        """About情報全体を1つの版からまとめて取得"""
+        snapshot = self.snapshots.current
+        if snapshot is None:
+            return await self.fallback.get_about_aggregate()
+        if snapshot.about is None:
+            return None
+        return AboutResponse(
+            about=snapshot.about,
+            education=list(snapshot.education),
+            experience=list(snapshot.experience),
+            social_media=list(snapshot.social_media),
+        )
@@ -0,0 +1,27 @@
+from app.core.metrics import instrument_repository
+from app.infra.snapshot.sync_engine import SnapshotSyncEngine
+from app.domain.i_repository.i_hero_repository import IHeroRepository
+from app.domain.entity.hero import HeroIntroduction, TimelineItemRecord
+
+
+@instrument_repository("hero_snapshot")
+class SnapshotHeroRepository(IHeroRepository):
+    """ローカルのスナップショットから読む（スナップショットがまだなければ fallback から読む）"""
+
+    def __init__(self, snapshots: SnapshotSyncEngine, fallback: IHeroRepository):
+        self.snapshots = snapshots
+        self.fallback = fallback
+
+    async def get_introduction(self) -> HeroIntroduction | None:
+        """ヒーロー自己紹介取得"""
+        snapshot = self.snapshots.current
+        if snapshot is None:
+            return await self.fallback.get_introduction()
+        return snapshot.introduction
+
+    async def get_timeline(self) -> list[TimelineItemRecord]:
+        """タイムライン取得（sort_order順）"""
+        snapshot = self.snapshots.current
+        if snapshot is None:
+            return await self.fallback.get_timeline()
+        return list(snapshot.timeline)
@@ -0,0 +1,34 @@
+from app.core.metrics import instrument_repository
+from app.infra.snapshot.sync_engine import SnapshotSyncEngine
+from app.domain.i_repository.i_skill_repository import ISkillRepository
+from app.domain.entity.skill import SkillRecord
+
+
+@instrument_repository("skill_snapshot")
+class SnapshotSkillRepository(ISkillRepository):
+    """ローカルのスナップショットから読む（スナップショットがまだなければ fallback から読む）"""
+
+    def __init__(self, snapshots: SnapshotSyncEngine, fallback: ISkillRepository):
+        self.snapshots = snapshots
+        self.fallback = fallback
+
+    async def find_all(self) -> list[SkillRecord]:
+        """全スキル取得（カテゴリ順、名前順）"""
+        snapshot = self.snapshots.current
+        if snapshot is None:
+            return await self.fallback.find_all()
+        return list(snapshot.skills)
+
+    async def find_by_category(self, category: str) -> list[SkillRecord]:
+        """カテゴリ別スキル取得"""
+        snapshot = self.snapshots.current
+        if snapshot is None:
+            return await self.fallback.find_by_category(category)
+        return [skill for skill in snapshot.skills if skill.category == category]
+
+    async def get_categories(self) -> list[str]:
+        """スキルカテゴリ一覧取得"""
+        snapshot = self.snapshots.current
+        if snapshot is None:
+            return await self.fallback.get_categories()
+        return list(snapshot.skill_categories)
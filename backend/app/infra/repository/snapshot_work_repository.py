@@ -0,0 +1,77 @@
+from app.core.metrics import instrument_repository
+from app.infra.repository.supabase_work_repository import decode_cursor, encode_cursor
+from app.infra.snapshot.sync_engine import SnapshotSyncEngine
+from app.domain.i_repository.i_work_repository import IWorkRepository
+from app.domain.entity.work import WorkPage, WorkQuery, WorkRecord, project_work
+
+
+def _after_cursor(row: dict, cursor: tuple[bool, str, str]) -> bool:
+    """行がカーソルより後ろか（featured DESC, created_at DESC, id ASC）"""
+    featured, created_at, work_id = cursor
+    row_featured = bool(row.get("featured"))
+    if row_featured != featured:
+        return row_featured < featured
+    row_created_at = str(row.get("created_at") or "")
+    if row_created_at != created_at:
+        return row_created_at < created_at
+    return str(row.get("id")) > work_id
+
+
+@instrument_repository("work_snapshot")
+class SnapshotWorkRepository(IWorkRepository):
+    """ローカルのスナップショットから読む（スナップショットがまだなければ fallback から読む）"""
+
+    def __init__(self, snapshots: SnapshotSyncEngine, fallback: IWorkRepository):
+        self.snapshots = snapshots
+        self.fallback = fallback
+
+    async def find_all(self) -> list[WorkRecord]:
+        """全作品取得（featuredが先、その後created_at降順）"""
+        snapshot = self.snapshots.current
+        if snapshot is None:
+            return await self.fallback.find_all()
+        return [work for _, work in snapshot.works]
+
+    async def find_by_id(self, work_id: str) -> WorkRecord | None:
+        """作品詳細取得"""
+        snapshot = self.snapshots.current
+        if snapshot is None:
+            return await self.fallback.find_by_id(work_id)
+        return snapshot.works_by_id.get(work_id)
+
+    async def find_by_ids(self, work_ids: list[str]) -> list[WorkRecord]:
+        """複数作品の一括取得"""
+        snapshot = self.snapshots.current
+        if snapshot is None:
+            return await self.fallback.find_by_ids(work_ids)
+        return [snapshot.works_by_id[work_id] for work_id in dict.fromkeys(work_ids) if work_id in snapshot.works_by_id]
+
+    async def find_page(self, query: WorkQuery) -> WorkPage:
+        """条件付き作品一覧取得（絞り込み・ページングはSupabaseリポジトリと同じ条件・並び順）"""
+        snapshot = self.snapshots.current
+        if snapshot is None:
+            return await self.fallback.find_page(query)
+        cursor = decode_cursor(query.cursor) if query.cursor else None
+        rows: list[tuple[dict, WorkRecord]] = []
+        for row, work in snapshot.works:
+            if query.category and work.category != query.category:
+                continue
+            if query.technology and query.technology not in (work.technologies or []):
+                continue
+            if cursor and not _after_cursor(row, cursor):
+                continue
+            rows.append((row, work))
+            # 次ページの有無を判定するため1件多く集める
+            if query.limit and len(rows) > query.limit:
+                break
+
+        next_cursor = None
+        if query.limit and len(rows) > query.limit:
+            rows = rows[:query.limit]
+            next_cursor = encode_cursor(rows[-1][0])
+
+        if query.fields:
+            items = [project_work(row, query.fields) for row, _ in rows]
+        else:
+            items = [work.dict() for _, work in rows]
+        return WorkPage(items=items, next_cursor=next_cursor)
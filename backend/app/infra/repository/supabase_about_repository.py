@@ -1,30 +1,56 @@
-from supabase import Client as SupabaseClient
+from app.core.metrics import instrument_repository
+from app.infra.supabase_client import PostgrestClient
+from app.infra.repository.query_executor import execute
 from app.domain.i_repository.i_about_repository import IAboutRepository
-from app.domain.entity.about import About, Education, Experience, SocialMedia
+from app.domain.entity.about import About, AboutResponse, EducationRecord, ExperienceRecord, SocialMedia
 
 
+@instrument_repository("about")
 class SupabaseAboutRepository(IAboutRepository):
-    def __init__(self, client: SupabaseClient):
+    def __init__(self, client: PostgrestClient):
         self.client = client
 
     async def get_about(self) -> About | None:
         """自己紹介取得"""
-        response = self.client.table("about").select("*").limit(1).execute()
+        response = await execute(self.client.table("about").select("*").limit(1))
         if response.data:
             return About(**response.data[0])
         return None
 
-    async def get_education(self) -> list[Education]:
+    async def get_education(self) -> list[EducationRecord]:
         """学歴取得（新しい順）"""
-        response = self.client.table("education").select("*").order("start_date", desc=True).execute()
-        return [Education(**edu) for edu in response.data]
+        response = await execute(self.client.table("education").select("*").order("start_date", desc=True))
+        return [EducationRecord.from_row(edu) for edu in response.data]
 
-    async def get_experience(self) -> list[Experience]:
+    async def get_experience(self) -> list[ExperienceRecord]:
         """職歴取得（新しい順）"""
-        response = self.client.table("experience").select("*").order("start_date", desc=True).execute()
-        return [Experience(**exp) for exp in response.data]
+        response = await execute(self.client.table("experience").select("*").order("start_date", desc=True))
+        return [ExperienceRecord.from_row(exp) for exp in response.data]
 
     async def get_social_media(self) -> list[SocialMedia]:
         """ソーシャルメディア取得"""
-        response = self.client.table("social_media").select("*").execute()
+        response = await execute(self.client.table("social_media").select("*"))
         return [SocialMedia(**sm) for sm in response.data]
+
+    async def get_about_aggregate(self) -> AboutResponse | None:
+        """About情報全体をPostgRESTの埋め込みリソースで一括取得"""
+        query = (
+            self.client.table("about")
+            .select("*,education(*),experience(*),social_media(*)")
+            .order("start_date", desc=True, foreign_table="education")
+            .order("start_date", desc=True, foreign_table="experience")
+            .limit(1)
+        )
+        response = await execute(query)
+        if not response.data:
+            return None
+        row = dict(response.data[0])
+        education = row.pop("education", None) or []
+        experience = row.pop("experience", None) or []
+        social_media = row.pop("social_media", None) or []
+        return AboutResponse(
+            about=About(**row),
+            education=[EducationRecord.from_row(edu) for edu in education],
+            experience=[ExperienceRecord.from_row(exp) for exp in experience],
+            social_media=[SocialMedia(**sm) for sm in social_media],
+        )
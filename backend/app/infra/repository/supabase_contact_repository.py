@@ -1,19 +1,25 @@
-from supabase import Client as SupabaseClient
+import logging
+
+from app.core.metrics import instrument_repository
+from app.infra.supabase_client import PostgrestClient
 from app.domain.i_repository.i_contact_repository import IContactRepository
 from app.domain.entity.contact import ContactRequest
 from app.services.email import send_contact_email
 
+logger = logging.getLogger(__name__)
+
 
+@instrument_repository("contact")
 class SupabaseContactRepository(IContactRepository):
-    def __init__(self, client: SupabaseClient):
+    def __init__(self, client: PostgrestClient):
         self.client = client
 
     async def send_email(self, contact: ContactRequest) -> bool:
         """お問い合わせメール送信"""
         try:
-            # メール送信サービスを使用
+            # 送信キューに登録（実際の送信はバックグラウンドで行う）
             await send_contact_email(contact)
             return True
-        except Exception as e:
-            print(f"Email sending failed: {e}")
+        except Exception:
+            logger.exception("Failed to enqueue contact email")
             return False
@@ -1,20 +1,23 @@
-from supabase import Client as SupabaseClient
+from app.core.metrics import instrument_repository
+from app.infra.supabase_client import PostgrestClient
+from app.infra.repository.query_executor import execute
 from app.domain.i_repository.i_hero_repository import IHeroRepository
-from app.domain.entity.hero import HeroIntroduction, TimelineItem
+from app.domain.entity.hero import HeroIntroduction, TimelineItemRecord
 
 
+@instrument_repository("hero")
 class SupabaseHeroRepository(IHeroRepository):
-    def __init__(self, client: SupabaseClient):
+    def __init__(self, client: PostgrestClient):
         self.client = client
 
     async def get_introduction(self) -> HeroIntroduction | None:
         """ヒーロー自己紹介取得"""
-        response = self.client.table("hero_introduction").select("*").limit(1).execute()
+        response = await execute(self.client.table("hero_introduction").select("*").limit(1))
         if response.data:
             return HeroIntroduction(**response.data[0])
         return None
 
-    async def get_timeline(self) -> list[TimelineItem]:
+    async def get_timeline(self) -> list[TimelineItemRecord]:
         """タイムライン取得（sort_order順）"""
-        response = self.client.table("timeline_items").select("*").order("sort_order").execute()
-        return [TimelineItem(**item) for item in response.data]
+        response = await execute(self.client.table("timeline_items").select("*").order("sort_order"))
+        return [TimelineItemRecord.from_row(item) for item in response.data]
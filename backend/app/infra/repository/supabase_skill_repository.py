@@ -1,24 +1,31 @@
-from supabase import Client as SupabaseClient
+from app.core.metrics import instrument_repository
+from app.core.config import settings
+from app.infra.supabase_client import PostgrestClient
+from app.infra.repository.query_executor import execute
 from app.domain.i_repository.i_skill_repository import ISkillRepository
-from app.domain.entity.skill import Skill
+from app.domain.entity.skill import SkillRecord
 
 
+@instrument_repository("skill")
 class SupabaseSkillRepository(ISkillRepository):
-    def __init__(self, client: SupabaseClient):
+    def __init__(self, client: PostgrestClient):
         self.client = client
 
-    async def find_all(self) -> list[Skill]:
+    async def find_all(self) -> list[SkillRecord]:
         """全スキル取得（カテゴリ順、名前順）"""
-        response = self.client.table("skills").select("*").order("category").order("name").execute()
-        return [Skill(**skill) for skill in response.data]
+        response = await execute(self.client.table("skills").select("*").order("category").order("name"))
+        return [SkillRecord.from_row(skill) for skill in response.data]
 
-    async def find_by_category(self, category: str) -> list[Skill]:
+    async def find_by_category(self, category: str) -> list[SkillRecord]:
         """カテゴリ別スキル取得"""
-        response = self.client.table("skills").select("*").eq("category", category).order("name").execute()
-        return [Skill(**skill) for skill in response.data]
+        response = await execute(self.client.table("skills").select("*").eq("category", category).order("name"))
+        return [SkillRecord.from_row(skill) for skill in response.data]
 
     async def get_categories(self) -> list[str]:
-        """スキルカテゴリ一覧取得"""
-        response = self.client.table("skills").select("category").execute()
+        """スキルカテゴリ一覧取得（SKILL_CATEGORIES_VIEW 設定時はDB側でDISTINCT済みのビューを参照）"""
+        if settings.SKILL_CATEGORIES_VIEW:
+            response = await execute(self.client.table(settings.SKILL_CATEGORIES_VIEW).select("category").order("category"))
+            return [row["category"] for row in response.data]
+        response = await execute(self.client.table("skills").select("category"))
         categories = list(set(skill["category"] for skill in response.data))
         return sorted(categories)
@@ -1,20 +1,97 @@
-from supabase import Client as SupabaseClient
+import base64
+import json
+
+from postgrest.utils import sanitize_param
+
+from app.core.metrics import instrument_repository
+from app.infra.supabase_client import PostgrestClient
+from app.infra.repository.query_executor import execute
 from app.domain.i_repository.i_work_repository import IWorkRepository
-from app.domain.entity.work import Work
+from app.domain.entity.work import InvalidCursorError, WorkPage, WorkQuery, WorkRecord, project_work
+
+# キーセットページングの並び順（featured DESC, created_at DESC, id ASC）
+PAGE_ORDER = "featured.desc,created_at.desc,id.asc"
+CURSOR_COLUMNS = ("featured", "created_at", "id")
+
+
+def encode_cursor(row: dict) -> str:
+    """ページ末尾の行からカーソル文字列を作る"""
+    raw = json.dumps([row["featured"], row["created_at"], row["id"]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[bool, str, str]:
+    """カーソル文字列を (featured, created_at, id) に戻す（不正なら InvalidCursorError）"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        featured, created_at, work_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+    return bool(featured), str(created_at), str(work_id)
 
 
+def _keyset_filter(cursor: str) -> str:
+    """カーソルより後ろの行を表す PostgREST の or 条件"""
+    featured, created_at, work_id = decode_cursor(cursor)
+    f = "true" if featured else "false"
+    c = sanitize_param(created_at)
+    i = sanitize_param(work_id)
+    return (
+        f"(featured.lt.{f},"
+        f"and(featured.eq.{f},created_at.lt.{c}),"
+        f"and(featured.eq.{f},created_at.eq.{c},id.gt.{i}))"
+    )
+
+
+@instrument_repository("work")
 class SupabaseWorkRepository(IWorkRepository):
-    def __init__(self, client: SupabaseClient):
+    def __init__(self, client: PostgrestClient):
         self.client = client
 
-    async def find_all(self) -> list[Work]:
+    async def find_all(self) -> list[WorkRecord]:
         """全作品取得（featuredが先、その後created_at降順）"""
-        response = self.client.table("works").select("*").order("featured", desc=True).order("created_at", desc=True).execute()
-        return [Work(**work) for work in response.data]
+        response = await execute(self.client.table("works").select("*").order("featured", desc=True).order("created_at", desc=True))
+        return [WorkRecord.from_row(work) for work in response.data]
 
-    async def find_by_id(self, work_id: str) -> Work | None:
+    async def find_by_id(self, work_id: str) -> WorkRecord | None:
         """作品詳細取得"""
-        response = self.client.table("works").select("*").eq("id", work_id).execute()
+        response = await execute(self.client.table("works").select("*").eq("id", work_id))
         if response.data:
-            return Work(**response.data[0])
+            return WorkRecord.from_row(response.data[0])
         return None
+
+    async def find_by_ids(self, work_ids: list[str]) -> list[WorkRecord]:
+        """複数作品の一括取得（1回の in 問い合わせ）"""
+        if not work_ids:
+            return []
+        response = await execute(self.client.table("works").select("*").in_("id", work_ids))
+        return [WorkRecord.from_row(work) for work in response.data]
+
+    async def find_page(self, query: WorkQuery) -> WorkPage:
+        """条件付き作品一覧取得（絞り込み・項目指定・ページングをPostgREST側で実行）"""
+        columns = "*"
+        if query.fields:
+            columns = ",".join(dict.fromkeys([*query.fields, *CURSOR_COLUMNS]))
+        builder = self.client.table("works").select(columns)
+        if query.category:
+            builder = builder.eq("category", query.category)
+        if query.technology:
+            builder = builder.filter("technologies", "cs", "{" + json.dumps(query.technology, ensure_ascii=False) + "}")
+        if query.cursor:
+            builder.params = builder.params.add("or", _keyset_filter(query.cursor))
+        builder.params = builder.params.add("order", PAGE_ORDER)
+        if query.limit:
+            # 次ページの有無を判定するため1件多く取得する
+            builder = builder.limit(query.limit + 1)
+
+        rows = (await execute(builder)).data
+        next_cursor = None
+        if query.limit and len(rows) > query.limit:
+            rows = rows[:query.limit]
+            next_cursor = encode_cursor(rows[-1])
+
+        if query.fields:
+            items = [project_work(row, query.fields) for row in rows]
+        else:
+            items = [WorkRecord.from_row(row).dict() for row in rows]
+        return WorkPage(items=items, next_cursor=next_cursor)
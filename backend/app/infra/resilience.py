@@ -0,0 +1,242 @@
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, TypeVar
+
+import httpx
+from postgrest.exceptions import APIError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 一時的な障害とみなす PostgreSQL のエラークラス（接続・リソース不足・キャンセル・直列化失敗）
+TRANSIENT_SQLSTATE_PREFIXES = ("08", "53", "57", "40001", "40P01")
+
+
+class UpstreamUnavailableError(Exception):
+    """上流（Supabase）を利用できない（サーキットオープン・期限切れ・再試行しても失敗）"""
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(UpstreamUnavailableError):
+    """サーキットブレーカーが開いているため問い合わせずに失敗した"""
+
+
+def is_transient(error: BaseException) -> bool:
+    """再試行・障害率の対象になる一時的な失敗か（クエリの誤りなど上流が応答したエラーは対象外）"""
+    # Python 3.10 では asyncio.wait_for が組み込みの TimeoutError ではない asyncio.TimeoutError を送出する
+    if isinstance(error, (TimeoutError, asyncio.TimeoutError, httpx.TransportError)):
+        return True
+    if isinstance(error, APIError):
+        code = str(error.code or "")
+        # JSONでない応答（ゲートウェイの502/503など）は HTTP ステータスが code になる
+        if code.isdigit() and len(code) == 3:
+            return code.startswith("5")
+        return code.startswith(TRANSIENT_SQLSTATE_PREFIXES)
+    return False
+
+
+class CircuitBreaker:
+    """
+    失敗率によるサーキットブレーカー
+
+    - closed: 直近 window 秒の失敗率が failure_rate 以上（min_calls 件以上）になったら open
+    - open: open_seconds 秒間は問い合わせずに CircuitOpenError
+    - half_open: 1件だけ試し、成功なら closed、失敗なら再び open
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = 0.5,
+        min_calls: int = 10,
+        window: float = 30.0,
+        open_seconds: float = 15.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window = window
+        self.open_seconds = open_seconds
+        self._clock = clock
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._opened_at: float | None = None
+        # half_open で試行中の問い合わせの開始時刻
+        self._probe_started: float | None = None
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at < self.open_seconds:
+            return "open"
+        return "half_open"
+
+    def before_call(self) -> None:
+        """問い合わせてよいか確認する（だめなら CircuitOpenError）"""
+        state = self.state
+        if state == "closed":
+            return
+        # 試行が取り消されて結果が記録されなくても、open_seconds 後には次の試行を許す
+        now = self._clock()
+        if state == "half_open" and (self._probe_started is None or now - self._probe_started >= self.open_seconds):
+            self._probe_started = now
+            return
+        self.rejected += 1
+        retry_after = max(0.0, self.open_seconds - (now - self._opened_at))
+        raise CircuitOpenError(f"Circuit {self.name} is open", retry_after=retry_after or self.open_seconds)
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            logger.info(f"Circuit {self.name} closed")
+            self._opened_at = None
+            self._outcomes.clear()
+        self._probe_started = None
+        self._record(True)
+
+    def record_failure(self) -> None:
+        if self._opened_at is not None:
+            # half_open での試行が失敗した（または open 前に始まった問い合わせが失敗した）
+            self._opened_at = self._clock()
+            self._probe_started = None
+            return
+        self._record(False)
+        failures = sum(1 for _, ok in self._outcomes if not ok)
+        if len(self._outcomes) >= self.min_calls and failures / len(self._outcomes) >= self.failure_rate:
+            logger.warning(f"Circuit {self.name} opened ({failures}/{len(self._outcomes)} failed in {self.window:.0f}s)")
+            self._opened_at = self._clock()
+            self.opened += 1
+
+    def _record(self, ok: bool) -> None:
+        now = self._clock()
+        self._outcomes.append((now, ok))
+        while self._outcomes and self._outcomes[0][0] < now - self.window:
+            self._outcomes.popleft()
+
+    def stats(self) -> dict[str, Any]:
+        return {"state": self.state, "opened": self.opened, "rejected": self.rejected}
+
+
+class ResiliencePolicy:
+    """
+    上流への問い合わせに期限・サーキットブレーカー・再試行・ヘッジを適用する
+
+    - deadline: 再試行を含めた1回の呼び出し全体の期限（秒）、attempt_timeout: 1回の試行の期限
+    - 冪等な読み取りのみ、一時的な失敗を retries 回まで再試行する（full jitter の指数バックオフ）
+    - hedge_delay 秒以内に応答がなければ同じ読み取りをもう1本送り、先に成功した方を使う
+    - 一時的な失敗で諦めたときは UpstreamUnavailableError を送出する
+    """
+
+    def __init__(
+        self,
+        breaker: CircuitBreaker | None = None,
+        deadline: float = 8.0,
+        attempt_timeout: float = 3.0,
+        retries: int = 2,
+        backoff: float = 0.05,
+        backoff_max: float = 1.0,
+        hedge_delay: float | None = None,
+        rng: Callable[[], float] = random.random,
+    ):
+        self.breaker = breaker
+        self.deadline = deadline
+        self.attempt_timeout = attempt_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.hedge_delay = hedge_delay
+        self._rng = rng
+        self.retried = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.gave_up = 0
+
+    async def call(self, operation: Callable[[], Awaitable[T]], idempotent: bool = True) -> T:
+        """operation を実行する（idempotent=False の書き込みは再試行・ヘッジしない）"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.deadline
+        attempt = 0
+        while True:
+            if self.breaker is not None:
+                self.breaker.before_call()
+            remaining = deadline - loop.time()
+            try:
+                if remaining <= 0:
+                    raise TimeoutError("Upstream deadline exceeded")
+                timeout = min(remaining, self.attempt_timeout)
+                if idempotent and self.hedge_delay is not None and self.hedge_delay < timeout:
+                    result = await self._hedged(operation, timeout)
+                else:
+                    result = await asyncio.wait_for(operation(), timeout)
+            except Exception as e:
+                if not is_transient(e):
+                    # 上流は応答している（クエリの誤りなど）
+                    self._record(True)
+                    raise
+                self._record(False)
+                delay = self._rng() * min(self.backoff_max, self.backoff * 2 ** attempt)
+                if not idempotent or attempt >= self.retries or loop.time() + delay >= deadline:
+                    self.gave_up += 1
+                    raise UpstreamUnavailableError(f"Upstream call failed after {attempt + 1} attempt(s): {e!r}") from e
+                logger.debug(f"Retrying upstream call in {delay * 1000:.0f}ms after {e!r}")
+                self.retried += 1
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+            self._record(True)
+            return result
+
+    async def _hedged(self, operation: Callable[[], Awaitable[T]], timeout: float) -> T:
+        """hedge_delay 後に2本目を送り、先に成功した結果を返す（残りは取り消す）"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        primary = asyncio.ensure_future(operation())
+        pending = {primary}
+        error: BaseException | None = None
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.hedge_delay)
+            if not done:
+                self.hedged += 1
+                pending.add(asyncio.ensure_future(operation()))
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+                if not pending:
+                    raise error
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise TimeoutError("Upstream attempt timed out")
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _record(self, ok: bool) -> None:
+        if self.breaker is None:
+            return
+        if ok:
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "retried": self.retried,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "gave_up": self.gave_up,
+            **({"circuit": self.breaker.stats()} if self.breaker else {}),
+        }
@@ -0,0 +1,382 @@
+import asyncio
+import heapq
+import math
+import re
+import unicodedata
+from bisect import bisect_left
+from itertools import repeat
+from typing import Any
+
+from app.domain.entity.work import WorkRecord, WorkSearchHit, WorkSearchResponse
+from app.domain.i_repository.i_work_search_index import IWorkSearchIndex
+
+# 文字2-gramで索引する文字（ひらがな・カタカナ・漢字。NFKC で半角カナは全角になる）
+_CJK = "\u3005\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+# CJK の連続 / それ以外の英数字の連続（単語）
+_RUNS = re.compile(f"([{_CJK}]+)|([^\\W_{_CJK}]+)")
+
+# 索引する項目と重み（一致したときの語の出現回数に掛ける）
+FIELD_WEIGHTS = {
+    "title": 3.0,
+    "technologies": 2.0,
+    "role": 1.5,
+    "description": 1.0,
+    "learnings": 1.0,
+}
+# BM25 のパラメータ
+BM25_K1 = 1.2
+BM25_B = 0.75
+# 前方一致で広げた語の重みと、1語あたりに広げる語数の上限
+PREFIX_WEIGHT = 0.5
+MAX_PREFIX_EXPANSIONS = 64
+# 語ごとの一致結果を保持する上限（索引が変わるまで使い回す）
+MAX_CACHED_MATCHES = 4096
+# 複数語の一致がこの件数以下なら、打ち切りをせずすべての作品の値を計算する
+DIRECT_SCORING_MAX = 256
+# 一致が多いとき、各語で値の大きい上位この件数の作品から計算を始める（足りなければ倍にする）
+RANK_DEPTH = 64
+# バイト値 -> 立っているビットの位置
+_BIT_POSITIONS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+# 索引し直すとき、この件数ごとにイベントループへ制御を返す
+REFRESH_YIELD_EVERY = 200
+
+
+def _runs(text: str) -> list[tuple[str, str]]:
+    """NFKC 正規化・小文字化した text の (CJK の連続, 英数字の単語) のリスト（片方は空）"""
+    return _RUNS.findall(unicodedata.normalize("NFKC", text).lower())
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    索引する語のリスト
+
+    英数字は単語単位、日本語（CJK）は重なりのある文字2-gram（1文字だけの連続はその1文字）に分ける。
+    """
+    tokens = []
+    for cjk, word in _runs(text):
+        if word or len(cjk) == 1:
+            tokens.append(word or cjk)
+        else:
+            tokens.extend(cjk[i:i + 2] for i in range(len(cjk) - 1))
+    return tokens
+
+
+def query_terms(query: str) -> list[tuple[str, bool]]:
+    """
+    検索語の (語, 前方一致も使うか) のリスト（重複なし）
+
+    英数字の単語と1文字の日本語は前方一致も使う。日本語の2-gramは、連続の全文字を覆う
+    重ならない組だけを使う（"データベース" -> "デー" "タベ" "ース"）。重なる組は同じ作品に
+    一致することがほとんどで、語数だけが増えるため。
+    """
+    terms = []
+    for cjk, word in _runs(query):
+        if word or len(cjk) == 1:
+            terms.append((word or cjk, True))
+            continue
+        starts = list(range(0, len(cjk) - 1, 2))
+        if len(cjk) % 2:
+            starts.append(len(cjk) - 2)
+        terms.extend((cjk[i:i + 2], False) for i in starts)
+    return list(dict.fromkeys(terms))
+
+
+def _field_text(work: WorkRecord, field: str) -> str:
+    value = getattr(work, field)
+    if isinstance(value, (list, tuple)):
+        return " ".join(value)
+    return value or ""
+
+
+def _fingerprint(work: WorkRecord) -> tuple:
+    """索引する項目の内容（同じなら索引し直さない）"""
+    return tuple(_field_text(work, field) for field in FIELD_WEIGHTS)
+
+
+def _document_terms(work: WorkRecord) -> tuple[dict[str, float], float]:
+    """語 -> 項目の重みを掛けた出現回数と、重み付きの文書長"""
+    terms: dict[str, float] = {}
+    length = 0.0
+    for field, weight in FIELD_WEIGHTS.items():
+        for term in tokenize(_field_text(work, field)):
+            terms[term] = terms.get(term, 0.0) + weight
+            length += weight
+    return terms, length
+
+
+class _Document:
+    __slots__ = ("key", "work", "fingerprint", "terms", "length")
+
+    def __init__(self, key: int, work: WorkRecord, fingerprint: tuple, terms: dict[str, float], length: float):
+        self.key = key
+        self.work = work
+        self.fingerprint = fingerprint
+        self.terms = terms
+        self.length = length
+
+
+class _Match:
+    """
+    検索語の1語に一致する作品
+
+    scores は作品 -> 値、keys は値の大きい順の作品、mask は一致する作品のビット集合
+    （複数語の AND を整数の & で求める）。
+    """
+    __slots__ = ("scores", "keys", "mask")
+
+    def __init__(self, scores: dict[int, float], keys: list[int], mask: int):
+        self.scores = scores
+        self.keys = keys
+        self.mask = mask
+
+
+class WorkSearchIndex(IWorkSearchIndex):
+    """
+    作品のインプロセス全文検索（転置索引 + BM25）
+
+    - title / description / learnings / role / technologies を項目ごとの重み付きで索引する
+    - 日本語は文字2-gram、英数字は単語で分割し、検索語の語はすべて含む作品（AND）を返す
+    - 英数字の単語と1文字の日本語は前方一致も使う（"fast" -> "fastapi"、重みは PREFIX_WEIGHT）
+    - 複数語で一致が DIRECT_SCORING_MAX 件を超えるときは、各語で値が上位の作品から計算し、
+      残りの作品が上位に入り得なくなった時点で打ち切る（結果はすべての一致を計算した場合と同じ。
+      rank_depth=None なら打ち切らずにすべての一致を計算する）
+    - 語ごとの一致結果は索引が変わるまで使い回す
+    - refresh() はリポジトリの一覧と比べ、内容の変わった作品だけを索引し直す。
+      同じ一覧オブジェクト（キャッシュのヒット）なら何もしない
+    """
+
+    def __init__(self, rank_depth: int | None = RANK_DEPTH):
+        # None なら一致が多くても打ち切らず、すべての一致を計算する
+        self.rank_depth = rank_depth
+        self._source: list[WorkRecord] | None = None
+        self._docs: dict[str, _Document] = {}
+        self._postings: dict[str, dict[int, float]] = {}
+        # 検索語の語 -> 一致する作品。文書数・文書長で値が変わるため、作品が変わったら作り直す
+        self._matches: dict[tuple[str, bool], _Match] = {}
+        self._by_key: dict[int, _Document] = {}
+        self._order: dict[int, int] = {}
+        self._vocabulary: list[str] | None = None
+        self._total_length = 0.0
+        self._next_key = 0
+        self._lock = asyncio.Lock()
+        self.refreshes = 0
+        self.reindexed = 0
+        self.queries = 0
+
+    async def refresh(self, works: list[WorkRecord]) -> None:
+        if works is self._source:
+            return
+        async with self._lock:
+            if works is self._source:
+                return
+            # 分割（重い処理）は制御を返しながら行い、その間の検索は前の索引を使う
+            changed: list[tuple[WorkRecord, tuple, dict[str, float], float]] = []
+            replaced: list[WorkRecord] = []
+            for work in works:
+                doc = self._docs.get(work.id)
+                if doc is not None and doc.work is work:
+                    continue
+                fingerprint = _fingerprint(work)
+                if doc is not None and doc.fingerprint == fingerprint:
+                    replaced.append(work)
+                    continue
+                changed.append((work, fingerprint, *_document_terms(work)))
+                if len(changed) % REFRESH_YIELD_EVERY == 0:
+                    await asyncio.sleep(0)
+            self._apply(works, changed, replaced)
+
+    def _apply(self, works: list[WorkRecord], changed: list, replaced: list[WorkRecord]) -> None:
+        """索引の更新（await を挟まないため、検索からは更新前か後のどちらかだけが見える）"""
+        current_ids = {work.id for work in works}
+        removed = [work_id for work_id in self._docs if work_id not in current_ids]
+        for work_id in removed:
+            self._remove(self._docs.pop(work_id))
+        # 索引する項目が同じ作品は、返す作品だけ差し替える
+        for work in replaced:
+            self._docs[work.id].work = work
+        for work, fingerprint, terms, length in changed:
+            previous = self._docs.get(work.id)
+            if previous is not None:
+                self._remove(previous)
+            doc = _Document(self._next_key, work, fingerprint, terms, length)
+            self._next_key += 1
+            self._docs[work.id] = doc
+            self._by_key[doc.key] = doc
+            self._total_length += length
+            for term, frequency in terms.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    self._vocabulary = None
+                postings[doc.key] = frequency
+        self._order = {self._docs[work.id].key: position for position, work in enumerate(works)}
+        if changed or removed:
+            self._matches = {}
+        self._source = works
+        self.refreshes += 1
+        self.reindexed += len(changed)
+
+    def _remove(self, doc: _Document) -> None:
+        del self._by_key[doc.key]
+        self._total_length -= doc.length
+        for term in doc.terms:
+            postings = self._postings[term]
+            del postings[doc.key]
+            if not postings:
+                del self._postings[term]
+                self._vocabulary = None
+
+    def search(self, query: str, limit: int) -> WorkSearchResponse:
+        self.queries += 1
+        matches = [self._match(term, prefix) for term, prefix in query_terms(query)]
+        if not matches or not all(match.scores for match in matches):
+            return WorkSearchResponse(query=query, total=0, hits=[])
+        if len(matches) == 1:
+            total, top = len(matches[0].scores), self._top_of_one(matches[0], limit)
+        else:
+            total, top = self._top_of_all(matches, limit)
+        # 検証済みの作品から組み立てるため construct を使う（ルートは FastJSONResponse で
+        # 直接返し、response_model での再検証・jsonable_encoder を通さない）
+        return WorkSearchResponse.construct(
+            query=query,
+            total=total,
+            hits=[WorkSearchHit.construct(work=self._by_key[key].work, score=round(score, 4)) for key, score in top],
+        )
+
+    def _top_of_one(self, match: "_Match", limit: int) -> list[tuple[int, float]]:
+        """1語の上位 limit 件（limit 件目と同点の作品も含めて並び順で選ぶ）"""
+        keys, scores = match.keys, match.scores
+        end = min(limit, len(keys))
+        while 0 < end < len(keys) and scores[keys[end]] == scores[keys[end - 1]]:
+            end += 1
+        order = self._order
+        top = sorted(keys[:end], key=lambda key: (-scores[key], order[key]))[:limit]
+        return [(key, scores[key]) for key in top]
+
+    def _top_of_all(self, matches: list["_Match"], limit: int) -> tuple[int, list[tuple[int, float]]]:
+        """すべての語を含む作品の件数と、合計値の上位 limit 件"""
+        common = matches[0].mask
+        for match in matches[1:]:
+            common &= match.mask
+        total = common.bit_count()
+        if not total:
+            return 0, []
+        # ビット集合をバイト列にして、作品ごとの判定を小さい整数の演算で行う
+        bits = common.to_bytes(self._next_key // 8 + 1, "little")
+        if self.rank_depth is None or total <= DIRECT_SCORING_MAX:
+            # 一致が少なければ、一致する作品をすべて計算する
+            candidates = [index * 8 + bit for index, byte in enumerate(bits) if byte for bit in _BIT_POSITIONS[byte]]
+            top = self._score(matches, candidates, limit)
+        else:
+            top = self._top_by_rank(matches, bits, limit)
+        # 同点はリポジトリの並び順（featured が先、新しい順）
+        return total, [(key, score) for score, _, key in top]
+
+    def _top_by_rank(self, matches: list["_Match"], bits: bytes, limit: int) -> list[tuple[float, int, int]]:
+        """
+        各語の並び（値の大きい順）の上位 depth 件に入る作品だけを計算する（threshold algorithm）
+
+        どの語でも上位 depth 件に入らない作品の合計値は、各語の depth 件目の値の合計（上限）以下になる。
+        選んだ limit 件目の値が上限を上回れば、残りの作品は上位に入らないため打ち切る。
+        そうでなければ depth を倍にし、新たに入った作品だけを計算して上位を選び直す。
+        """
+        # 計算済みの作品（すべての語を含まない作品も、一度見たら除く）
+        seen = bytearray(self._next_key)
+        top: list[tuple[float, int, int]] = []
+        start, depth = 0, self.rank_depth
+        while True:
+            candidates = []
+            for match in matches:
+                for key in match.keys[start:depth]:
+                    if not seen[key]:
+                        seen[key] = 1
+                        if bits[key >> 3] >> (key & 7) & 1:
+                            candidates.append(key)
+            top = heapq.nlargest(limit, top + self._entries(matches, candidates))
+            # どれかの並びをすべて見た場合は、すべての一致を計算している
+            if any(depth >= len(match.keys) for match in matches):
+                return top
+            # 同点は並び順で決まるため、上限と同じ値では打ち切らない（合計は _entries と同じ順に足す）
+            bound = sum(match.scores[match.keys[depth]] for match in matches)
+            if len(top) >= limit and top[-1][0] > bound:
+                return top
+            start, depth = depth, depth * 2
+
+    def _score(self, matches: list["_Match"], candidates: list[int], limit: int) -> list[tuple[float, int, int]]:
+        """候補の作品の合計値の上位 limit 件（(値, -並び順, 作品) の降順）"""
+        return heapq.nlargest(limit, self._entries(matches, candidates))
+
+    def _entries(self, matches: list["_Match"], candidates: list[int]) -> list[tuple[float, int, int]]:
+        """候補の作品ごとの (合計値, -並び順, 作品)"""
+        order = self._order
+        if len(matches) == 2:
+            first, second = matches[0].scores, matches[1].scores
+            return [(first[key] + second[key], -order[key], key) for key in candidates]
+        all_scores = [match.scores for match in matches]
+        size = len(all_scores)
+        return [(sum(map(dict.__getitem__, all_scores, repeat(key, size))), -order[key], key) for key in candidates]
+
+    def _match(self, term: str, prefix: bool) -> "_Match":
+        """1語に一致する作品（前方一致で広げた語は作品ごとに最大の値）"""
+        match = self._matches.get((term, prefix))
+        if match is not None:
+            return match
+        expansions = [(term, 1.0)] if term in self._postings else []
+        if prefix:
+            expansions += [(expanded, PREFIX_WEIGHT) for expanded in self._expand(term)]
+        if len(expansions) == 1 and expansions[0][1] == 1.0:
+            scores = self._bm25(term)
+        else:
+            scores = {}
+            for expanded, weight in expansions:
+                for key, score in self._bm25(expanded).items():
+                    score *= weight
+                    if score > scores.get(key, 0.0):
+                        scores[key] = score
+        bits = bytearray(self._next_key // 8 + 1)
+        for key in scores:
+            bits[key >> 3] |= 1 << (key & 7)
+        match = _Match(scores, sorted(scores, key=scores.__getitem__, reverse=True), int.from_bytes(bits, "little"))
+        if len(self._matches) >= MAX_CACHED_MATCHES:
+            self._matches.clear()
+        self._matches[(term, prefix)] = match
+        return match
+
+    def _expand(self, term: str) -> list[str]:
+        """term で始まる索引中の語（term 自身を除く）"""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        expanded = []
+        for i in range(bisect_left(vocabulary, term), len(vocabulary)):
+            candidate = vocabulary[i]
+            if not candidate.startswith(term) or len(expanded) >= MAX_PREFIX_EXPANSIONS:
+                break
+            if candidate != term:
+                expanded.append(candidate)
+        return expanded
+
+    def _bm25(self, term: str) -> dict[int, float]:
+        """作品 -> term の BM25 の値"""
+        postings = self._postings[term]
+        total = len(self._docs)
+        idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+        norm = BM25_K1 * (1 - BM25_B)
+        scale = BM25_K1 * BM25_B * total / self._total_length
+        by_key = self._by_key
+        return {
+            key: idf * frequency * (BM25_K1 + 1) / (frequency + norm + scale * by_key[key].length)
+            for key, frequency in postings.items()
+        }
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "documents": len(self._docs),
+            "terms": len(self._postings),
+            "refreshes": self.refreshes,
+            "reindexed": self.reindexed,
+            "queries": self.queries,
+        }
+
+
+work_search_index = WorkSearchIndex()
@@ -0,0 +1,111 @@
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import ValidationError
+
+from app.domain.entity.about import About, EducationRecord, ExperienceRecord, SocialMedia
+from app.domain.entity.hero import HeroIntroduction, TimelineItemRecord
+from app.domain.entity.skill import SkillRecord
+from app.domain.entity.work import WorkRecord
+
+logger = logging.getLogger(__name__)
+
+# 複製する読み取り用テーブル
+SNAPSHOT_TABLES = (
+    "works",
+    "skills",
+    "about",
+    "education",
+    "experience",
+    "social_media",
+    "hero_introduction",
+    "timeline_items",
+)
+
+
+def content_version(tables: dict[str, list[dict]]) -> str:
+    """テーブル内容から版を計算する（同じ内容なら同じ版）"""
+    payload = json.dumps(tables, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def table_digests(tables: dict[str, list[dict]]) -> dict[str, str]:
+    """テーブルごとの内容ハッシュ（版の切り替え時に変わったテーブルを調べる）"""
+    return {table: content_version({table: rows}) for table, rows in tables.items()}
+
+
+def _validated(model, rows: list[dict], table: str) -> list[tuple[dict, Any]]:
+    """行を検証して (元の行, モデル) にする（検証に失敗した行は除外して記録する）"""
+    pairs = []
+    for row in rows:
+        try:
+            pairs.append((row, model.from_row(row) if hasattr(model, "from_row") else model(**row)))
+        except ValidationError as e:
+            logger.warning(f"Skipping invalid {table} row {row.get('id')!r} in snapshot: {e}")
+    return pairs
+
+
+def _build(model, rows: list[dict], table: str) -> list:
+    return [built for _, built in _validated(model, rows, table)]
+
+
+def _sort_desc(items: list, key) -> list:
+    """None を先頭にした降順（PostgreSQL の DESC と同じ並び）"""
+    return sorted(items, key=lambda item: (key(item) is None, key(item) or ""), reverse=True)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    1つの版の読み取り用データ（検証済み・並び替え済み・索引付き）
+
+    リポジトリは現在の Snapshot を参照するだけで、版の切り替えは参照の差し替えで行う。
+    並び順は Supabase リポジトリのクエリと同じにする。
+    """
+    version: str
+    synced_at: float
+    tables: dict[str, list[dict]]
+    digests: dict[str, str]
+    # (元の行, 検証済みの作品) を featured DESC, created_at DESC, id ASC の順で
+    works: list[tuple[dict, WorkRecord]] = field(default_factory=list)
+    works_by_id: dict[str, WorkRecord] = field(default_factory=dict)
+    skills: list[SkillRecord] = field(default_factory=list)
+    skill_categories: list[str] = field(default_factory=list)
+    about: About | None = None
+    education: list[EducationRecord] = field(default_factory=list)
+    experience: list[ExperienceRecord] = field(default_factory=list)
+    social_media: list[SocialMedia] = field(default_factory=list)
+    introduction: HeroIntroduction | None = None
+    timeline: list[TimelineItemRecord] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, version: str, synced_at: float, tables: dict[str, list[dict]]) -> "Snapshot":
+        tables = {table: list(tables.get(table, [])) for table in SNAPSHOT_TABLES}
+
+        work_rows = sorted(tables["works"], key=lambda row: str(row.get("id")))
+        work_rows = _sort_desc(work_rows, lambda row: row.get("created_at"))
+        work_rows = sorted(work_rows, key=lambda row: bool(row.get("featured")), reverse=True)
+        works = _validated(WorkRecord, work_rows, "works")
+
+        skills = sorted(_build(SkillRecord, tables["skills"], "skills"), key=lambda s: (s.category, s.name))
+        about = _build(About, tables["about"][:1], "about")
+        introduction = _build(HeroIntroduction, tables["hero_introduction"][:1], "hero_introduction")
+        return cls(
+            version=version,
+            synced_at=synced_at,
+            tables=tables,
+            digests=table_digests(tables),
+            works=works,
+            works_by_id={work.id: work for _, work in works},
+            skills=skills,
+            skill_categories=sorted({skill.category for skill in skills}),
+            about=about[0] if about else None,
+            education=_sort_desc(_build(EducationRecord, tables["education"], "education"), lambda e: e.start_date),
+            experience=_sort_desc(_build(ExperienceRecord, tables["experience"], "experience"), lambda e: e.start_date),
+            social_media=_build(SocialMedia, tables["social_media"], "social_media"),
+            introduction=introduction[0] if introduction else None,
+            timeline=sorted(_build(TimelineItemRecord, tables["timeline_items"], "timeline_items"), key=lambda t: t.sort_order),
+        )
@@ -0,0 +1,105 @@
+import json
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SnapshotMeta:
+    version: str
+    synced_at: float
+
+
+class SQLiteSnapshotStore:
+    """
+    読み取り用テーブルのスナップショットを1つのSQLiteファイルに保存する
+
+    書き込みは一時ファイルに全体を書いてから os.replace で置き換えるため、
+    読み手（他のワーカーを含む）は常に旧版か新版のどちらか完全なものを読む。
+    行はテーブルごとに取得順を保ったJSONで保持する（スキーマ変更に追従するため）。
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def read_meta(self) -> SnapshotMeta | None:
+        """保存済みスナップショットの版（なければ None）"""
+        if not os.path.exists(self.path):
+            return None
+        with self._connect(self.path) as conn:
+            return self._meta(conn)
+
+    def read(self) -> tuple[SnapshotMeta, dict[str, list[dict]]] | None:
+        """保存済みスナップショット全体（なければ None）"""
+        if not os.path.exists(self.path):
+            return None
+        with self._connect(self.path) as conn:
+            meta = self._meta(conn)
+            if meta is None:
+                return None
+            tables: dict[str, list[dict]] = {}
+            for table, data in conn.execute("SELECT table_name, data FROM snapshot_rows ORDER BY table_name, position"):
+                tables.setdefault(table, []).append(json.loads(data))
+            for (table,) in conn.execute("SELECT table_name FROM snapshot_tables"):
+                tables.setdefault(table, [])
+        return meta, tables
+
+    def write(self, version: str, tables: dict[str, list[dict]], synced_at: float | None = None) -> SnapshotMeta:
+        """スナップショットを新しい版として保存する（原子的に置き換え）"""
+        meta = SnapshotMeta(version=version, synced_at=time.time() if synced_at is None else synced_at)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}-{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            with self._connect(tmp_path) as conn:
+                conn.executescript(
+                    """
+                    CREATE TABLE snapshot_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+                    CREATE TABLE snapshot_tables (table_name TEXT PRIMARY KEY);
+                    CREATE TABLE snapshot_rows (
+                        table_name TEXT NOT NULL,
+                        position INTEGER NOT NULL,
+                        data TEXT NOT NULL,
+                        PRIMARY KEY (table_name, position)
+                    );
+                    """
+                )
+                conn.executemany(
+                    "INSERT INTO snapshot_meta (key, value) VALUES (?, ?)",
+                    [("version", meta.version), ("synced_at", repr(meta.synced_at))],
+                )
+                conn.executemany("INSERT INTO snapshot_tables (table_name) VALUES (?)", [(t,) for t in tables])
+                conn.executemany(
+                    "INSERT INTO snapshot_rows (table_name, position, data) VALUES (?, ?, ?)",
+                    (
+                        (table, position, json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+                        for table, rows in tables.items()
+                        for position, row in enumerate(rows)
+                    ),
+                )
+                conn.commit()
+            os.replace(tmp_path, self.path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return meta
+
+    @staticmethod
+    def _connect(path: str) -> closing[sqlite3.Connection]:
+        # sqlite3.Connection の with はコミットのみで閉じないため closing で包む
+        return closing(sqlite3.connect(path, timeout=5))
+
+    @staticmethod
+    def _meta(conn: sqlite3.Connection) -> SnapshotMeta | None:
+        try:
+            values = dict(conn.execute("SELECT key, value FROM snapshot_meta"))
+        except sqlite3.DatabaseError:
+            return None
+        if "version" not in values:
+            return None
+        return SnapshotMeta(version=values["version"], synced_at=float(values.get("synced_at", 0.0)))
+
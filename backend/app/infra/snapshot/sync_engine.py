@@ -0,0 +1,246 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import replace
+from typing import Any
+
+import anyio.to_thread
+
+from app.core.config import settings
+from app.infra.cache.cache_registry import CacheRegistry, cache_registry
+from app.infra.cache.invalidation import NAMESPACES, TABLE_NAMESPACES
+from app.infra.repository.query_executor import execute
+from app.infra.snapshot.snapshot import SNAPSHOT_TABLES, Snapshot, content_version
+from app.infra.snapshot.store import SQLiteSnapshotStore
+from app.infra.supabase_client import SupabaseClientProvider, supabase_provider
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotSource(ABC):
+    """スナップショットの取得元"""
+
+    @abstractmethod
+    async def fetch(self) -> dict[str, list[dict]]:
+        """SNAPSHOT_TABLES の全行を取得する"""
+
+
+class SupabaseSnapshotSource(SnapshotSource):
+    """Supabase（PostgREST）から全テーブルを並行して取得する"""
+
+    def __init__(self, provider: SupabaseClientProvider = supabase_provider, page_size: int = 1000):
+        self.provider = provider
+        self.page_size = page_size
+
+    async def fetch(self) -> dict[str, list[dict]]:
+        client = self.provider.get_repository_client()
+        results = await asyncio.gather(*(self._fetch_table(client, table) for table in SNAPSHOT_TABLES))
+        return dict(zip(SNAPSHOT_TABLES, results))
+
+    async def _fetch_table(self, client, table: str) -> list[dict]:
+        # PostgREST の最大行数を超えても取りこぼさないよう id 順にページングする
+        rows: list[dict] = []
+        start = 0
+        while True:
+            query = client.table(table).select("*").order("id").range(start, start + self.page_size - 1)
+            page = (await execute(query)).data
+            rows.extend(page)
+            if len(page) < self.page_size:
+                return rows
+            start += self.page_size
+
+
+class StaticSnapshotSource(SnapshotSource):
+    """メモリ上のテーブルを返す取得元（オフラインでの検証用）。fail を設定すると取得に失敗する"""
+
+    def __init__(self, tables: dict[str, list[dict]]):
+        self.tables = tables
+        self.fail: Exception | None = None
+        self.fetches = 0
+
+    async def fetch(self) -> dict[str, list[dict]]:
+        self.fetches += 1
+        if self.fail is not None:
+            raise self.fail
+        return {table: [dict(row) for row in self.tables.get(table, [])] for table in SNAPSHOT_TABLES}
+
+
+class SnapshotSyncEngine:
+    """
+    読み取り用テーブルをローカルのスナップショットに複製し、定期的に更新する
+
+    - 更新は取得 -> 検証 -> ファイル保存 -> 参照の差し替え（current）の順で行い、
+      読み手は常に完全な1つの版を見る。取得に失敗したら現在の版を使い続ける。
+    - 起動時は保存済みの版を読み込むため、Supabase が停止していても読み取りを返せる。
+    - 同じファイルを使う他のワーカーが interval 内に保存した版があれば、取得せずにそれを読む。
+    - キャッシュの破棄（管理API・変更通知）を受けたら debounce 秒後に取り直す。
+    - 版が変わったら、内容が変わったテーブルの名前空間だけキャッシュを破棄する。
+    """
+
+    def __init__(
+        self,
+        store: SQLiteSnapshotStore,
+        source: SnapshotSource,
+        interval: float = 60.0,
+        sync_timeout: float = 30.0,
+        debounce: float = 1.0,
+        registry: CacheRegistry = cache_registry,
+    ):
+        self.store = store
+        self.source = source
+        self.interval = interval
+        self.sync_timeout = sync_timeout
+        self.debounce = debounce
+        self.registry = registry
+        self.current: Snapshot | None = None
+        self.syncs = 0
+        self.loads = 0
+        self.failures = 0
+        self.last_error: str | None = None
+        self._lock = asyncio.Lock()
+        self._wake: asyncio.Event | None = None
+        self._requested_at: float | None = None
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """保存済みの版を読み込み、古ければ取り直してから定期更新を始める"""
+        if self._task is not None:
+            return
+        try:
+            await self._load_from_store()
+        except Exception as e:
+            logger.warning(f"Failed to load snapshot from {self.store.path}: {e!r}")
+        try:
+            await self.refresh(since=time.time() - self.interval)
+        except Exception as e:
+            self._record_failure(e)
+        self._wake = asyncio.Event()
+        self.registry.add_listener(self._on_invalidate)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        self.registry.remove_listener(self._on_invalidate)
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def request_refresh(self) -> None:
+        """次の更新を前倒しする（debounce 秒後に Supabase から取り直す）"""
+        if self._requested_at is None:
+            self._requested_at = time.time()
+        if self._wake is not None:
+            self._wake.set()
+
+    async def refresh(self, since: float) -> bool:
+        """
+        since 以降に取得された版にする（取得した場合 True）
+
+        保存済みの版が since 以降のものならそれを読み込み、なければ取得元から取り直す。
+        """
+        async with self._lock:
+            meta = await anyio.to_thread.run_sync(self.store.read_meta)
+            if meta is not None and meta.synced_at >= since:
+                if self.current is None or meta.version != self.current.version:
+                    await self._load_from_store()
+                elif meta.synced_at > self.current.synced_at:
+                    self.current = replace(self.current, synced_at=meta.synced_at)
+                return False
+
+            started = time.time()
+            tables = await asyncio.wait_for(self.source.fetch(), self.sync_timeout)
+            version = content_version(tables)
+            if self.current is not None and self.current.version == version:
+                snapshot = replace(self.current, synced_at=started)
+            else:
+                snapshot = await anyio.to_thread.run_sync(Snapshot.build, version, started, tables)
+            # 他のワーカーにも新しい版と取得時刻を知らせるため、内容が同じでも保存する
+            await anyio.to_thread.run_sync(self.store.write, version, snapshot.tables, started)
+            self._swap(snapshot)
+            self.syncs += 1
+            self.last_error = None
+            return True
+
+    def age(self) -> float | None:
+        """現在の版を取得してからの秒数"""
+        if self.current is None:
+            return None
+        return max(0.0, time.time() - self.current.synced_at)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "version": self.current.version if self.current else None,
+            "age": self.age(),
+            "syncs": self.syncs,
+            "loads": self.loads,
+            "failures": self.failures,
+            "last_error": self.last_error,
+        }
+
+    async def _load_from_store(self) -> None:
+        stored = await anyio.to_thread.run_sync(self.store.read)
+        if stored is None:
+            return
+        meta, tables = stored
+        snapshot = await anyio.to_thread.run_sync(Snapshot.build, meta.version, meta.synced_at, tables)
+        self._swap(snapshot)
+        self.loads += 1
+
+    def _swap(self, snapshot: Snapshot) -> None:
+        previous, self.current = self.current, snapshot
+        if previous is None or previous.version == snapshot.version:
+            return
+        changed = {
+            TABLE_NAMESPACES[table]
+            for table in SNAPSHOT_TABLES
+            if previous.digests.get(table) != snapshot.digests.get(table)
+        }
+        logger.info(f"Snapshot {previous.version} -> {snapshot.version} (changed: {', '.join(sorted(changed))})")
+        # 各ワーカーが自分で版を切り替えるため、他ワーカーへは通知しない
+        for namespace in sorted(changed):
+            self.registry.invalidate(namespace, notify=False)
+
+    def _on_invalidate(self, namespace: str, key: str | None) -> None:
+        if namespace in NAMESPACES:
+            self.request_refresh()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            requested, self._requested_at = self._requested_at, None
+            if requested is not None:
+                await asyncio.sleep(self.debounce)
+                since = requested
+            else:
+                since = time.time() - self.interval
+            try:
+                await self.refresh(since)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._record_failure(e)
+
+    def _record_failure(self, error: Exception) -> None:
+        self.failures += 1
+        self.last_error = repr(error)
+        if self.current is None:
+            logger.error(f"Snapshot sync failed and no snapshot is available: {error!r}")
+        else:
+            logger.warning(f"Snapshot sync failed, serving version {self.current.version} (age {self.age():.0f}s): {error!r}")
+
+
+snapshot_sync = SnapshotSyncEngine(
+    store=SQLiteSnapshotStore(settings.SNAPSHOT_PATH),
+    source=SupabaseSnapshotSource(),
+    interval=settings.SNAPSHOT_SYNC_INTERVAL,
+    sync_timeout=settings.SNAPSHOT_SYNC_TIMEOUT,
+    debounce=settings.SNAPSHOT_REFRESH_DEBOUNCE,
+)
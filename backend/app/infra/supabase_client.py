@@ -0,0 +1,131 @@
+import logging
+import threading
+from typing import TYPE_CHECKING, Union
+
+import httpx
+from postgrest import AsyncPostgrestClient
+from postgrest.constants import DEFAULT_POSTGREST_CLIENT_HEADERS
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    # supabase SDK（gotrue / storage3 / realtime を含む）は読み込みが重いため、
+    # 同期クライアントを初めて作るときまで import しない
+    from supabase import Client as SupabaseClient
+
+logger = logging.getLogger(__name__)
+
+# リポジトリが受け取るクライアント（table()/from_() を持つもの）
+PostgrestClient = Union["SupabaseClient", AsyncPostgrestClient]
+
+
+def _build_limits() -> httpx.Limits:
+    """Settingsからコネクションプールの上限を組み立てる"""
+    return httpx.Limits(
+        max_connections=settings.SUPABASE_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.SUPABASE_POOL_MAX_KEEPALIVE,
+        keepalive_expiry=settings.SUPABASE_POOL_KEEPALIVE_EXPIRY,
+    )
+
+
+def _build_timeout() -> httpx.Timeout:
+    return httpx.Timeout(settings.SUPABASE_TIMEOUT, connect=settings.SUPABASE_CONNECT_TIMEOUT)
+
+
+class PooledAsyncPostgrestClient(AsyncPostgrestClient):
+    """上限付きkeep-aliveプールを使う非同期PostgRESTクライアント"""
+
+    def create_session(self, base_url, headers, timeout) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            limits=_build_limits(),
+        )
+
+
+class SupabaseClientProvider:
+    """
+    ワーカープロセスごとに1つだけSupabaseクライアントを保持する
+
+    PostgRESTのHTTPセッションをkeep-alive付きの上限ありプールに差し替え、
+    リクエスト間でTCP/TLS接続を再利用する。クライアントは初回利用時に生成し、
+    アプリケーション終了時（lifespan）に aclose() で破棄する。
+    """
+
+    def __init__(self):
+        self._client: "SupabaseClient | None" = None
+        self._async_client: AsyncPostgrestClient | None = None
+        self._lock = threading.Lock()
+
+    def get_client(self) -> "SupabaseClient":
+        """プール済みSupabaseクライアント取得（同期）"""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._create_client()
+        return self._client
+
+    def get_async_client(self) -> AsyncPostgrestClient:
+        """プール済みPostgRESTクライアント取得（非同期）"""
+        if self._async_client is None:
+            with self._lock:
+                if self._async_client is None:
+                    self._async_client = self._create_async_client()
+        return self._async_client
+
+    def get_repository_client(self) -> PostgrestClient:
+        """SUPABASE_REPOSITORY_MODE に応じたリポジトリ用クライアント取得"""
+        if settings.SUPABASE_REPOSITORY_MODE == "thread":
+            return self.get_client()
+        return self.get_async_client()
+
+    def _create_client(self) -> "SupabaseClient":
+        from postgrest.utils import SyncClient
+        from supabase import create_client
+        from supabase.lib.client_options import ClientOptions
+
+        client = create_client(
+            settings.SUPABASE_URL,
+            settings.SUPABASE_KEY,
+            options=ClientOptions(postgrest_client_timeout=_build_timeout()),
+        )
+        # 既定のセッションはプール設定を持たないため、同じヘッダーで作り直す
+        default_session = client.postgrest.session
+        client.postgrest.session = SyncClient(
+            base_url=default_session.base_url,
+            headers=default_session.headers,
+            timeout=_build_timeout(),
+            limits=_build_limits(),
+        )
+        default_session.close()
+        logger.info("Supabase client created (pool max=%s)", settings.SUPABASE_POOL_MAX_CONNECTIONS)
+        return client
+
+    def _create_async_client(self) -> AsyncPostgrestClient:
+        client = PooledAsyncPostgrestClient(
+            f"{settings.SUPABASE_URL}/rest/v1",
+            headers={
+                **DEFAULT_POSTGREST_CLIENT_HEADERS,
+                "apiKey": settings.SUPABASE_KEY,
+            },
+            timeout=_build_timeout(),
+        )
+        client.auth(token=settings.SUPABASE_KEY)
+        logger.info("Async PostgREST client created (pool max=%s)", settings.SUPABASE_POOL_MAX_CONNECTIONS)
+        return client
+
+    async def aclose(self) -> None:
+        """HTTPコネクションプールを閉じる"""
+        with self._lock:
+            client, self._client = self._client, None
+            async_client, self._async_client = self._async_client, None
+        if client is not None:
+            client.postgrest.aclose()
+        if async_client is not None:
+            await async_client.aclose()
+        if client is not None or async_client is not None:
+            logger.info("Supabase clients closed")
+
+
+supabase_provider = SupabaseClientProvider()
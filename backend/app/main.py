@@ -1,16 +1,74 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+import math
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.router import works, skills, about, hero, contact
+from app.core.middleware import MetricsMiddleware
+from app.core.responses import FastJSONResponse
+from app.core.warmup import warm_up
+from app.infra.resilience import UpstreamUnavailableError
+from app.infra.supabase_client import supabase_provider
+from app.infra.cache.change_feed import build_change_feed
+from app.infra.cache.coherence import build_invalidation_bus
+from app.infra.snapshot.sync_engine import snapshot_sync
+from app.services.email import email_outbox, smtp_pool
+from app.router import works, skills, about, hero, portfolio, contact, cache, metrics
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    ワーカーの起動・終了処理
+
+    起動処理が終わるまでワーカーは接続を受け付けないため、ウォームアップはここで行う。
+    終了時（gunicornのSIGTERMを含む）は、送信待ちメールを送り切ってから
+    SMTP・Supabaseのコネクションプールを閉じる。
+    """
+    # 前回送り切れなかったメールも含めて送信ワーカーを起動
+    await email_outbox.start()
+    # ワーカー間のキャッシュ破棄共有（CACHE_COHERENCE_PATH のときのみ）
+    invalidation_bus = build_invalidation_bus()
+    if invalidation_bus is not None:
+        await invalidation_bus.start()
+    # Supabaseの変更通知でキャッシュを破棄（CHANGE_FEED_ENABLED のときのみ）
+    change_feed = build_change_feed()
+    if change_feed is not None:
+        change_feed.start()
+    # 読み取り用スナップショットを読み込み、定期更新を始める（SNAPSHOT_ENABLED のときのみ）
+    if settings.SNAPSHOT_ENABLED:
+        await snapshot_sync.start()
+    # 接続を受け付ける前にキャッシュとコネクションプールを温める（STARTUP_WARMUP のときのみ）
+    if settings.STARTUP_WARMUP:
+        await warm_up(app)
+    yield
+    if settings.SNAPSHOT_ENABLED:
+        await snapshot_sync.stop()
+    if change_feed is not None:
+        await change_feed.stop()
+    if invalidation_bus is not None:
+        await invalidation_bus.stop()
+    await email_outbox.stop(timeout=settings.EMAIL_OUTBOX_DRAIN_TIMEOUT)
+    await smtp_pool.close()
+    # 共有コネクションプールを閉じる
+    await supabase_provider.aclose()
 
 
 app = FastAPI(
     title="Portfolio API",
     description="ポートフォリオサイト用のRESTful API（Clean Architecture）",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
+# レスポンス圧縮（スナップショットは事前圧縮済みのため対象外）
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE)
+
 # CORSミドルウェアの設定
 if settings.BACKEND_CORS_ORIGINS:
     app.add_middleware(
@@ -19,8 +77,19 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag", "Link", "X-Next-Cursor", "Server-Timing"],
     )
 
+# リクエスト計測（CORSのプリフライトも含めるため最も外側に置く）
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, server_timing=settings.SERVER_TIMING_ENABLED)
+
+# Supabaseを利用できない（サーキットオープン・期限切れ）ときは 503 を返す
+@app.exception_handler(UpstreamUnavailableError)
+async def upstream_unavailable_handler(request: Request, exc: UpstreamUnavailableError):
+    headers = {"Retry-After": str(math.ceil(exc.retry_after))} if exc.retry_after else None
+    return FastJSONResponse(status_code=503, content={"detail": "Upstream is temporarily unavailable"}, headers=headers)
+
 # ルートAPIエンドポイント（ヘルスチェック）
 @app.get("/")
 def read_root():
@@ -35,4 +104,8 @@ app.include_router(works.router, prefix=settings.API_PREFIX)
 app.include_router(skills.router, prefix=settings.API_PREFIX)
 app.include_router(about.router, prefix=settings.API_PREFIX)
 app.include_router(hero.router, prefix=settings.API_PREFIX)
+app.include_router(portfolio.router, prefix=settings.API_PREFIX)
 app.include_router(contact.router, prefix=settings.API_PREFIX)
+app.include_router(cache.router, prefix=settings.API_PREFIX)
+if settings.METRICS_ENABLED:
+    app.include_router(metrics.router)
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Depends, HTTPException
+from app.dependencies.admin_auth import verify_admin_token
+from app.domain.entity.cache import CacheInvalidationRequest, CacheInvalidationResponse
+from app.infra.cache.cache_registry import cache_registry
+from app.infra.cache.invalidation import invalidate_target, parse_target
+
+router = APIRouter(prefix="/cache", tags=["cache"])
+
+
+@router.get("/stats", dependencies=[Depends(verify_admin_token)])
+async def get_cache_stats():
+    """キャッシュのヒット/ミス統計取得"""
+    return cache_registry.stats()
+
+
+@router.post(
+    "/invalidate",
+    response_model=CacheInvalidationResponse,
+    dependencies=[Depends(verify_admin_token)],
+)
+async def invalidate_cache(request: CacheInvalidationRequest):
+    """キャッシュ破棄（"*" / "works" / "works:<id>" 形式で指定）"""
+    targets = [target.strip() for target in request.targets]
+    # 1件でも不正な指定があれば何も破棄しない
+    for target in targets:
+        try:
+            parse_target(target)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    for target in targets:
+        invalidate_target(target)
+    return CacheInvalidationResponse(invalidated=targets)
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from app.core.config import settings
 from app.usecase.contact_usecase import ContactUseCase
 from app.domain.entity.contact import ContactRequest, ContactResponse
 from app.dependencies.dependency_injector import get_contact_usecase
@@ -6,10 +7,21 @@ from app.dependencies.dependency_injector import get_contact_usecase
 router = APIRouter(prefix="/contact", tags=["contact"])
 
 
+def _client_ip(request: Request) -> str:
+    """流量制限に使うクライアントIP"""
+    if settings.TRUST_FORWARDED_FOR:
+        # 信頼できるプロキシが末尾に追記したアドレスを使う
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.rsplit(",", 1)[-1].strip()
+    return request.client.host if request.client else "unknown"
+
+
 @router.post("", response_model=ContactResponse)
 async def send_contact(
     contact: ContactRequest,
+    request: Request,
     usecase: ContactUseCase = Depends(get_contact_usecase)
 ):
     """お問い合わせ送信"""
-    return await usecase.send_contact_email(contact)
+    return await usecase.send_contact_email(contact, client_ip=_client_ip(request))
@@ -1,21 +1,19 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from app.usecase.hero_usecase import HeroUseCase
 from app.domain.entity.hero import HeroIntroduction, TimelineItem
 from app.dependencies.dependency_injector import get_hero_usecase
+from app.core.http_cache import snapshot_response
 
 router = APIRouter(prefix="/hero", tags=["hero"])
 
 
 @router.get("/introduction", response_model=HeroIntroduction)
-async def get_hero_introduction(usecase: HeroUseCase = Depends(get_hero_usecase)):
-    """ヒーロー自己紹介取得"""
-    intro = await usecase.get_introduction()
-    if not intro:
-        return {"id": 0, "introduction_text": ""}
-    return intro
+async def get_hero_introduction(request: Request, usecase: HeroUseCase = Depends(get_hero_usecase)):
+    """ヒーロー自己紹介取得（未登録なら404）"""
+    return await snapshot_response(request, "hero_introduction", "hero", usecase.get_introduction)
 
 
 @router.get("/timeline", response_model=list[TimelineItem])
-async def get_timeline(usecase: HeroUseCase = Depends(get_hero_usecase)):
+async def get_timeline(request: Request, usecase: HeroUseCase = Depends(get_hero_usecase)):
     """タイムライン取得"""
-    return await usecase.get_timeline()
+    return await snapshot_response(request, "hero_timeline", "hero", usecase.get_timeline)
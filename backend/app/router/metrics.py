@@ -0,0 +1,116 @@
+import secrets
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+from app.infra.cache.cache_registry import cache_registry
+from app.infra.ratelimit.contact_guard import contact_guard
+from app.infra.repository.query_executor import supabase_breaker, upstream_policy
+from app.infra.search.work_search_index import work_search_index
+from app.infra.snapshot.sync_engine import snapshot_sync
+from app.services.email import email_outbox
+
+router = APIRouter(tags=["metrics"])
+
+# charset は PlainTextResponse が付与する
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+
+def _cache_metrics():
+    """キャッシュ統計（/cache/stats と同じ値）"""
+    stats = cache_registry.stats()
+    requests, entries, ratios, evictions = [], [], [], []
+    for name, s in stats.items():
+        for result, field in (("hit", "hits"), ("stale", "stale_hits"), ("miss", "misses"), ("coalesced", "coalesced")):
+            requests.append(("cache_requests_total", {"cache": name, "result": result}, s[field]))
+        entries.append(("cache_entries", {"cache": name}, s["entries"]))
+        ratios.append(("cache_hit_ratio", {"cache": name}, s["hit_ratio"]))
+        evictions.append(("cache_evictions_total", {"cache": name}, s["evictions"]))
+    return [
+        ("cache_requests_total", "counter", "Cache lookups by result", requests),
+        ("cache_entries", "gauge", "Entries currently held", entries),
+        ("cache_hit_ratio", "gauge", "Fresh and stale hits divided by all lookups", ratios),
+        ("cache_evictions_total", "counter", "Entries evicted by the LRU limit", evictions),
+    ]
+
+
+def _email_metrics():
+    """メール送信キューの状態"""
+    stats = email_outbox.stats()
+    depth = [("email_outbox_depth", {"state": state}, stats[state]) for state in ("queued", "scheduled", "in_flight")]
+    return [
+        ("email_outbox_depth", "gauge", "Emails waiting in the outbox by state", depth),
+        ("email_outbox_sent_total", "counter", "Emails delivered", [("email_outbox_sent_total", {}, stats["sent"])]),
+        ("email_outbox_failed_attempts_total", "counter", "Failed delivery attempts", [("email_outbox_failed_attempts_total", {}, stats["failed_attempts"])]),
+        ("email_outbox_dead_total", "counter", "Emails given up after max attempts", [("email_outbox_dead_total", {}, stats["dead"])]),
+    ]
+
+
+def _contact_metrics():
+    """お問い合わせの流量制限"""
+    stats = contact_guard.stats()
+    return [
+        ("contact_rejected_total", "counter", "Contact submissions rejected by rate limits", [("contact_rejected_total", {}, stats["rejected"])]),
+        ("contact_duplicates_total", "counter", "Duplicate contact submissions ignored", [("contact_duplicates_total", {}, stats["duplicates"])]),
+    ]
+
+
+def _upstream_metrics():
+    """Supabaseへの問い合わせの再試行・ヘッジ・サーキットブレーカー"""
+    stats = upstream_policy.stats()
+    breaker = supabase_breaker.stats()
+    states = [("upstream_circuit_state", {"state": state}, int(breaker["state"] == state)) for state in ("closed", "open", "half_open")]
+    return [
+        ("upstream_circuit_state", "gauge", "Circuit breaker state (1 for the current state)", states),
+        ("upstream_circuit_opened_total", "counter", "Times the circuit breaker opened", [("upstream_circuit_opened_total", {}, breaker["opened"])]),
+        ("upstream_circuit_rejected_total", "counter", "Calls failed fast while the circuit was open", [("upstream_circuit_rejected_total", {}, breaker["rejected"])]),
+        ("upstream_retries_total", "counter", "Read attempts retried after a transient failure", [("upstream_retries_total", {}, stats["retried"])]),
+        ("upstream_hedged_total", "counter", "Hedged read requests sent", [("upstream_hedged_total", {}, stats["hedged"])]),
+        ("upstream_hedge_wins_total", "counter", "Hedged requests that answered first", [("upstream_hedge_wins_total", {}, stats["hedge_wins"])]),
+        ("upstream_gave_up_total", "counter", "Calls that failed after retries or the deadline", [("upstream_gave_up_total", {}, stats["gave_up"])]),
+    ]
+
+
+def _search_metrics():
+    """作品検索の索引"""
+    stats = work_search_index.stats()
+    return [
+        ("work_search_documents", "gauge", "Works in the search index", [("work_search_documents", {}, stats["documents"])]),
+        ("work_search_terms", "gauge", "Distinct terms in the search index", [("work_search_terms", {}, stats["terms"])]),
+        ("work_search_reindexed_total", "counter", "Works (re)indexed after a content change", [("work_search_reindexed_total", {}, stats["reindexed"])]),
+        ("work_search_queries_total", "counter", "Search queries served", [("work_search_queries_total", {}, stats["queries"])]),
+    ]
+
+
+def _snapshot_metrics():
+    """読み取り用スナップショットの鮮度と同期結果（SNAPSHOT_ENABLED のときのみ）"""
+    if not settings.SNAPSHOT_ENABLED:
+        return []
+    stats = snapshot_sync.stats()
+    age = stats["age"] if stats["age"] is not None else -1
+    return [
+        ("snapshot_age_seconds", "gauge", "Seconds since the served snapshot was fetched (-1 before the first one)", [("snapshot_age_seconds", {}, age)]),
+        ("snapshot_syncs_total", "counter", "Snapshots fetched from Supabase", [("snapshot_syncs_total", {}, stats["syncs"])]),
+        ("snapshot_loads_total", "counter", "Snapshots loaded from the local file", [("snapshot_loads_total", {}, stats["loads"])]),
+        ("snapshot_sync_failures_total", "counter", "Failed snapshot syncs", [("snapshot_sync_failures_total", {}, stats["failures"])]),
+    ]
+
+
+metrics_registry.add_collector(_cache_metrics)
+metrics_registry.add_collector(_email_metrics)
+metrics_registry.add_collector(_contact_metrics)
+metrics_registry.add_collector(_upstream_metrics)
+metrics_registry.add_collector(_search_metrics)
+metrics_registry.add_collector(_snapshot_metrics)
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics(authorization: str | None = Header(default=None)):
+    """Prometheus形式のメトリクス取得（METRICS_TOKEN 設定時はBearer認証）"""
+    if settings.METRICS_TOKEN:
+        expected = f"Bearer {settings.METRICS_TOKEN}"
+        if authorization is None or not secrets.compare_digest(authorization.encode(), expected.encode()):
+            raise HTTPException(status_code=401, detail="Invalid metrics token", headers={"WWW-Authenticate": "Bearer"})
+    return PlainTextResponse(metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, Query, Request
+from app.usecase.portfolio_usecase import PortfolioUseCase
+from app.domain.entity.portfolio import PortfolioResponse
+from app.dependencies.dependency_injector import get_portfolio_usecase
+from app.core.http_cache import ResponseSnapshot, snapshot_response
+
+router = APIRouter(prefix="/portfolio", tags=["portfolio"])
+
+
+@router.get("", response_model=PortfolioResponse, response_model_exclude_unset=True)
+async def get_portfolio(
+    request: Request,
+    fields: str | None = Query(
+        None, description="返すセクション（カンマ区切り: introduction,timeline,skills,skill_categories,works,about）"
+    ),
+    usecase: PortfolioUseCase = Depends(get_portfolio_usecase),
+):
+    """トップページ初回表示用のデータを1リクエストでまとめて取得"""
+    sections = usecase.parse_sections([f.strip() for f in fields.split(",") if f.strip()] if fields else None)
+
+    async def build():
+        portfolio = await usecase.get_portfolio(sections)
+        return ResponseSnapshot.from_content(portfolio.dict(exclude_unset=True), degraded=portfolio.degraded)
+
+    return await snapshot_response(request, "portfolio", "portfolio", build, key=f"sections:{','.join(sections)}")
@@ -1,18 +1,27 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
 from app.usecase.skill_usecase import SkillUseCase
 from app.domain.entity.skill import Skill
 from app.dependencies.dependency_injector import get_skill_usecase
+from app.core.http_cache import snapshot_response
 
 router = APIRouter(prefix="/skills", tags=["skills"])
 
 
 @router.get("", response_model=list[Skill])
-async def get_all_skills(usecase: SkillUseCase = Depends(get_skill_usecase)):
-    """全スキル取得"""
-    return await usecase.get_all_skills()
+async def get_all_skills(
+    request: Request,
+    category: str | None = Query(None, description="カテゴリで絞り込み"),
+    usecase: SkillUseCase = Depends(get_skill_usecase),
+):
+    """全スキル取得（category 指定時はカテゴリ別）"""
+    if category:
+        return await snapshot_response(
+            request, "skills", "skills", lambda: usecase.get_skills_by_category(category), key=f"category:{category}"
+        )
+    return await snapshot_response(request, "skills", "skills", usecase.get_all_skills)
 
 
 @router.get("/categories", response_model=list[str])
-async def get_skill_categories(usecase: SkillUseCase = Depends(get_skill_usecase)):
+async def get_skill_categories(request: Request, usecase: SkillUseCase = Depends(get_skill_usecase)):
     """カテゴリ一覧取得"""
-    return await usecase.get_categories()
+    return await snapshot_response(request, "skill_categories", "skills", usecase.get_categories)
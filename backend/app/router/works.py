@@ -1,18 +1,73 @@
-from fastapi import APIRouter, Depends
+from typing import Union
+
+from fastapi import APIRouter, Depends, Query, Request
 from app.usecase.work_usecase import WorkUseCase
-from app.domain.entity.work import Work
+from app.domain.entity.work import (
+    Work, WorkBatchRequest, WorkBatchResponse, WorkProjection, WorkQuery, WorkSearchResponse,
+)
 from app.dependencies.dependency_injector import get_work_usecase
+from app.core.http_cache import ResponseSnapshot, snapshot_response
+from app.core.responses import FastJSONResponse
 
 router = APIRouter(prefix="/works", tags=["works"])
 
 
-@router.get("", response_model=list[Work])
-async def get_all_works(usecase: WorkUseCase = Depends(get_work_usecase)):
-    """全作品取得"""
-    return await usecase.get_all_works()
+# fields 指定時は指定した項目だけを持つ WorkProjection の一覧
+@router.get("", response_model=Union[list[Work], list[WorkProjection]])
+async def get_all_works(
+    request: Request,
+    limit: int | None = Query(None, ge=1, le=100, description="1ページの件数（指定時はカーソルページング）"),
+    cursor: str | None = Query(None, description="前ページの X-Next-Cursor"),
+    fields: str | None = Query(None, description="返す項目（カンマ区切り）"),
+    category: str | None = Query(None, description="カテゴリで絞り込み"),
+    technology: str | None = Query(None, description="使用技術で絞り込み"),
+    usecase: WorkUseCase = Depends(get_work_usecase),
+):
+    """全作品取得（条件指定時は次ページを X-Next-Cursor / Link ヘッダーで返す。fields 指定時は指定項目のみ）"""
+    if not any((limit, cursor, fields, category, technology)):
+        return await snapshot_response(request, "works", "works", usecase.get_all_works)
+
+    query = WorkQuery(
+        limit=limit,
+        cursor=cursor,
+        fields=[f.strip() for f in fields.split(",") if f.strip()] if fields else None,
+        category=category,
+        technology=technology,
+    )
+
+    async def build() -> ResponseSnapshot:
+        page = await usecase.get_works_page(query)
+        headers = {}
+        if page.next_cursor:
+            next_url = request.url.include_query_params(cursor=page.next_cursor)
+            headers["X-Next-Cursor"] = page.next_cursor
+            headers["Link"] = f'<{next_url.path}?{next_url.query}>; rel="next"'
+        return ResponseSnapshot.from_content(page.items, headers)
+
+    return await snapshot_response(request, "works", "works", build, key=f"page:{query.json()}")
+
+
+@router.get("/search", response_model=WorkSearchResponse)
+async def search_works(
+    q: str = Query(..., min_length=1, max_length=200, description="検索語（日本語は2文字単位、英数字の単語は前方一致も使う）"),
+    limit: int = Query(20, ge=1, le=100, description="返す件数"),
+    usecase: WorkUseCase = Depends(get_work_usecase),
+):
+    """作品の全文検索（タイトル・説明・学び・担当・使用技術。関連度順）"""
+    # 検証済みの作品から組み立てるため、response_model での再検証・jsonable_encoder を省く
+    return FastJSONResponse(await usecase.search_works(q, limit))
+
+
+@router.post(":batchGet", response_model=WorkBatchResponse)
+async def batch_get_works(body: WorkBatchRequest, usecase: WorkUseCase = Depends(get_work_usecase)):
+    """作品の一括取得（1回の問い合わせで取得し、リクエスト順に返す）"""
+    # 検証済みの作品から組み立てるため、response_model での再検証・jsonable_encoder を省く
+    return FastJSONResponse(await usecase.get_works_by_ids(body.ids))
 
 
 @router.get("/{work_id}", response_model=Work)
-async def get_work_by_id(work_id: str, usecase: WorkUseCase = Depends(get_work_usecase)):
+async def get_work_by_id(request: Request, work_id: str, usecase: WorkUseCase = Depends(get_work_usecase)):
     """作品詳細取得"""
-    return await usecase.get_work_by_id(work_id)
+    return await snapshot_response(
+        request, "work_detail", "works", lambda: usecase.get_work_by_id(work_id), key=f"work_detail:{work_id}"
+    )
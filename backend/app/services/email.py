@@ -1,14 +1,52 @@
 import logging
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
 from typing import Dict, Any
 
 from app.core.config import settings
+from app.services.outbox import EmailOutbox, OutboxMessage, SQLiteSpool
+from app.services.smtp_pool import SMTPConnectionPool
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+smtp_pool = SMTPConnectionPool(
+    host=settings.SMTP_HOST,
+    port=settings.SMTP_PORT,
+    use_tls=settings.SMTP_TLS,
+    user=settings.SMTP_USER,
+    password=settings.SMTP_PASSWORD,
+    size=settings.SMTP_POOL_SIZE,
+    timeout=settings.SMTP_TIMEOUT,
+    idle_timeout=settings.SMTP_IDLE_TIMEOUT,
+)
+
+
+def _build_message(email_to: str, subject: str, html_content: str) -> str:
+    # email.mime は送信時まで読み込まない（起動時間短縮）
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+
+    message = MIMEMultipart()
+    message["From"] = f"{settings.EMAILS_FROM_NAME} <{settings.EMAILS_FROM_EMAIL}>"
+    message["To"] = email_to
+    message["Subject"] = subject
+    message.attach(MIMEText(html_content, "html"))
+    return message.as_string()
+
+
+async def deliver_email(email_to: str, subject: str, html_content: str) -> None:
+    """
+    SMTPで1通送信する（失敗時は例外）
+
+    接続はプールから再利用し、ブロッキングな smtplib はスレッドで実行する。
+    """
+    if not settings.EMAILS_ENABLED:
+        logger.info(f"Would send email: {subject} to {email_to}")
+        logger.info(f"Content: {html_content}")
+        return
+
+    await smtp_pool.send(settings.EMAILS_FROM_EMAIL, [email_to], _build_message(email_to, subject, html_content))
+    logger.info(f"Email sent successfully to {email_to}")
+
 
 async def send_email(
     email_to: str,
@@ -16,38 +54,34 @@ async def send_email(
     html_content: str,
     environment: Dict[str, Any] = {},
 ) -> bool:
-    if not settings.EMAILS_ENABLED:
-        logger.info(f"Would send email: {subject} to {email_to}")
-        logger.info(f"Content: {html_content}")
-        return True
-
+    """メールを同期的に（送信完了まで待って）送る"""
     try:
-        message = MIMEMultipart()
-        message["From"] = f"{settings.EMAILS_FROM_NAME} <{settings.EMAILS_FROM_EMAIL}>"
-        message["To"] = email_to
-        message["Subject"] = subject
-        message.attach(MIMEText(html_content, "html"))
-
-        with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT) as server:
-            if settings.SMTP_TLS:
-                server.starttls()
-            if settings.SMTP_USER and settings.SMTP_PASSWORD:
-                server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-            server.sendmail(
-                settings.EMAILS_FROM_EMAIL, email_to, message.as_string()
-            )
-
-        logger.info(f"Email sent successfully to {email_to}")
+        await deliver_email(email_to, subject, html_content)
         return True
-
     except Exception as e:
         logger.error(f"Failed to send email to {email_to}: {e}")
         return False
 
 
+async def _deliver_outbox_message(message: OutboxMessage) -> None:
+    await deliver_email(message.email_to, message.subject, message.html_content)
+
+
+email_outbox = EmailOutbox(
+    spool=SQLiteSpool(settings.EMAIL_OUTBOX_PATH),
+    deliver=_deliver_outbox_message,
+    workers=settings.EMAIL_OUTBOX_WORKERS,
+    max_attempts=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+    retry_base=settings.EMAIL_OUTBOX_RETRY_BASE,
+    retry_max=settings.EMAIL_OUTBOX_RETRY_MAX,
+)
+
+
 async def send_contact_email(contact) -> bool:
     """
-    問い合わせメールを管理者に送信する
+    問い合わせメールを管理者宛の送信キューに入れる
+
+    スプールへの保存が済んだ時点で返り、送信はアウトボックスのワーカーが行う。
     """
     html_content = f"""
     <h2>ポートフォリオサイトからの問い合わせ</h2>
@@ -57,8 +91,9 @@ async def send_contact_email(contact) -> bool:
     <p>{contact.message}</p>
     """
 
-    return await send_email(
-        email_to=settings.EMAIL_RECIPIENT,
+    await email_outbox.enqueue(
+        email_to=settings.EMAIL_RECIPIENT or "",
         subject=f"ポートフォリオサイトからの問い合わせ: {contact.name}様",
         html_content=html_content,
     )
+    return True
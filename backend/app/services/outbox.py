@@ -0,0 +1,286 @@
+import asyncio
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+import anyio.to_thread
+from anyio import CapacityLimiter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OutboxMessage:
+    id: str
+    email_to: str
+    subject: str
+    html_content: str
+    attempts: int = 0
+
+
+Deliver = Callable[[OutboxMessage], Awaitable[None]]
+
+
+class SQLiteSpool:
+    """
+    アウトボックスの永続化先（SQLite）
+
+    受け付けたメッセージは送信完了まで行として残るため、再起動後も再送される。
+    複数プロセスで同じファイルを共有しても、送信前に claim() で行をリースして
+    二重送信を防ぐ。
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS outbox (
+                    id TEXT PRIMARY KEY,
+                    email_to TEXT NOT NULL,
+                    subject TEXT NOT NULL,
+                    html_content TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    next_attempt_at REAL NOT NULL,
+                    lease_until REAL NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn = conn
+        return self._conn
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        with self._lock:
+            return self._connection().execute(sql, params)
+
+    def add(self, message: OutboxMessage) -> None:
+        now = time.time()
+        self._execute(
+            "INSERT INTO outbox (id, email_to, subject, html_content, attempts, next_attempt_at, created_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (message.id, message.email_to, message.subject, message.html_content, message.attempts, now, now),
+        )
+
+    def pending(self) -> list[tuple[OutboxMessage, float]]:
+        """未送信のメッセージと次回送信時刻（UNIX時刻。送信中のリースが切れるまでは待つ）"""
+        rows = self._execute(
+            "SELECT id, email_to, subject, html_content, attempts, MAX(next_attempt_at, lease_until)"
+            " FROM outbox WHERE status = 'pending' ORDER BY created_at"
+        ).fetchall()
+        return [(OutboxMessage(*row[:5]), row[5]) for row in rows]
+
+    def claim(self, message_id: str, lease_seconds: float) -> bool:
+        """送信前に行をリースする（他プロセスが送信中・送信済みなら False）"""
+        now = time.time()
+        cursor = self._execute(
+            "UPDATE outbox SET lease_until = ?"
+            " WHERE id = ? AND status = 'pending' AND lease_until <= ? AND next_attempt_at <= ?",
+            (now + lease_seconds, message_id, now, now + 1),
+        )
+        return cursor.rowcount == 1
+
+    def remove(self, message_id: str) -> None:
+        self._execute("DELETE FROM outbox WHERE id = ?", (message_id,))
+
+    def reschedule(self, message: OutboxMessage, next_attempt_at: float, error: str) -> None:
+        self._execute(
+            "UPDATE outbox SET attempts = ?, next_attempt_at = ?, lease_until = 0, last_error = ? WHERE id = ?",
+            (message.attempts, next_attempt_at, error, message.id),
+        )
+
+    def mark_dead(self, message: OutboxMessage, error: str) -> None:
+        """再試行上限に達したメッセージは削除せず dead として残す"""
+        self._execute(
+            "UPDATE outbox SET attempts = ?, status = 'dead', lease_until = 0, last_error = ? WHERE id = ?",
+            (message.attempts, error, message.id),
+        )
+
+    def counts(self) -> dict[str, int]:
+        rows = self._execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class EmailOutbox:
+    """
+    メール送信のアウトボックス
+
+    enqueue() はスプールへの書き込みだけ行って返り、実際の送信はワーカータスクが
+    行う。失敗したメッセージは指数バックオフ（ジッター付き）で max_attempts 回まで
+    再試行する。送信成功後にスプールから消すため、配送は at-least-once になる。
+    """
+
+    def __init__(
+        self,
+        spool: SQLiteSpool,
+        deliver: Deliver,
+        workers: int = 2,
+        max_attempts: int = 5,
+        retry_base: float = 2.0,
+        retry_max: float = 300.0,
+        lease_seconds: float = 60.0,
+    ):
+        self.spool = spool
+        self.deliver = deliver
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.lease_seconds = lease_seconds
+        self.sent = 0
+        self.failed_attempts = 0
+        self.dead = 0
+        self._queue: asyncio.Queue[OutboxMessage] | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._in_flight = 0
+        self._start_lock: asyncio.Lock | None = None
+        # SQLiteへの書き込みは1本のスレッドに直列化する
+        self._spool_limiter: CapacityLimiter | None = None
+
+    @property
+    def started(self) -> bool:
+        return bool(self._tasks)
+
+    async def _spool(self, func, *args) -> Any:
+        if self._spool_limiter is None:
+            self._spool_limiter = CapacityLimiter(1)
+        return await anyio.to_thread.run_sync(func, *args, limiter=self._spool_limiter)
+
+    async def start(self) -> None:
+        """ワーカーを起動し、スプールに残っている未送信メッセージを再投入する"""
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self.started:
+                return
+            self._queue = asyncio.Queue()
+            now = time.time()
+            pending = await self._spool(self.spool.pending)
+            for message, next_attempt_at in pending:
+                self._schedule(message, max(0.0, next_attempt_at - now))
+            if pending:
+                logger.info(f"Recovered {len(pending)} pending email(s) from outbox spool")
+            self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def enqueue(self, email_to: str, subject: str, html_content: str) -> OutboxMessage:
+        """メッセージをスプールに保存して送信待ちにする（送信完了は待たない）"""
+        if not self.started:
+            await self.start()
+        message = OutboxMessage(id=uuid.uuid4().hex, email_to=email_to, subject=subject, html_content=html_content)
+        await self._spool(self.spool.add, message)
+        self._queue.put_nowait(message)
+        return message
+
+    def _schedule(self, message: OutboxMessage, delay: float) -> None:
+        if delay <= 0:
+            self._queue.put_nowait(message)
+            return
+        loop = asyncio.get_running_loop()
+        self._timers[message.id] = loop.call_later(delay, self._release, message)
+
+    def _release(self, message: OutboxMessage) -> None:
+        self._timers.pop(message.id, None)
+        self._queue.put_nowait(message)
+
+    def _backoff(self, attempts: int) -> float:
+        delay = min(self.retry_max, self.retry_base * 2 ** (attempts - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _worker(self) -> None:
+        while True:
+            message = await self._queue.get()
+            self._in_flight += 1
+            try:
+                await self._process(message)
+            except Exception as e:
+                # スプール操作の失敗などでワーカーを止めない（行は残るので次回起動時に再送）
+                logger.error(f"Outbox worker error for {message.id}: {e!r}")
+            finally:
+                self._in_flight -= 1
+                self._queue.task_done()
+
+    async def _process(self, message: OutboxMessage) -> None:
+        if not await self._spool(self.spool.claim, message.id, self.lease_seconds):
+            return
+        try:
+            await self.deliver(message)
+        except Exception as e:
+            message.attempts += 1
+            self.failed_attempts += 1
+            error = repr(e)
+            if message.attempts >= self.max_attempts:
+                self.dead += 1
+                logger.error(f"Giving up on email {message.id} to {message.email_to} after {message.attempts} attempts: {error}")
+                await self._spool(self.spool.mark_dead, message, error)
+                return
+            delay = self._backoff(message.attempts)
+            logger.warning(f"Email {message.id} failed (attempt {message.attempts}), retrying in {delay:.1f}s: {error}")
+            await self._spool(self.spool.reschedule, message, time.time() + delay, error)
+            self._schedule(message, delay)
+            return
+        self.sent += 1
+        await self._spool(self.spool.remove, message.id)
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        キュー済みのメッセージを timeout 秒まで送り切ってからワーカーを止める
+
+        送り切れなかったもの・再試行待ちのものはスプールに残り、次回起動時に再送される。
+        """
+        if not self.started:
+            return
+        self._cancel_timers()
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Outbox stop timed out with {self._queue.qsize()} email(s) still queued")
+        # 送り切る間に失敗して再試行待ちになったものも止める
+        self._cancel_timers()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        await self._spool(self.spool.close)
+        # 次の start() は別のイベントループかもしれないので作り直させる
+        self._start_lock = None
+        self._spool_limiter = None
+
+    def _cancel_timers(self) -> None:
+        for handle in self._timers.values():
+            handle.cancel()
+        self._timers.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "scheduled": len(self._timers),
+            "in_flight": self._in_flight,
+            "sent": self.sent,
+            "failed_attempts": self.failed_attempts,
+            "dead": self.dead,
+        }
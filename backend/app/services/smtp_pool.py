@@ -0,0 +1,146 @@
+import asyncio
+import smtplib
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+import anyio.to_thread
+from anyio import CapacityLimiter
+
+
+@dataclass
+class _Connection:
+    smtp: smtplib.SMTP
+    last_used: float = field(default_factory=time.monotonic)
+    # この接続で送信済みの通数（0なら新規接続）
+    sent: int = 0
+
+
+class SMTPConnectionPool:
+    """
+    再利用可能なSMTP接続のプール
+
+    接続・STARTTLS・ログインは接続ごとに1回だけ行い、送信後はプールに戻す。
+    smtplib はブロッキングなので、各操作は専用のスレッドプールで実行する。
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        use_tls: bool = True,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        size: int = 2,
+        timeout: float = 10.0,
+        idle_timeout: float = 60.0,
+    ):
+        self.host = host
+        self.port = port
+        self.use_tls = use_tls
+        self.user = user
+        self.password = password
+        self.size = size
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self._idle: list[_Connection] = []
+        self._slots: asyncio.Semaphore | None = None
+        self._limiter: CapacityLimiter | None = None
+        self.connects = 0
+
+    def _acquire_slot(self) -> asyncio.Semaphore:
+        # イベントループ上で初めて使われた時に作る
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.size)
+            self._limiter = CapacityLimiter(self.size)
+        return self._slots
+
+    async def _run(self, func, *args):
+        return await anyio.to_thread.run_sync(func, *args, limiter=self._limiter)
+
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            smtp.ehlo()
+            if self.use_tls:
+                smtp.starttls()
+                smtp.ehlo()
+            if self.user and self.password:
+                smtp.login(self.user, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        self.connects += 1
+        return smtp
+
+    @staticmethod
+    def _is_alive(smtp: smtplib.SMTP) -> bool:
+        try:
+            return smtp.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    @staticmethod
+    def _quit(smtp: smtplib.SMTP) -> None:
+        try:
+            smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
+
+    async def _checkout(self) -> _Connection:
+        """アイドル接続を取り出す（古い・切断済みのものは捨てて新規接続）"""
+        while self._idle:
+            conn = self._idle.pop()
+            if time.monotonic() - conn.last_used > self.idle_timeout:
+                # サーバー側のアイドル切断に備えて確認してから使う
+                if not await self._run(self._is_alive, conn.smtp):
+                    await self._run(self._quit, conn.smtp)
+                    continue
+            return conn
+        return _Connection(await self._run(self._connect))
+
+    def _checkin(self, conn: _Connection) -> None:
+        conn.last_used = time.monotonic()
+        conn.sent += 1
+        self._idle.append(conn)
+
+    async def send(self, from_addr: str, to_addrs: list[str], message: str) -> None:
+        """
+        1通送信する
+
+        使い回していた接続が切れていた場合は、新しい接続で1回だけ送り直す。
+        それ以外の失敗は例外のまま呼び出し元（アウトボックスの再試行）に返す。
+        """
+        async with self._acquire_slot():
+            conn = await self._checkout()
+            try:
+                await self._run(conn.smtp.sendmail, from_addr, to_addrs, message)
+            except smtplib.SMTPServerDisconnected:
+                conn.smtp.close()
+                if not conn.sent:
+                    raise
+                conn = _Connection(await self._run(self._connect))
+                try:
+                    await self._run(conn.smtp.sendmail, from_addr, to_addrs, message)
+                except Exception:
+                    await self._run(self._quit, conn.smtp)
+                    raise
+            except smtplib.SMTPRecipientsRefused:
+                # 宛先エラーでも接続自体は使える
+                try:
+                    await self._run(conn.smtp.rset)
+                except (smtplib.SMTPException, OSError):
+                    await self._run(self._quit, conn.smtp)
+                else:
+                    self._checkin(conn)
+                raise
+            except Exception:
+                await self._run(self._quit, conn.smtp)
+                raise
+            self._checkin(conn)
+
+    async def close(self) -> None:
+        """アイドル接続をすべて閉じる"""
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            await self._run(self._quit, conn.smtp)
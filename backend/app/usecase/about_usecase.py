@@ -1,21 +1,94 @@
+import asyncio
+import logging
+
+from fastapi import HTTPException
 from app.domain.i_repository.i_about_repository import IAboutRepository
 from app.domain.entity.about import AboutResponse
 
+logger = logging.getLogger(__name__)
+
 
 class AboutUseCase:
-    def __init__(self, repository: IAboutRepository):
+    def __init__(
+        self,
+        repository: IAboutRepository,
+        call_timeout: float | None = None,
+        use_aggregate_query: bool = False,
+    ):
         self.repository = repository
+        self.call_timeout = call_timeout
+        self.use_aggregate_query = use_aggregate_query
 
     async def get_about_data(self) -> AboutResponse:
         """プロフィール総合データ取得"""
-        about = await self.repository.get_about()
-        education = await self.repository.get_education()
-        experience = await self.repository.get_experience()
-        social_media = await self.repository.get_social_media()
+        if self.use_aggregate_query:
+            aggregate = await self._get_aggregate()
+            if aggregate is not None:
+                return self._linked(aggregate)
 
-        return AboutResponse(
+        # 4つの問い合わせを並行実行し、一覧系の失敗は空リストで補う
+        about, education, experience, social_media = await asyncio.gather(
+            self._call(self.repository.get_about()),
+            self._call(self.repository.get_education()),
+            self._call(self.repository.get_experience()),
+            self._call(self.repository.get_social_media()),
+            return_exceptions=True,
+        )
+        if isinstance(about, BaseException):
+            logger.error(f"Failed to fetch about: {about!r}")
+            raise HTTPException(status_code=503, detail="About data is temporarily unavailable")
+        if about is None:
+            raise HTTPException(status_code=404, detail="About not found")
+
+        response = AboutResponse(
             about=about,
-            education=education,
-            experience=experience,
-            social_media=social_media
+            education=self._or_empty("education", education),
+            experience=self._or_empty("experience", experience),
+            social_media=self._or_empty("social_media", social_media),
         )
+        # 空で補った結果はキャッシュさせない
+        if any(isinstance(result, BaseException) for result in (education, experience, social_media)):
+            response.mark_degraded()
+        return self._linked(response)
+
+    @staticmethod
+    def _linked(response: AboutResponse) -> AboutResponse:
+        """
+        自己紹介に紐づく（about_id が一致する）学歴・職歴・SNSだけを残す
+
+        一括取得（埋め込みリソース）は about_id で結合した行だけを返すため、
+        各テーブルを個別に取得した結果も同じ行にそろえる。
+        """
+        about_id = response.about.id
+        for name in ("education", "experience", "social_media"):
+            rows = getattr(response, name)
+            linked = [row for row in rows if row.about_id == about_id]
+            if len(linked) != len(rows):
+                setattr(response, name, linked)
+        return response
+
+    async def _get_aggregate(self) -> AboutResponse | None:
+        """一括取得を試み、未対応・失敗時は None を返す"""
+        try:
+            aggregate = await self._call(self.repository.get_about_aggregate())
+        except NotImplementedError:
+            return None
+        except Exception as e:
+            logger.warning(f"Aggregate about query failed, falling back to fan-out: {e!r}")
+            return None
+        if aggregate is None:
+            raise HTTPException(status_code=404, detail="About not found")
+        return aggregate
+
+    async def _call(self, coro):
+        """1回の問い合わせにタイムアウトを適用"""
+        if self.call_timeout is None:
+            return await coro
+        return await asyncio.wait_for(coro, self.call_timeout)
+
+    @staticmethod
+    def _or_empty(name: str, result) -> list:
+        if isinstance(result, BaseException):
+            logger.warning(f"Failed to fetch {name}, returning empty list: {result!r}")
+            return []
+        return result
@@ -1,15 +1,35 @@
 from fastapi import HTTPException
 from app.domain.i_repository.i_contact_repository import IContactRepository
 from app.domain.entity.contact import ContactRequest, ContactResponse
+from app.domain.i_repository.i_contact_intake_guard import IContactIntakeGuard
+
+ACCEPTED_MESSAGE = "お問い合わせを受け付けました"
 
 
 class ContactUseCase:
-    def __init__(self, repository: IContactRepository):
+    def __init__(self, repository: IContactRepository, guard: IContactIntakeGuard | None = None):
         self.repository = repository
+        self.guard = guard
+
+    async def send_contact_email(self, contact: ContactRequest, client_ip: str = "unknown") -> ContactResponse:
+        """お問い合わせメール送信（送信キューに登録した時点で返す）"""
+        decision = None
+        if self.guard is not None:
+            # 流量制限・重複判定はメモリ上だけで行い、送信処理より前に弾く
+            decision = self.guard.check(client_ip, contact)
+            if decision.duplicate:
+                # 二重送信は受付済みとして扱い、再送はしない
+                return ContactResponse(success=True, message=ACCEPTED_MESSAGE)
+            if not decision.allowed:
+                raise HTTPException(
+                    status_code=429,
+                    detail="Too many requests",
+                    headers={"Retry-After": str(decision.retry_after)},
+                )
 
-    async def send_contact_email(self, contact: ContactRequest) -> ContactResponse:
-        """お問い合わせメール送信"""
         success = await self.repository.send_email(contact)
         if not success:
+            if decision is not None:
+                self.guard.release(decision)
             raise HTTPException(status_code=500, detail="Failed to send email")
-        return ContactResponse(success=True, message="お問い合わせを受け付けました")
+        return ContactResponse(success=True, message=ACCEPTED_MESSAGE)
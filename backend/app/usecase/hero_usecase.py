@@ -1,15 +1,19 @@
+from fastapi import HTTPException
 from app.domain.i_repository.i_hero_repository import IHeroRepository
-from app.domain.entity.hero import HeroIntroduction, TimelineItem
+from app.domain.entity.hero import HeroIntroduction, TimelineItemRecord
 
 
 class HeroUseCase:
     def __init__(self, repository: IHeroRepository):
         self.repository = repository
 
-    async def get_introduction(self) -> HeroIntroduction | None:
+    async def get_introduction(self) -> HeroIntroduction:
         """ヒーロー自己紹介取得"""
-        return await self.repository.get_introduction()
+        intro = await self.repository.get_introduction()
+        if intro is None:
+            raise HTTPException(status_code=404, detail="Hero introduction not found")
+        return intro
 
-    async def get_timeline(self) -> list[TimelineItem]:
+    async def get_timeline(self) -> list[TimelineItemRecord]:
         """タイムライン取得"""
         return await self.repository.get_timeline()
@@ -0,0 +1,48 @@
+import asyncio
+
+from fastapi import HTTPException
+from app.domain.entity.portfolio import PORTFOLIO_SECTIONS, PortfolioResponse
+from app.domain.entity.response import is_degraded
+from app.usecase.about_usecase import AboutUseCase
+from app.usecase.hero_usecase import HeroUseCase
+from app.usecase.skill_usecase import SkillUseCase
+from app.usecase.work_usecase import WorkUseCase
+
+
+class PortfolioUseCase:
+    def __init__(self, hero: HeroUseCase, skill: SkillUseCase, work: WorkUseCase, about: AboutUseCase):
+        self.loaders = {
+            "introduction": hero.get_introduction,
+            "timeline": hero.get_timeline,
+            "skills": skill.get_all_skills,
+            "skill_categories": skill.get_categories,
+            "works": work.get_all_works,
+            "about": about.get_about_data,
+        }
+
+    @staticmethod
+    def parse_sections(fields: list[str] | None) -> tuple[str, ...]:
+        """取得するセクション（未指定なら全て、PORTFOLIO_SECTIONS の順）"""
+        if not fields:
+            return PORTFOLIO_SECTIONS
+        unknown = sorted(set(fields) - set(PORTFOLIO_SECTIONS))
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+        return tuple(section for section in PORTFOLIO_SECTIONS if section in fields)
+
+    async def get_portfolio(self, sections: tuple[str, ...]) -> PortfolioResponse:
+        """指定セクションを並行して取得する（存在しないセクションは null）"""
+        results = await asyncio.gather(*(self._load(section) for section in sections))
+        portfolio = PortfolioResponse(**dict(zip(sections, results)))
+        if any(is_degraded(result) for result in results):
+            portfolio.mark_degraded()
+        return portfolio
+
+    async def _load(self, section: str):
+        try:
+            return await self.loaders[section]()
+        except HTTPException as e:
+            # 個別APIでは404になる未登録データ（about など）は null で返す
+            if e.status_code == 404:
+                return None
+            raise
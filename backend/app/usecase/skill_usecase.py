@@ -1,16 +1,16 @@
 from app.domain.i_repository.i_skill_repository import ISkillRepository
-from app.domain.entity.skill import Skill
+from app.domain.entity.skill import SkillRecord
 
 
 class SkillUseCase:
     def __init__(self, repository: ISkillRepository):
         self.repository = repository
 
-    async def get_all_skills(self) -> list[Skill]:
+    async def get_all_skills(self) -> list[SkillRecord]:
         """全スキル取得"""
         return await self.repository.find_all()
 
-    async def get_skills_by_category(self, category: str) -> list[Skill]:
+    async def get_skills_by_category(self, category: str) -> list[SkillRecord]:
         """カテゴリ別スキル取得"""
         return await self.repository.find_by_category(category)
 
@@ -1,19 +1,52 @@
 from fastapi import HTTPException
 from app.domain.i_repository.i_work_repository import IWorkRepository
-from app.domain.entity.work import Work
+from app.domain.i_repository.i_work_search_index import IWorkSearchIndex
+from app.domain.entity.work import InvalidCursorError, Work, WorkBatchResponse, WorkPage, WorkQuery, WorkRecord, WorkSearchResponse
 
 
 class WorkUseCase:
-    def __init__(self, repository: IWorkRepository):
+    def __init__(self, repository: IWorkRepository, search_index: IWorkSearchIndex | None = None):
         self.repository = repository
+        self.search_index = search_index
 
-    async def get_all_works(self) -> list[Work]:
+    async def get_all_works(self) -> list[WorkRecord]:
         """全作品取得"""
         return await self.repository.find_all()
 
-    async def get_work_by_id(self, work_id: str) -> Work:
+    async def get_work_by_id(self, work_id: str) -> WorkRecord:
         """作品詳細取得"""
         work = await self.repository.find_by_id(work_id)
         if not work:
             raise HTTPException(status_code=404, detail="Work not found")
         return work
+
+    async def get_works_by_ids(self, work_ids: list[str]) -> WorkBatchResponse:
+        """作品の一括取得（リクエスト順を保ち、見つからないIDを返す）"""
+        requested = list(dict.fromkeys(work_ids))
+        found = {work.id: work for work in await self.repository.find_by_ids(requested)}
+        return WorkBatchResponse(
+            works=[found[work_id] for work_id in requested if work_id in found],
+            missing_ids=[work_id for work_id in requested if work_id not in found],
+        )
+
+    async def get_works_page(self, query: WorkQuery) -> WorkPage:
+        """条件付き作品一覧取得"""
+        if query.fields:
+            unknown = sorted(set(query.fields) - set(Work.__fields__))
+            if unknown:
+                raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+        try:
+            return await self.repository.find_page(query)
+        except InvalidCursorError as e:
+            # 上流の行の検証エラー（ValidationError も ValueError）はクライアントの誤りにしない
+            raise HTTPException(status_code=400, detail=str(e))
+
+    async def search_works(self, query: str, limit: int) -> WorkSearchResponse:
+        """作品の全文検索（索引は全作品一覧の内容が変わったときだけ更新）"""
+        if self.search_index is None:
+            raise HTTPException(status_code=501, detail="Search is not available")
+        if not query.strip():
+            raise HTTPException(status_code=400, detail="Query must not be blank")
+        # 全作品一覧はキャッシュ・スナップショットから返るため、変更がなければ索引はそのまま
+        await self.search_index.refresh(await self.repository.find_all())
+        return self.search_index.search(query.strip(), limit)
@@ -0,0 +1,2 @@
+# ベンチマークパッケージ
+# ローカルのSupabase代替サーバーを使った性能計測スクリプトを含みます
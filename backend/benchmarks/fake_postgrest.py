@@ -0,0 +1,434 @@
+"""
+ベンチマーク用のローカルPostgREST代替サーバー
+
+Supabaseの /rest/v1/<table> を最小限模倣し、応答遅延とデータ件数を
+指定できる。select（埋め込みリソース含む）/ eq / lt / gt / in / cs / is /
+or・and / order / limit のみ解釈する。POST は挿入と upsert（on_conflict と
+Prefer: resolution=merge-duplicates / ignore-duplicates）に対応する。
+faults（Faults）で障害（エラー応答・遅延・停止）を注入できる。
+
+    python -m benchmarks.fake_postgrest --port 54321 --latency-ms 20 --works 100
+    python -m benchmarks.fake_postgrest --empty   # 空のテーブルで起動（scripts.init_db の確認用）
+    python -m benchmarks.fake_postgrest --error-rate 0.2 --slow-rate 0.05 --slow-ms 2000
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+CATEGORIES = ["フロントエンド", "バックエンド", "インフラ", "AI", "その他"]
+TECHNOLOGIES = ["Python", "FastAPI", "TypeScript", "Next.js", "React", "Azure", "Supabase", "Docker"]
+
+
+def build_dataset(works: int = 10, skills: int = 20, timeline: int = 5) -> dict[str, list[dict]]:
+    """テーブル名 -> 行リストのダミーデータを生成する"""
+    base = date(2024, 1, 1)
+    return {
+        "works": [
+            {
+                "id": f"work-{i}",
+                "title": f"サンプルプロジェクト {i}",
+                "description": "RAGを活用した社内文書検索システムの設計と実装。" * 4,
+                "thumbnail": f"/works/work-{i}/thumbnail.png",
+                "category": CATEGORIES[i % len(CATEGORIES)],
+                "featured": i % 7 == 0,
+                "technologies": TECHNOLOGIES[i % 4:i % 4 + 4],
+                "github_link": f"https://github.com/example/work-{i}",
+                "demo_link": None,
+                "blog_link": None,
+                "screenshots": {"home": f"/works/work-{i}/home.png", "detail": f"/works/work-{i}/detail.png"},
+                "duration": "2024年4月 - 2024年9月",
+                "role": "フルスタック開発",
+                "learnings": "非同期処理とキャッシュ設計の重要性を学んだ。" * 3,
+                "created_at": f"{base + timedelta(days=i)}T00:00:00+00:00",
+            }
+            for i in range(works)
+        ],
+        "skills": [
+            {
+                "id": i + 1,
+                "name": f"Skill {i}",
+                "level": 50 + i % 50,
+                "category": CATEGORIES[i % len(CATEGORIES)],
+                "icon": None,
+                "description": "業務での利用経験あり",
+            }
+            for i in range(skills)
+        ],
+        "about": [
+            {
+                "id": 1,
+                "name": "青木 駿介",
+                "title": "AIエンジニア",
+                "summary": "Webアプリケーション開発に情熱を持つエンジニアです。",
+                "profile_image": "/profile.jpg",
+                "bio": "AI開発とバックエンド開発を担当しています。" * 5,
+            }
+        ],
+        "education": [
+            {
+                "id": 1,
+                "about_id": 1,
+                "institution": "早稲田大学",
+                "degree": "学士",
+                "field": "機械工学",
+                "start_date": "2021-04-01",
+                "end_date": "2025-03-31",
+                "description": None,
+            }
+        ],
+        "experience": [
+            {
+                "id": 1,
+                "about_id": 1,
+                "company": "株式会社サンプル",
+                "position": "AIエンジニア",
+                "start_date": "2024-10-01",
+                "end_date": None,
+                "description": "AI開発とバックエンド開発を担当",
+                "achievements": ["Azureを活用したRAGの開発", "スケジュール管理システムの開発"],
+            }
+        ],
+        "social_media": [
+            {"id": 1, "about_id": 1, "platform": "GitHub", "url": "https://github.com/example", "username": None},
+        ],
+        "hero_introduction": [{"id": "1", "content": "AIとWebの両面から価値を届けるエンジニアです。"}],
+        "timeline_items": [
+            {"id": str(i), "period": f"{2020 + i}", "title": f"タイムライン {i}", "subtitle": None, "sort_order": i}
+            for i in range(timeline)
+        ],
+    }
+
+
+def _coerce(value: str):
+    if value in ("true", "false"):
+        return value == "true"
+    if value == "null":
+        return None
+    return value
+
+
+def _compare_value(actual, criteria: str):
+    """criteria を actual と同じ型に寄せる"""
+    if isinstance(actual, bool):
+        return criteria == "true"
+    if isinstance(actual, (int, float)):
+        return type(actual)(criteria)
+    return criteria
+
+
+def _matches(row: dict, column: str, expr: str) -> bool:
+    op, _, criteria = expr.partition(".")
+    criteria = criteria.strip('"')
+    actual = row.get(column)
+    if op == "eq":
+        return actual == _compare_value(actual, criteria)
+    if op in ("lt", "gt", "lte", "gte"):
+        if actual is None:
+            return False
+        value = _compare_value(actual, criteria)
+        return {"lt": actual < value, "gt": actual > value, "lte": actual <= value, "gte": actual >= value}[op]
+    if op == "in":
+        values = [v.strip('"') for v in criteria.strip("()").split(",")]
+        return str(actual) in values
+    if op == "cs":
+        values = [v.strip('"') for v in criteria.strip("{}").split(",") if v]
+        return all(v in (actual or []) for v in values)
+    if op == "is":
+        return actual is _coerce(criteria)
+    return True
+
+
+def _split_top_level(expr: str) -> list[str]:
+    """括弧・ダブルクォートの外側のカンマで分割"""
+    parts, depth, quoted, current = [], 0, False, ""
+    for ch in expr:
+        if ch == '"':
+            quoted = not quoted
+        elif not quoted and ch == "(":
+            depth += 1
+        elif not quoted and ch == ")":
+            depth -= 1
+        elif not quoted and depth == 0 and ch == ",":
+            parts.append(current)
+            current = ""
+            continue
+        current += ch
+    if current:
+        parts.append(current)
+    return parts
+
+
+def _matches_logic(row: dict, operator: str, expr: str) -> bool:
+    """or=(...) / and=(...) の評価"""
+    results = []
+    for condition in _split_top_level(expr[1:-1]):
+        if condition.startswith(("and(", "or(")):
+            nested_op, _, nested = condition.partition("(")
+            results.append(_matches_logic(row, nested_op, "(" + nested))
+        else:
+            column, _, rest = condition.partition(".")
+            results.append(_matches(row, column, rest))
+    return any(results) if operator == "or" else all(results)
+
+
+def _sort(rows: list[dict], orders: list[str]) -> list[dict]:
+    for order in reversed(orders):
+        column, _, direction = order.partition(".")
+        rows.sort(key=lambda r: (r.get(column) is None, r.get(column)), reverse=direction.startswith("desc"))
+    return rows
+
+
+def query_rows(
+    rows: list[dict],
+    params: list[tuple[str, str]],
+    dataset: dict[str, list[dict]] | None = None,
+    table: str = "",
+) -> list[dict]:
+    """PostgRESTのクエリパラメータを（一部だけ）適用する"""
+    result = list(rows)
+    select = "*"
+    limit = None
+    orders: list[str] = []
+    embedded_orders: dict[str, list[str]] = {}
+    for key, value in params:
+        if key == "select":
+            select = value
+        elif key == "limit":
+            limit = int(value)
+        elif key == "order":
+            orders.extend(value.split(","))
+        elif key.endswith(".order"):
+            embedded_orders.setdefault(key[:-len(".order")], []).extend(value.split(","))
+        elif key in ("or", "and"):
+            result = [row for row in result if _matches_logic(row, key, value)]
+        elif "." not in key:
+            result = [row for row in result if _matches(row, key, value)]
+    _sort(result, orders)
+    if limit is not None:
+        result = result[:limit]
+    if select == "*":
+        return result
+
+    columns = [c for c in select.split(",") if c]
+    plain = [c for c in columns if "(" not in c]
+    embedded = [c.split("(", 1)[0] for c in columns if "(" in c]
+    projected = []
+    for row in result:
+        item = dict(row) if "*" in plain else {c: row.get(c) for c in plain}
+        for name in embedded:
+            # 外部キーは "<親テーブル>_id" とみなす
+            children = [r for r in (dataset or {}).get(name, []) if r.get(f"{table}_id") == row.get("id")]
+            item[name] = _sort(children, embedded_orders.get(name, []))
+        projected.append(item)
+    return projected
+
+
+def upsert_rows(
+    rows: list[dict],
+    payload: list[dict],
+    on_conflict: list[str],
+    resolution: str | None,
+) -> tuple[list[dict], list[dict]]:
+    """
+    payload を rows に挿入した新しい行リストと、挿入・更新した行を返す
+
+    resolution が None のときの重複は ValueError（PostgRESTの409に相当）。
+    """
+    result = list(rows)
+    positions = {tuple(str(row.get(c)) for c in on_conflict): i for i, row in enumerate(result)}
+    affected = []
+    for row in payload:
+        key = tuple(str(row.get(c)) for c in on_conflict)
+        if key not in positions:
+            positions[key] = len(result)
+            result.append(dict(row))
+            affected.append(row)
+        elif resolution == "merge":
+            result[positions[key]] = {**result[positions[key]], **row}
+            affected.append(result[positions[key]])
+        elif resolution is None:
+            raise ValueError(f"duplicate key value violates unique constraint ({', '.join(on_conflict)})={key}")
+    return result, affected
+
+
+@dataclass
+class Faults:
+    """注入する障害（割合は 0〜1 のリクエストごとの確率）"""
+    # ゲートウェイのエラー（JSONでない本文の error_status 応答）
+    error_rate: float = 0.0
+    error_status: int = 503
+    # 応答を slow_ms ミリ秒遅らせる（テイルレイテンシ）
+    slow_rate: float = 0.0
+    slow_ms: float = 0.0
+    # すべてのリクエストを error_status で返す
+    down: bool = False
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+class FakePostgrestServer:
+    """スレッドで動くPostgREST代替サーバー"""
+
+    def __init__(
+        self,
+        dataset: dict[str, list[dict]],
+        latency_ms: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        faults: Faults | None = None,
+        seed: int | None = None,
+    ):
+        self.dataset = dataset
+        self.latency = latency_ms / 1000
+        self.faults = faults or Faults()
+        self.request_count = 0
+        self.faults_injected = 0
+        self._rng = random.Random(seed)
+        self._write_lock = threading.Lock()
+        self._httpd = _HTTPServer((host, port), self._handler_class())
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                # GETでもボディ（"{}"）が送られるため読み捨ててkeep-aliveを保つ
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                server.request_count += 1
+                if self._inject_fault():
+                    return
+                parts = urlsplit(self.path)
+                table = parts.path.rsplit("/", 1)[-1]
+                if table not in server.dataset:
+                    self._send(404, {"message": f"relation {table} does not exist"})
+                    return
+                rows = query_rows(server.dataset[table], parse_qsl(parts.query), server.dataset, table)
+                self._send(200, rows)
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                server.request_count += 1
+                if self._inject_fault():
+                    return
+                parts = urlsplit(self.path)
+                table = parts.path.rsplit("/", 1)[-1]
+                if table not in server.dataset:
+                    self._send(404, {"message": f"relation {table} does not exist"})
+                    return
+                payload = json.loads(body or b"[]")
+                payload = payload if isinstance(payload, list) else [payload]
+                if len({tuple(sorted(row)) for row in payload}) > 1:
+                    self._send(400, {"code": "PGRST102", "message": "All object keys must match"})
+                    return
+                params = dict(parse_qsl(parts.query))
+                prefer = self.headers.get("Prefer", "")
+                resolution = next((r for r in ("merge", "ignore") if f"resolution={r}-duplicates" in prefer), None)
+                on_conflict = params.get("on_conflict", "id").split(",")
+                # 読み手（do_GET）は差し替え前か後の行リストを丸ごと見る
+                with server._write_lock:
+                    try:
+                        rows, affected = upsert_rows(server.dataset[table], payload, on_conflict, resolution)
+                    except ValueError as e:
+                        self._send(409, {"message": str(e)})
+                        return
+                    server.dataset[table] = rows
+                if "return=representation" in prefer:
+                    self._send(201, affected)
+                else:
+                    self._send(201, None)
+
+            def _inject_fault(self) -> bool:
+                """遅延を入れ、エラー応答を返した場合は True"""
+                faults = server.faults
+                delay = server.latency
+                if faults.slow_rate and server._rng.random() < faults.slow_rate:
+                    delay += faults.slow_ms / 1000
+                    server.faults_injected += 1
+                if delay:
+                    time.sleep(delay)
+                if faults.down or (faults.error_rate and server._rng.random() < faults.error_rate):
+                    server.faults_injected += 1
+                    body = b"<html><body>Service Unavailable</body></html>"
+                    self.send_response(faults.error_status)
+                    self.send_header("Content-Type", "text/html")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return True
+                return False
+
+            def _send(self, status: int, payload) -> None:
+                body = b"" if payload is None else json.dumps(payload, ensure_ascii=False).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def start(self) -> "FakePostgrestServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakePostgrestServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ローカルPostgREST代替サーバー")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=54321)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--works", type=int, default=10)
+    parser.add_argument("--skills", type=int, default=20)
+    parser.add_argument("--timeline", type=int, default=5)
+    parser.add_argument("--empty", action="store_true", help="行のない空のテーブルで起動")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503を返す割合")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="--slow-ms だけ遅らせる割合")
+    parser.add_argument("--slow-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    dataset = build_dataset(args.works, args.skills, args.timeline)
+    if args.empty:
+        dataset = {table: [] for table in dataset}
+    faults = Faults(error_rate=args.error_rate, slow_rate=args.slow_rate, slow_ms=args.slow_ms)
+    server = FakePostgrestServer(dataset, args.latency_ms, args.host, args.port, faults=faults)
+    print(f"Fake PostgREST listening on {server.url}/rest/v1")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+ローカルSupabase Realtime代替サーバー
+
+キャッシュの自動破棄（app/infra/cache/change_feed.py）の動作確認用。
+Phoenixチャネルの phx_join / heartbeat のみ解釈し、notify() で
+postgres_changes 形式の通知を購読中のクライアントに送る。
+
+    python -m benchmarks.fake_realtime --port 4000
+    # 別ターミナルで CHANGE_FEED_ENABLED=True CHANGE_FEED_URL=ws://127.0.0.1:4000/realtime/v1/websocket
+    # 標準入力に "works work-1" のように テーブル名 [ID] を入力すると通知する
+"""
+import argparse
+import asyncio
+import json
+import sys
+import threading
+from datetime import datetime, timezone
+
+import websockets
+
+
+class FakeRealtimeServer:
+    """別スレッドのイベントループで動くRealtime代替サーバー"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self.joins = 0
+        self._clients: dict = {}
+        self._loop = asyncio.new_event_loop()
+        self._server = None
+        self._ready = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}/realtime/v1/websocket"
+
+    async def _handle(self, ws) -> None:
+        try:
+            async for raw in ws:
+                message = json.loads(raw)
+                if message.get("event") == "phx_join":
+                    self.joins += 1
+                    self._clients[ws] = message["topic"]
+                await ws.send(json.dumps({
+                    "topic": message.get("topic"),
+                    "event": "phx_reply",
+                    "payload": {"status": "ok", "response": {}},
+                    "ref": message.get("ref"),
+                }))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self._clients.pop(ws, None)
+
+    async def _serve(self) -> None:
+        self._server = await websockets.serve(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        await self._server.wait_closed()
+
+    def start(self) -> "FakeRealtimeServer":
+        self._thread = threading.Thread(target=self._loop.run_until_complete, args=(self._serve(),), daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def _call(self, coro) -> None:
+        asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def notify(self, table: str, type: str = "UPDATE", record: dict | None = None) -> None:
+        """購読中の全クライアントに変更通知を送る"""
+        async def send():
+            for ws, topic in list(self._clients.items()):
+                await ws.send(json.dumps({
+                    "topic": topic,
+                    "event": "postgres_changes",
+                    "payload": {
+                        "data": {
+                            "schema": "public",
+                            "table": table,
+                            "type": type,
+                            "commit_timestamp": datetime.now(timezone.utc).isoformat(),
+                            "record": record if type != "DELETE" else {},
+                            "old_record": record if type == "DELETE" else {},
+                        },
+                        "ids": [1],
+                    },
+                    "ref": None,
+                }))
+        self._call(send())
+
+    def disconnect_all(self) -> None:
+        """接続断を模擬する"""
+        async def close():
+            for ws in list(self._clients):
+                await ws.close()
+        self._call(close())
+
+    def stop(self) -> None:
+        async def close():
+            self._server.close()
+        self._call(close())
+        self._thread.join(timeout=5)
+
+    def __enter__(self) -> "FakeRealtimeServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ローカルSupabase Realtime代替サーバー")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4000)
+    args = parser.parse_args()
+
+    server = FakeRealtimeServer(args.host, args.port).start()
+    print(f"Fake Realtime listening on {server.url}")
+    for line in sys.stdin:
+        parts = line.split()
+        if not parts:
+            continue
+        table, record_id = parts[0], (parts[1] if len(parts) > 1 else None)
+        server.notify(table, record={"id": record_id} if record_id else None)
+        print(f"notified {table} {record_id or ''}".rstrip())
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+ローカルSMTP代替サーバー
+
+メール送信キュー（app/services/outbox.py）と SMTP接続プールの動作確認用。
+EHLO/HELO / MAIL / RCPT / DATA / RSET / NOOP / QUIT のみ解釈し、受信した
+メッセージはメモリに保持する。応答遅延・一時エラー・接続切断を注入できる。
+STARTTLS と AUTH は扱わないので SMTP_TLS=False、SMTP_USER 未設定で使う。
+
+    python -m benchmarks.fake_smtp --port 2525 --latency-ms 200
+"""
+import argparse
+import socketserver
+import threading
+import time
+from dataclasses import dataclass
+
+
+@dataclass
+class ReceivedMessage:
+    mail_from: str
+    rcpt_to: list[str]
+    data: str
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class FakeSMTPServer:
+    """スレッドで動くSMTP代替サーバー"""
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        fail_next: int = 0,
+        drop_after: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.latency = latency_ms / 1000
+        # 次の fail_next 通を 451 で拒否する
+        self.fail_next = fail_next
+        # 1接続あたり drop_after 通受信したら接続を切る（0なら切らない）
+        self.drop_after = drop_after
+        self.messages: list[ReceivedMessage] = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = _TCPServer((host, port), self._handler_class())
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self._server.server_address[:2]
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def reply(self, line: str) -> None:
+                self.wfile.write(f"{line}\r\n".encode())
+                self.wfile.flush()
+
+            def handle(self):
+                with server._lock:
+                    server.connections += 1
+                received = 0
+                mail_from, rcpt_to = None, []
+                self.reply("220 fake-smtp ready")
+                for raw in self.rfile:
+                    line = raw.decode("utf-8", "replace").rstrip("\r\n")
+                    command = line[:4].upper()
+                    if command == "EHLO":
+                        self.reply("250-fake-smtp")
+                        self.reply("250 8BITMIME")
+                    elif command == "HELO":
+                        self.reply("250 fake-smtp")
+                    elif command == "MAIL":
+                        with server._lock:
+                            rejected = server.fail_next > 0
+                            if rejected:
+                                server.fail_next -= 1
+                        if rejected:
+                            self.reply("451 temporary failure")
+                            continue
+                        mail_from, rcpt_to = line.split(":", 1)[1].strip().strip("<>"), []
+                        self.reply("250 OK")
+                    elif command == "RCPT":
+                        rcpt_to.append(line.split(":", 1)[1].strip().strip("<>"))
+                        self.reply("250 OK")
+                    elif command == "DATA":
+                        self.reply("354 end data with <CR><LF>.<CR><LF>")
+                        lines = []
+                        for data_line in self.rfile:
+                            text = data_line.decode("utf-8", "replace").rstrip("\r\n")
+                            if text == ".":
+                                break
+                            lines.append(text[1:] if text.startswith("..") else text)
+                        if server.latency:
+                            time.sleep(server.latency)
+                        with server._lock:
+                            server.messages.append(ReceivedMessage(mail_from, rcpt_to, "\n".join(lines)))
+                        received += 1
+                        self.reply("250 OK queued")
+                        if server.drop_after and received >= server.drop_after:
+                            return
+                    elif command == "RSET":
+                        mail_from, rcpt_to = None, []
+                        self.reply("250 OK")
+                    elif command == "NOOP":
+                        self.reply("250 OK")
+                    elif command == "QUIT":
+                        self.reply("221 bye")
+                        return
+                    else:
+                        self.reply("502 command not implemented")
+
+        return Handler
+
+    def start(self) -> "FakeSMTPServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeSMTPServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ローカルSMTP代替サーバー")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2525)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--fail-next", type=int, default=0)
+    parser.add_argument("--drop-after", type=int, default=0)
+    args = parser.parse_args()
+
+    server = FakeSMTPServer(args.latency_ms, args.fail_next, args.drop_after, args.host, args.port)
+    host, port = server.address
+    print(f"Fake SMTP listening on {host}:{port}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(f"Received {len(server.messages)} message(s) over {server.connections} connection(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+JSONシリアライズのベンチマーク（ASGIアプリのルート経由）
+
+モデルを返すルートについて、1リクエストあたりの時間と jsonable_encoder の呼び出し回数を
+以下の2通りで比較する（上流はローカルのPostgREST代替サーバー、データはキャッシュ済み）。
+
+- model:  同じ use case の結果をモデルのまま返す（FastAPI が response_model で検証し、
+          jsonable_encoder を通してから render する。計測用に追加するルート）
+- direct: 実際のルート（FastJSONResponse を直接返し、dumps() だけでエンコードする）
+
+それぞれ JSON_RESPONSE_CLASS=orjson / default で計測する。実際のルートが orjson で
+jsonable_encoder を呼ぶか、2通りのボディが一致しなければ終了コード1。
+
+    python -m benchmarks.json_serialization --works 1000 --sizes 10,100
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.fake_postgrest import FakePostgrestServer, build_dataset
+
+
+async def run(args: argparse.Namespace) -> list[str]:
+    import fastapi.routing
+    import httpx
+    from fastapi import Depends
+
+    from app.core import responses
+    from app.core.config import settings
+    from app.dependencies.dependency_injector import get_work_usecase
+    from app.domain.entity.work import WorkBatchRequest, WorkBatchResponse, WorkSearchResponse
+    from app.main import app
+    from app.usecase.work_usecase import WorkUseCase
+
+    if responses.orjson is None:
+        raise SystemExit("orjson is not installed")
+
+    # FastAPI がレスポンスの変換で呼ぶ jsonable_encoder を数える
+    encoder_calls = 0
+    jsonable_encoder = fastapi.routing.jsonable_encoder
+
+    def counting_encoder(*a, **kw):
+        nonlocal encoder_calls
+        encoder_calls += 1
+        return jsonable_encoder(*a, **kw)
+
+    fastapi.routing.jsonable_encoder = counting_encoder
+
+    # 変更前と同じく、モデルをそのまま返すルート
+    async def batch_model(body: WorkBatchRequest, usecase: WorkUseCase = Depends(get_work_usecase)):
+        return await usecase.get_works_by_ids(body.ids)
+
+    async def search_model(q: str, limit: int = 20, usecase: WorkUseCase = Depends(get_work_usecase)):
+        return await usecase.search_works(q, limit)
+
+    app.add_api_route("/bench/works:batchGet", batch_model, methods=["POST"], response_model=WorkBatchResponse)
+    app.add_api_route("/bench/works/search", search_model, methods=["GET"], response_model=WorkSearchResponse)
+
+    ids = [f"work-{i}" for i in range(1, args.works + 1)]
+    cases = []
+    for size in (int(s) for s in args.sizes.split(",")):
+        body = {"ids": ids[:size]}
+        cases.append((f"batchGet x{size}", "POST", ":batchGet", {"json": body}))
+        cases.append((f"search x{size}", "GET", "/search", {"params": {"q": "rag", "limit": size}}))
+
+    failed = []
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Accept-Encoding": "identity"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers) as client:
+        async def measure(method: str, path: str, kwargs: dict) -> tuple[float, float, bytes]:
+            nonlocal encoder_calls
+            response = await client.request(method, path, **kwargs)  # キャッシュ・索引のウォームアップ
+            response.raise_for_status()
+            encoder_calls = 0
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                await client.request(method, path, **kwargs)
+            elapsed = (time.perf_counter() - started) / args.repeat * 1e6
+            return elapsed, encoder_calls / args.repeat, response.content
+
+        print(f"{'route':<16}{'mode':<9}{'model us':>10}{'direct us':>11}{'speedup':>9}{'encoder calls':>15}")
+        for mode in ("orjson", "default"):
+            settings.JSON_RESPONSE_CLASS = mode
+            for label, method, suffix, kwargs in cases:
+                model_us, model_calls, model_body = await measure(method, f"/bench/works{suffix}", kwargs)
+                direct_us, direct_calls, direct_body = await measure(method, f"/works{suffix}", kwargs)
+                print(f"{label:<16}{mode:<9}{model_us:>10.0f}{direct_us:>11.0f}{model_us / direct_us:>8.1f}x"
+                      f"{model_calls:>7.0f} -> {direct_calls:.0f}")
+                if model_body != direct_body:
+                    failed.append(f"{label} ({mode}): response body differs from the response_model path")
+                if mode == "orjson" and direct_calls:
+                    failed.append(f"{label}: route still calls jsonable_encoder")
+    return failed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JSONシリアライズのベンチマーク（ルート経由）")
+    parser.add_argument("--works", type=int, default=1000)
+    parser.add_argument("--sizes", default="10,100")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with FakePostgrestServer(build_dataset(works=args.works), 1.0) as server:
+        os.environ["SUPABASE_URL"] = server.url
+        os.environ.setdefault("SUPABASE_KEY", "bench.fake.key")
+        failed = asyncio.run(run(args))
+    for reason in failed:
+        print(f"FAILED: {reason}")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
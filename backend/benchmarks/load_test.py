@@ -0,0 +1,252 @@
+"""
+APIの負荷テスト（ローカルPostgREST代替サーバー使用）
+
+ローカルのPostgREST代替サーバーを起動し、それを向けた app.main:app を別プロセスの
+uvicorn で起動して、各ルートに固定の同時接続数でリクエストを送り続ける。
+ルート×同時接続数ごとに p50 / p95 / p99 レイテンシと RPS を表示する。
+
+    # 計測してベースラインとして保存
+    python -m benchmarks.load_test --latency-ms 20 --save-baseline benchmarks/baseline.json
+
+    # ベースラインと比較し、p95 の悪化または RPS の低下が閾値を超えたら終了コード1
+    python -m benchmarks.load_test --latency-ms 20 --baseline benchmarks/baseline.json --threshold 0.25
+
+    # アプリの設定を変えて比較（例: キャッシュ無効）
+    python -m benchmarks.load_test --app-env CACHE_ENABLED=False --app-env RESPONSE_SNAPSHOT_ENABLED=False
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+
+import httpx
+
+from benchmarks.fake_postgrest import FakePostgrestServer, build_dataset
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    method: str
+    path: str
+    body: dict | None = None
+    headers: dict | None = None
+
+
+# アプリに渡す管理APIのトークン（/cache/stats 用）
+ADMIN_TOKEN = "bench-admin-token"
+
+SCENARIOS = [
+    Scenario("root", "GET", "/"),
+    Scenario("works", "GET", "/works"),
+    Scenario("works_page", "GET", "/works?limit=10&fields=id,title,category"),
+    Scenario("work_detail", "GET", "/works/work-1"),
+    Scenario("works_batch", "POST", "/works:batchGet", {"ids": ["work-1", "work-2", "work-3", "missing"]}),
+    Scenario("skills", "GET", "/skills"),
+    Scenario("skill_categories", "GET", "/skills/categories"),
+    Scenario("about", "GET", "/about"),
+    Scenario("hero_introduction", "GET", "/hero/introduction"),
+    Scenario("hero_timeline", "GET", "/hero/timeline"),
+    Scenario("portfolio", "GET", "/portfolio"),
+    Scenario("contact", "POST", "/contact", {"name": "負荷テスト", "email": "load@example.com", "message": "{n}"}),
+    Scenario("cache_stats", "GET", "/cache/stats", headers={"Authorization": f"Bearer {ADMIN_TOKEN}"}),
+    Scenario("metrics", "GET", "/metrics"),
+]
+
+
+@dataclass
+class Result:
+    scenario: str
+    concurrency: int
+    requests: int
+    errors: int
+    rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """最近傍順位法のパーセンタイル"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_app(env: dict[str, str], port: int, workers: int) -> subprocess.Popen:
+    """app.main:app を別プロセスで起動し、応答するまで待つ"""
+    command = [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+               "--log-level", "warning", "--no-access-log", "--workers", str(workers)]
+    process = subprocess.Popen(command, env={**os.environ, **env}, cwd=os.path.dirname(os.path.dirname(__file__)))
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"App exited during startup (code {process.returncode})")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    process.terminate()
+    raise SystemExit("App did not become ready within 30s")
+
+
+async def run_scenario(base_url: str, scenario: Scenario, concurrency: int, duration: float, warmup: float) -> Result:
+    """同時接続数 concurrency のクローズドループで duration 秒リクエストを送り続ける"""
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    counter = itertools.count()
+    latencies: list[float] = []
+    errors = 0
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        async def request() -> bool:
+            body = scenario.body
+            if body is not None and any("{n}" in str(v) for v in body.values()):
+                # 重複判定に掛からないよう毎回内容を変える
+                n = next(counter)
+                body = {k: v.replace("{n}", str(n)) if isinstance(v, str) else v for k, v in body.items()}
+            response = await client.request(scenario.method, scenario.path, json=body, headers=scenario.headers)
+            return response.status_code < 400
+
+        async def worker(until: float, record: bool) -> None:
+            nonlocal errors
+            while time.perf_counter() < until:
+                started = time.perf_counter()
+                try:
+                    ok = await request()
+                except httpx.HTTPError:
+                    ok = False
+                if record:
+                    latencies.append(time.perf_counter() - started)
+                    errors += not ok
+
+        if warmup > 0:
+            warm_until = time.perf_counter() + warmup
+            await asyncio.gather(*(worker(warm_until, False) for _ in range(concurrency)))
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(started + duration, True) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return Result(
+        scenario=scenario.name,
+        concurrency=concurrency,
+        requests=len(latencies),
+        errors=errors,
+        rps=round(len(latencies) / elapsed, 1),
+        p50_ms=round(percentile(latencies, 50) * 1000, 2),
+        p95_ms=round(percentile(latencies, 95) * 1000, 2),
+        p99_ms=round(percentile(latencies, 99) * 1000, 2),
+    )
+
+
+def compare(results: list[Result], baseline: list[dict], threshold: float) -> list[str]:
+    """ベースラインより p95 が threshold 以上悪化、または RPS が threshold 以上低下した組み合わせ"""
+    previous = {(b["scenario"], b["concurrency"]): b for b in baseline}
+    regressions = []
+    for r in results:
+        b = previous.get((r.scenario, r.concurrency))
+        if b is None:
+            continue
+        if b["p95_ms"] > 0 and r.p95_ms > b["p95_ms"] * (1 + threshold):
+            regressions.append(f"{r.scenario} c={r.concurrency}: p95 {b['p95_ms']}ms -> {r.p95_ms}ms")
+        if b["rps"] > 0 and r.rps < b["rps"] * (1 - threshold):
+            regressions.append(f"{r.scenario} c={r.concurrency}: rps {b['rps']} -> {r.rps}")
+        if r.errors and not b.get("errors"):
+            regressions.append(f"{r.scenario} c={r.concurrency}: {r.errors} error(s)")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="APIの負荷テスト")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="PostgREST代替サーバーの応答遅延")
+    parser.add_argument("--works", type=int, default=50)
+    parser.add_argument("--skills", type=int, default=40)
+    parser.add_argument("--timeline", type=int, default=10)
+    parser.add_argument("--concurrency", default="1,8,32")
+    parser.add_argument("--duration", type=float, default=3.0, help="ルート×同時接続数ごとの計測秒数")
+    parser.add_argument("--warmup", type=float, default=0.5)
+    parser.add_argument("--scenarios", default=",".join(s.name for s in SCENARIOS))
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn のワーカー数")
+    parser.add_argument("--app-env", action="append", default=[], metavar="KEY=VALUE", help="アプリに渡す環境変数")
+    parser.add_argument("--output", help="結果をJSONで保存するパス")
+    parser.add_argument("--baseline", help="比較するベースラインJSON")
+    parser.add_argument("--save-baseline", help="結果をベースラインとして保存するパス")
+    parser.add_argument("--threshold", type=float, default=0.25, help="許容する悪化率")
+    args = parser.parse_args()
+
+    levels = [int(c) for c in args.concurrency.split(",")]
+    selected = set(args.scenarios.split(","))
+    scenarios = [s for s in SCENARIOS if s.name in selected]
+    dataset = build_dataset(works=args.works, skills=args.skills, timeline=args.timeline)
+
+    with FakePostgrestServer(dataset, args.latency_ms) as upstream, tempfile.TemporaryDirectory() as tmp:
+        port = _free_port()
+        env = {
+            "SUPABASE_URL": upstream.url,
+            "SUPABASE_KEY": "bench.fake.key",
+            "SUPABASE_POOL_MAX_CONNECTIONS": str(max(levels)),
+            "SUPABASE_THREADPOOL_SIZE": str(max(levels)),
+            "EMAILS_ENABLED": "False",
+            "EMAIL_OUTBOX_PATH": os.path.join(tmp, "outbox.sqlite3"),
+            # 流量制限は1クライアントからの負荷を弾くため無効にする
+            "CONTACT_RATE_LIMIT_ENABLED": "False",
+            "ADMIN_API_TOKEN": ADMIN_TOKEN,
+        }
+        env.update(item.split("=", 1) for item in args.app_env)
+        process = start_app(env, port, args.workers)
+        base_url = f"http://127.0.0.1:{port}"
+        results: list[Result] = []
+        try:
+            print(f"upstream latency={args.latency_ms}ms works={args.works} skills={args.skills} timeline={args.timeline}")
+            print(f"{'scenario':<18}{'conc':>6}{'reqs':>8}{'err':>6}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+            for scenario in scenarios:
+                for level in levels:
+                    r = asyncio.run(run_scenario(base_url, scenario, level, args.duration, args.warmup))
+                    results.append(r)
+                    print(f"{r.scenario:<18}{r.concurrency:>6}{r.requests:>8}{r.errors:>6}{r.rps:>10.1f}"
+                          f"{r.p50_ms:>10.2f}{r.p95_ms:>10.2f}{r.p99_ms:>10.2f}")
+            print(f"upstream requests: {upstream.request_count}")
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+    payload = {
+        "config": {k: v for k, v in vars(args).items() if k not in ("output", "baseline", "save_baseline")},
+        "results": [asdict(r) for r in results],
+    }
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+        print(f"saved {path}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"Regressions beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  - {line}")
+            raise SystemExit(1)
+        print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+読み取りモデルのメモリ・CPUベンチマーク
+
+10k 行の一覧を以下の方式で保持したときの、作成時間（キャッシュ充填1回分）・
+保持メモリ・JSONエンコード時間（リクエストごと）を比較する。
+
+- model:     Work(**row)（pydantic の検証 + インスタンスごとの __dict__ / __fields_set__）
+- construct: Work.construct(**row)（検証なし、メモリは model と同じ）
+- record:    WorkRecord.from_row(row)（検証1回 + __slots__ の dataclass）
+
+    python -m benchmarks.read_models --rows 10000
+"""
+import argparse
+import gc
+import os
+import time
+import tracemalloc
+
+from benchmarks.fake_postgrest import build_dataset
+
+
+def _retained_mb(build) -> tuple[float, list]:
+    """build() の結果が保持しているメモリ（MB）。計測のオーバーヘッドが大きいため時間は別に測る"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained / 1e6, result
+
+
+def _cpu_ms(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.process_time()
+        fn()
+        best = min(best, time.process_time() - started)
+    return best * 1000
+
+
+def _rows(dataset: dict, table: str, count: int) -> list[dict]:
+    """count 行になるまで行を複製する（id だけ変える）"""
+    source = dataset[table]
+    return [{**source[i % len(source)], "id": i + 1} for i in range(count)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="読み取りモデルのメモリ・CPUベンチマーク")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    os.environ.setdefault("SUPABASE_URL", "http://127.0.0.1:54321")
+    os.environ.setdefault("SUPABASE_KEY", "bench.fake.key")
+
+    from app.core import responses
+    from app.domain.entity.about import Education, EducationRecord, Experience, ExperienceRecord
+    from app.domain.entity.hero import TimelineItem, TimelineItemRecord
+    from app.domain.entity.skill import Skill, SkillRecord
+    from app.domain.entity.work import Work, WorkRecord
+
+    dataset = build_dataset(works=args.rows, skills=args.rows, timeline=args.rows)
+    tables = [
+        ("works", Work, WorkRecord, dataset["works"]),
+        ("skills", Skill, SkillRecord, dataset["skills"]),
+        ("timeline_items", TimelineItem, TimelineItemRecord, dataset["timeline_items"]),
+        ("education", Education, EducationRecord, _rows(dataset, "education", args.rows)),
+        ("experience", Experience, ExperienceRecord, _rows(dataset, "experience", args.rows)),
+    ]
+
+    print(f"{args.rows} rows per table (JSON_RESPONSE_CLASS={responses.settings.JSON_RESPONSE_CLASS})")
+    print(f"{'table':<16}{'kind':<11}{'build ms':>10}{'memory MB':>11}{'encode ms':>11}")
+    for table, schema, record, rows in tables:
+        variants = {
+            "model": lambda: [schema(**row) for row in rows],
+            "construct": lambda: [schema.construct(**row) for row in rows],
+            "record": lambda: [record.from_row(row) for row in rows],
+        }
+        for kind, build in variants.items():
+            build_ms = _cpu_ms(build, args.repeat)
+            memory_mb, items = _retained_mb(build)
+            encode_ms = _cpu_ms(lambda: responses.dumps(items), args.repeat)
+            print(f"{table:<16}{kind:<11}{build_ms:>10.1f}{memory_mb:>11.2f}{encode_ms:>11.1f}")
+            del items
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+リポジトリ層の同時実行ベンチマーク
+
+ローカルPostgREST代替サーバー（応答遅延あり）に対して、同時リクエスト数を
+変えながら SupabaseWorkRepository.find_all() のスループットを計測する。
+
+- blocking: 旧実装と同じく同期 .execute() をイベントループ上で直接呼ぶ
+- thread:   同期クライアント＋上限付きスレッドプールへの退避
+- async:    非同期PostgRESTクライアント
+
+    python -m benchmarks.repository_concurrency --latency-ms 50
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.fake_postgrest import FakePostgrestServer, build_dataset
+
+
+async def _run(repository, concurrency: int, total: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            await repository.find_all()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return total / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="リポジトリ同時実行ベンチマーク")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--works", type=int, default=20)
+    parser.add_argument("--requests-per-level", type=int, default=4, help="同時実行数あたりのリクエスト倍率")
+    parser.add_argument("--concurrency", default="1,4,16,32")
+    args = parser.parse_args()
+    levels = [int(c) for c in args.concurrency.split(",")]
+
+    with FakePostgrestServer(build_dataset(works=args.works), args.latency_ms) as server:
+        os.environ["SUPABASE_URL"] = server.url
+        os.environ.setdefault("SUPABASE_KEY", "bench.fake.key")
+        os.environ["SUPABASE_POOL_MAX_CONNECTIONS"] = str(max(levels))
+        os.environ["SUPABASE_THREADPOOL_SIZE"] = str(max(levels))
+
+        from app.infra.supabase_client import supabase_provider
+        from app.infra.repository.supabase_work_repository import SupabaseWorkRepository
+        from app.domain.entity.work import Work
+
+        class BlockingWorkRepository(SupabaseWorkRepository):
+            async def find_all(self) -> list[Work]:
+                response = self.client.table("works").select("*").order("featured", desc=True).execute()
+                return [Work(**work) for work in response.data]
+
+        async def bench() -> None:
+            modes = {
+                "blocking": BlockingWorkRepository(supabase_provider.get_client()),
+                "thread": SupabaseWorkRepository(supabase_provider.get_client()),
+                "async": SupabaseWorkRepository(supabase_provider.get_async_client()),
+            }
+            print(f"upstream latency={args.latency_ms}ms works={args.works}")
+            print(f"{'mode':<10}" + "".join(f"{f'c={c}':>12}" for c in levels) + "   (requests/sec)")
+            for name, repository in modes.items():
+                await repository.find_all()  # 接続ウォームアップ
+                results = [await _run(repository, c, c * args.requests_per_level) for c in levels]
+                print(f"{name:<10}" + "".join(f"{rps:>12.1f}" for rps in results))
+            await supabase_provider.aclose()
+
+        asyncio.run(bench())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+レスポンススナップショットのCPU時間ベンチマーク
+
+/works 1リクエストあたりのCPU時間を比較する（HTTPやSupabaseは含めない）。
+
+- legacy:   行 -> Work(**row) -> response_model 検証 -> jsonable_encoder -> JSONResponse
+- encode:   キャッシュ済みモデル -> 毎回エンコードしてETag計算（RESPONSE_SNAPSHOT_ENABLED=False の snapshot_response）
+- snapshot: エンコード済みバイト列をそのまま返す（snapshot_response のヒット時）
+
+    python -m benchmarks.response_snapshot --sizes 10,100,1000
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.fake_postgrest import build_dataset
+
+
+def _cpu_per_call(fn, iterations: int) -> float:
+    started = time.process_time()
+    for _ in range(iterations):
+        fn()
+    return (time.process_time() - started) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="レスポンススナップショットのCPU時間ベンチマーク")
+    parser.add_argument("--sizes", default="10,100,1000")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    os.environ.setdefault("SUPABASE_URL", "http://127.0.0.1:54321")
+    os.environ.setdefault("SUPABASE_KEY", "bench.fake.key")
+
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_response_field
+    from starlette.requests import Request
+    from app.core.config import settings
+    from app.core.http_cache import snapshot_response
+    from app.domain.entity.work import Work
+
+    field = create_response_field(name="Response_get_all_works", type_=list[Work])
+    request = Request({"type": "http", "headers": [], "method": "GET", "path": "/works"})
+    loop = asyncio.new_event_loop()
+
+    print(f"{'works':>6}{'legacy':>12}{'encode':>12}{'snapshot':>12}   (CPU µs/request)")
+    for size in (int(s) for s in args.sizes.split(",")):
+        rows = build_dataset(works=size)["works"]
+        models = [Work(**row) for row in rows]
+        iterations = max(5, args.iterations * 10 // size)
+
+        async def cached_models():
+            return models
+
+        def respond(snapshot_enabled: bool):
+            settings.RESPONSE_SNAPSHOT_ENABLED = snapshot_enabled
+            return loop.run_until_complete(
+                snapshot_response(request, "works", "works", cached_models, key=f"bench:{size}")
+            )
+
+        def legacy():
+            works = [Work(**row) for row in rows]
+            content = loop.run_until_complete(serialize_response(field=field, response_content=works))
+            JSONResponse(content)
+
+        results = (
+            _cpu_per_call(legacy, iterations),
+            _cpu_per_call(lambda: respond(False), iterations),
+            _cpu_per_call(lambda: respond(True), iterations * 10),
+        )
+        print(f"{size:>6}" + "".join(f"{r:>12.1f}" for r in results))
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
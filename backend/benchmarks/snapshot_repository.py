@@ -0,0 +1,98 @@
+"""
+ローカルスナップショットのベンチマーク（Supabase不要）
+
+StaticSnapshotSource を取得元にして、以下を確認する。
+
+- 同期（取得 -> 検証 -> SQLite保存）と、保存済みファイルからの読み込みにかかる時間
+- スナップショットからの参照時間（find_by_id / find_page / get_about_aggregate）
+- 取得元が停止しても直前の版を返し続けること
+- 取得元が停止したまま再起動しても、保存済みの版から応答できること
+
+    python -m benchmarks.snapshot_repository --works 10000
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from benchmarks.fake_postgrest import build_dataset
+
+
+async def _per_call_us(call, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await call()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+async def run(args: argparse.Namespace) -> None:
+    from app.domain.entity.work import WorkQuery
+    from app.infra.cache.cache_registry import CacheRegistry
+    from app.infra.repository.snapshot_about_repository import SnapshotAboutRepository
+    from app.infra.repository.snapshot_work_repository import SnapshotWorkRepository
+    from app.infra.snapshot.store import SQLiteSnapshotStore
+    from app.infra.snapshot.sync_engine import SnapshotSyncEngine, StaticSnapshotSource
+
+    dataset = build_dataset(works=args.works, skills=args.works // 10, timeline=args.works // 100)
+    source = StaticSnapshotSource(dataset)
+    with tempfile.TemporaryDirectory() as directory:
+        store = SQLiteSnapshotStore(os.path.join(directory, "snapshot.sqlite3"))
+
+        def engine(source) -> SnapshotSyncEngine:
+            return SnapshotSyncEngine(store, source, interval=3600, registry=CacheRegistry())
+
+        primary = engine(source)
+        started = time.perf_counter()
+        await primary.start()
+        print(f"{args.works} works: sync {(time.perf_counter() - started) * 1000:.0f} ms, "
+              f"file {os.path.getsize(store.path) / 1e6:.1f} MB, version {primary.current.version}")
+
+        works = SnapshotWorkRepository(primary, fallback=None)
+        about = SnapshotAboutRepository(primary, fallback=None)
+        work_id = dataset["works"][args.works // 2]["id"]
+        page = WorkQuery(limit=20, category=dataset["works"][0]["category"])
+        print(f"{'call':<28}{'us/call':>10}")
+        for name, call in (
+            ("find_by_id", lambda: works.find_by_id(work_id)),
+            ("find_page(limit=20)", lambda: works.find_page(WorkQuery(limit=20))),
+            ("find_page(category, 20)", lambda: works.find_page(page)),
+            ("get_about_aggregate", about.get_about_aggregate),
+        ):
+            print(f"{name:<28}{await _per_call_us(call, args.repeat):>10.1f}")
+
+        # 取得元の停止: 同期は失敗するが直前の版を返し続ける
+        source.fail = ConnectionError("upstream down")
+        try:
+            await primary.refresh(since=time.time())
+        except ConnectionError:
+            pass
+        found = await works.find_by_id(work_id)
+        print(f"outage: refresh failed, find_by_id still served={found is not None}")
+        await primary.stop()
+
+        # 停止したまま再起動: 保存済みの版を読み込んで応答する
+        restarted = engine(source)
+        started = time.perf_counter()
+        await restarted.start()
+        load_ms = (time.perf_counter() - started) * 1000
+        found = await SnapshotWorkRepository(restarted, fallback=None).find_by_id(work_id)
+        stats = restarted.stats()
+        print(f"restart during outage: load {load_ms:.0f} ms, served={found is not None}, "
+              f"version {stats['version']}, failures {stats['failures']}")
+        await restarted.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ローカルスナップショットのベンチマーク")
+    parser.add_argument("--works", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+
+    os.environ.setdefault("SUPABASE_URL", "http://127.0.0.1:54321")
+    os.environ.setdefault("SUPABASE_KEY", "bench.fake.key")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
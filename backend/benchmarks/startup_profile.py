@@ -0,0 +1,135 @@
+"""
+起動時間の計測（モジュールごとの import コスト）
+
+新しいインタプリタで `python -X importtime -c "import app.main"` を実行し、
+最も速かった回の結果からパッケージ別の自己時間と、累積時間の大きいモジュールを表示する。
+--budget-ms を超えた場合や、起動時に読み込まないはずのモジュール（遅延読み込み対象）が
+読み込まれていた場合は終了コード1（CIでの回帰検出用）。
+
+    python -m benchmarks.startup_profile
+    python -m benchmarks.startup_profile --runs 5 --top 30 --budget-ms 1500
+    # 起動からリクエストを受け付けるまで（lifespan・ウォームアップ込み）も計測
+    python -m benchmarks.startup_profile --ready --app-env STARTUP_WARMUP=True
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 起動時には読み込まない（初回利用時まで遅延させている）モジュール
+LAZY_MODULES = ("supabase", "gotrue", "storage3", "realtime", "supafunc", "email.mime")
+
+# 計測用の設定（実際には接続しない）
+PLACEHOLDER_ENV = {
+    "SUPABASE_URL": "https://placeholder.supabase.co",
+    "SUPABASE_KEY": "placeholder.supabase.key",
+}
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> list[ImportRecord]:
+    """-X importtime の出力を解析する"""
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        records.append(ImportRecord(name.strip(), int(self_us), int(cumulative_us), depth))
+    return records
+
+
+def profile_imports(module: str, env: dict[str, str]) -> tuple[float, list[ImportRecord]]:
+    """新しいインタプリタで module を import し、経過時間（ms）と import 記録を返す"""
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr[-2000:])
+        raise SystemExit(f"import {module} failed (code {result.returncode})")
+    return elapsed_ms, parse_importtime(result.stderr)
+
+
+def measure_ready(env: dict[str, str]) -> float:
+    """uvicorn を起動してから最初のリクエストに応答するまでの時間（ms）"""
+    from benchmarks.fake_postgrest import FakePostgrestServer, build_dataset
+    from benchmarks.load_test import _free_port, start_app
+
+    with FakePostgrestServer(build_dataset(), latency_ms=0) as upstream:
+        started = time.perf_counter()
+        process = start_app({**env, "SUPABASE_URL": upstream.url}, _free_port(), workers=1)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        process.terminate()
+        process.wait(timeout=30)
+    return elapsed_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="起動時間の計測")
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=3, help="計測回数（最も速い回を表示）")
+    parser.add_argument("--top", type=int, default=20, help="表示するモジュール数")
+    parser.add_argument("--budget-ms", type=float, help="app.main の import 時間の上限")
+    parser.add_argument("--ready", action="store_true", help="起動から応答可能になるまでの時間も計測")
+    parser.add_argument("--app-env", action="append", default=[], metavar="KEY=VALUE", help="アプリに渡す環境変数")
+    args = parser.parse_args()
+
+    env = {**PLACEHOLDER_ENV, **os.environ}
+    env.update(item.split("=", 1) for item in args.app_env)
+
+    runs = [profile_imports(args.module, env) for _ in range(args.runs)]
+    wall_ms, records = min(runs, key=lambda run: run[0])
+    target = next(r for r in records if r.module == args.module)
+    import_ms = target.cumulative_us / 1000
+
+    by_package: dict[str, int] = defaultdict(int)
+    for r in records:
+        by_package[r.module.split(".")[0]] += r.self_us
+
+    print(f"import {args.module}: {import_ms:.1f}ms (process {wall_ms:.1f}ms, best of {args.runs})")
+    print(f"\n{'package':<28}{'self ms':>10}")
+    for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{package:<28}{self_us / 1000:>10.1f}")
+    print(f"\n{'module':<48}{'self ms':>10}{'cumul ms':>10}")
+    for r in sorted(records, key=lambda r: -r.cumulative_us)[:args.top]:
+        print(f"{r.module:<48}{r.self_us / 1000:>10.1f}{r.cumulative_us / 1000:>10.1f}")
+
+    if args.ready:
+        print(f"\nready (uvicorn start -> first response): {measure_ready(env):.1f}ms")
+
+    failures = []
+    loaded = {r.module for r in records}
+    for module in LAZY_MODULES:
+        if module in loaded:
+            failures.append(f"{module} is imported at startup (expected lazy)")
+    if args.budget_ms is not None and import_ms > args.budget_ms:
+        failures.append(f"import {args.module} took {import_ms:.1f}ms (budget {args.budget_ms:.0f}ms)")
+    if failures:
+        print("\nStartup budget exceeded:")
+        for line in failures:
+            print(f"  - {line}")
+        raise SystemExit(1)
+    if args.budget_ms is not None:
+        print(f"\nWithin budget ({args.budget_ms:.0f}ms) and lazy modules not loaded")
+
+
+if __name__ == "__main__":
+    main()
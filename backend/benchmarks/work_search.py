@@ -0,0 +1,176 @@
+"""
+作品検索の索引のベンチマーク
+
+合成した作品一覧から WorkSearchIndex を作り、以下を表示する。
+
+- 最初の索引作成と、一部の作品だけ変わったときの再索引にかかる時間
+- 索引の更新後、最初の検索（語ごとの一致を作る）の時間
+- 検索語の種類（日本語・英単語・前方一致・複数語）ごとの検索時間（p50 / p99）
+- 一致が多いときに打ち切った上位 20 件が、すべての一致を計算した上位 20 件と同じこと
+- 変更した作品が新しい内容で見つかり、削除した作品が見つからなくなること
+
+検索時間の p99 が --budget-us を超えるか、上位が一致しないか、更新が反映されなければ終了コード1。
+ルート経由（レスポンスの組み立てとエンコードを含む）の時間は benchmarks.json_serialization で計測する。
+
+    python -m benchmarks.work_search --works 5000
+"""
+import argparse
+import asyncio
+import dataclasses
+import os
+import random
+import time
+
+# 日本語の語は「対象 + 処理」の組み合わせ（400語）。出現頻度は順位に反比例（Zipf）させる
+JA_SUBJECTS = [
+    "画像", "文書", "音声", "動画", "在庫", "予約", "決済", "顧客", "勤怠", "会計",
+    "物流", "学習", "医療", "採用", "広告", "契約", "不動産", "農業", "観光", "教育",
+]
+JA_ACTIONS = [
+    "検索", "認識", "分類", "生成", "管理", "分析", "可視化", "通知", "自動化", "最適化",
+    "推薦", "要約", "翻訳", "監視", "予測", "集計", "照合", "配信", "審査", "共有",
+]
+JA_WORDS = [subject + action for subject in JA_SUBJECTS for action in JA_ACTIONS]
+EN_WORDS = [
+    "FastAPI", "Next.js", "React", "TypeScript", "Python", "Supabase", "PostgreSQL", "Docker", "Azure", "Redis",
+    "RAG", "LangChain", "Kubernetes", "Terraform", "GraphQL", "Django", "Flask", "Vue", "Svelte", "Go",
+    "Rust", "Kotlin", "Swift", "Flutter", "Firebase", "AWS", "GCP", "Elasticsearch", "Kafka", "Spark",
+    "PyTorch", "TensorFlow", "OpenAI", "Whisper", "Stable Diffusion", "Tailwind", "Prisma", "tRPC", "Hono", "Deno",
+]
+FILLERS = ["を使った", "による", "のための", "と連携した", "に対応した"]
+ROLES = ["フロントエンド開発", "バックエンド開発", "フルスタック開発", "インフラ構築", "データ分析"]
+QUERIES = {
+    "ja": ["画像認識", "文書検索", "在庫管理", "顧客分析", "会計自動化"],
+    "en": ["fastapi", "react", "postgresql", "langchain", "docker"],
+    "prefix": ["fast", "type", "post", "lang", "画"],
+    "multi": ["文書検索 fastapi", "画像分類 python", "在庫管理 redis 最適化", "react 可視化", "rag 文書要約"],
+}
+
+
+def _zipf_choice(rng: random.Random, words: list[str]) -> str:
+    return rng.choices(words, weights=[1 / (rank + 1) for rank in range(len(words))])[0]
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return rng.choice(FILLERS).join(_zipf_choice(rng, JA_WORDS) for _ in range(words)) + "。"
+
+
+def build_works(count: int, seed: int = 0) -> list[dict]:
+    """検索対象の文章を変えた作品の行"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        technologies = list(dict.fromkeys(_zipf_choice(rng, EN_WORDS) for _ in range(rng.randint(2, 6))))
+        rows.append({
+            "id": f"work-{i}",
+            "title": f"{_zipf_choice(rng, JA_WORDS)}{rng.choice(['アプリ', 'サービス', '基盤'])} {i}",
+            "description": "".join(_sentence(rng, rng.randint(2, 4)) for _ in range(rng.randint(2, 6))) + f" {' '.join(technologies)} で構築。",
+            "thumbnail": f"/works/work-{i}/thumbnail.png",
+            "category": rng.choice(["AI", "Web", "インフラ"]),
+            "featured": i % 7 == 0,
+            "technologies": technologies,
+            "role": rng.choice(ROLES),
+            "learnings": _sentence(rng, rng.randint(1, 3)),
+        })
+    return rows
+
+
+def _percentile(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+async def run(args: argparse.Namespace) -> list[str]:
+    from app.domain.entity.work import WorkRecord
+    from app.infra.search.work_search_index import WorkSearchIndex
+
+    failed = []
+    works = [WorkRecord.from_row(row) for row in build_works(args.works, seed=args.seed)]
+    index = WorkSearchIndex()
+
+    started = time.perf_counter()
+    await index.refresh(works)
+    build_ms = (time.perf_counter() - started) * 1000
+    stats = index.stats()
+    print(f"{args.works} works: build {build_ms:.0f} ms, {stats['terms']} terms")
+
+    cold = []
+    for query in [query for queries in QUERIES.values() for query in queries]:
+        started = time.perf_counter()
+        index.search(query, 20)
+        cold.append((time.perf_counter() - started) * 1000)
+    print(f"first query after refresh: p50 {_percentile(cold, 0.5):.1f} ms, max {max(cold):.1f} ms")
+
+    print(f"{'query kind':<12}{'p50 us':>9}{'p99 us':>9}{'avg hits':>10}")
+    worst_p99 = 0.0
+    for kind, queries in QUERIES.items():
+        timings, hits = [], 0
+        for _ in range(args.repeat):
+            for query in queries:
+                started = time.perf_counter()
+                result = index.search(query, 20)
+                timings.append((time.perf_counter() - started) * 1e6)
+                hits += result.total
+        p99 = _percentile(timings, 0.99)
+        worst_p99 = max(worst_p99, p99)
+        print(f"{kind:<12}{_percentile(timings, 0.5):>9.0f}{p99:>9.0f}{hits / len(timings):>10.0f}")
+    if worst_p99 > args.budget_us:
+        failed.append(f"p99 {worst_p99:.0f}us exceeds {args.budget_us:.0f}us")
+
+    exact = WorkSearchIndex(rank_depth=None)
+    await exact.refresh(works)
+    mismatched = []
+    for query in [query for queries in QUERIES.values() for query in queries]:
+        ranked = [(hit.work.id, hit.score) for hit in index.search(query, 20).hits]
+        expected = [(hit.work.id, hit.score) for hit in exact.search(query, 20).hits]
+        if ranked != expected:
+            mismatched.append(query)
+    print(f"top-20 identical to scoring every match: {not mismatched}")
+    if mismatched:
+        failed.append(f"top-20 differs from scoring every match: {', '.join(mismatched)}")
+
+    # 1% の作品を書き換え、1件を削除した一覧（キャッシュの再取得に相当）
+    rng = random.Random(args.seed + 1)
+    changed_ids = {work.id for work in rng.sample(works, max(1, len(works) // 100))}
+    removed = works[-1]
+    updated = [
+        dataclasses.replace(work, learnings=f"{work.learnings} 量子アニーリング") if work.id in changed_ids
+        else WorkRecord.from_row(work.dict())
+        for work in works[:-1]
+    ]
+    started = time.perf_counter()
+    await index.refresh(updated)
+    refresh_ms = (time.perf_counter() - started) * 1000
+    reindexed = index.stats()["reindexed"] - stats["reindexed"]
+    print(f"refresh after {len(changed_ids)} changes: {refresh_ms:.1f} ms, {reindexed} works reindexed")
+
+    found = {hit.work.id for hit in index.search("量子アニーリング", len(works)).hits}
+    if found != changed_ids - {removed.id}:
+        failed.append(f"changed works not found ({len(found)} of {len(changed_ids)})")
+    if any(hit.work.id == removed.id for hit in index.search(removed.title, len(works)).hits):
+        failed.append("removed work still found")
+    if reindexed > len(changed_ids):
+        failed.append(f"{reindexed} works reindexed for {len(changed_ids)} changes")
+    return failed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="作品検索の索引のベンチマーク")
+    parser.add_argument("--works", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budget-us", type=float, default=3000.0, help="検索時間の p99 の上限（マイクロ秒）")
+    args = parser.parse_args()
+
+    os.environ.setdefault("SUPABASE_URL", "http://127.0.0.1:54321")
+    os.environ.setdefault("SUPABASE_KEY", "bench.fake.key")
+
+    failed = asyncio.run(run(args))
+    for reason in failed:
+        print(f"FAILED: {reason}")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
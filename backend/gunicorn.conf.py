@@ -0,0 +1,45 @@
+"""
+本番用gunicorn設定
+
+    gunicorn app.main:app -c gunicorn.conf.py
+
+各値は環境変数で上書きできる（WEB_CONCURRENCY はRender/Herokuの慣例に合わせる）。
+"""
+import multiprocessing
+import os
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+# 1ワーカー = 1イベントループ = 1コア。I/O待ちは各ワーカー内の非同期処理で吸収する
+workers = _env_int("WEB_CONCURRENCY", multiprocessing.cpu_count())
+worker_class = "app.core.server.UvicornWorker"
+
+# keep-alive（秒）はリバースプロキシのアイドルタイムアウトより長くする
+keepalive = _env_int("GUNICORN_KEEPALIVE", 75)
+backlog = _env_int("GUNICORN_BACKLOG", 2048)
+
+# 応答しないワーカーの再起動までの秒数
+timeout = _env_int("GUNICORN_TIMEOUT", 60)
+# SIGTERM後、処理中のリクエストとメール送信キュー（EMAIL_OUTBOX_DRAIN_TIMEOUT）を
+# 待つ秒数。これを過ぎたワーカーは強制終了される
+graceful_timeout = _env_int("GUNICORN_GRACEFUL_TIMEOUT", 30)
+
+# メモリ断片化対策の定期再起動（0で無効）
+max_requests = _env_int("GUNICORN_MAX_REQUESTS", 0)
+max_requests_jitter = _env_int("GUNICORN_MAX_REQUESTS_JITTER", max_requests // 10)
+
+# リバースプロキシ配下で X-Forwarded-* を信頼するアドレス
+forwarded_allow_ips = os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1")
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
+
+# 起動を速くするための preload はしない（Supabaseクライアント等はワーカーごとに遅延生成する）
+preload_app = False
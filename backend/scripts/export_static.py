@@ -0,0 +1,236 @@
+"""
+GETエンドポイントの静的JSONエクスポート
+
+WorkUseCase / SkillUseCase / AboutUseCase / HeroUseCase（と PortfolioUseCase）で
+各GETエンドポイントのレスポンスを作り、内容ハッシュ付きのファイル名で書き出す。
+ボディはAPIと同じエンコード（ResponseSnapshot）で、COMPRESSION_MIN_SIZE 以上は
+.br / .gz も書き出す。CDN や Next.js のビルドは manifest.json を読んでファイルを配信する。
+
+- 内容が前回と同じルートは書き直さない（前回の manifest.json と比較）
+- manifest.json はすべてのファイルを書き終えてから置き換える（途中で失敗したら前回のまま）
+- 内容ハッシュ付きのファイルは不変なので、古いファイルは --prune を付けたときだけ消す
+- ページング・項目指定付きの /works は対象外（条件の組み合わせが無限のため）
+
+    python -m scripts.export_static --out dist/api --concurrency 8 --prune
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+from urllib.parse import quote
+
+import anyio.to_thread
+from fastapi import HTTPException
+
+from app.core.http_cache import ResponseSnapshot
+from app.dependencies.dependency_injector import (
+    get_about_usecase,
+    get_hero_usecase,
+    get_portfolio_usecase,
+    get_skill_usecase,
+    get_work_usecase,
+)
+from app.infra.supabase_client import supabase_provider
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+# 圧縮版のファイル拡張子（Content-Encoding -> 拡張子）
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+# 作品詳細の事前取得（1回の in 問い合わせ）の件数
+WORK_PREFETCH_CHUNK = 100
+
+
+@dataclass(frozen=True)
+class ExportTarget:
+    """書き出すルートと、そのレスポンス内容を作る処理"""
+    route: str
+    stem: str
+    build: Callable[[], Awaitable[Any]]
+
+
+def _segment(value: str) -> str:
+    """ID・カテゴリ名をファイル名に使える形にする"""
+    return quote(value, safe="")
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def load_manifest(out_dir: str) -> dict[str, Any]:
+    """前回の manifest.json（なければ空）"""
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"routes": {}}
+
+
+def manifest_files(manifest: dict[str, Any]) -> set[str]:
+    """manifest が参照するファイル（出力ディレクトリからの相対パス）"""
+    files = set()
+    for entry in manifest.get("routes", {}).values():
+        files.add(entry["file"])
+        files.update(entry.get("encodings", {}).values())
+    return files
+
+
+async def collect_targets() -> list[ExportTarget]:
+    """書き出すルート一覧（作品ID・スキルカテゴリはデータから列挙する）"""
+    client = supabase_provider.get_repository_client()
+    works = get_work_usecase(client)
+    skills = get_skill_usecase(client)
+    about = get_about_usecase(client)
+    hero = get_hero_usecase(client)
+    portfolio = get_portfolio_usecase(client)
+
+    async def all_sections():
+        result = await portfolio.get_portfolio(portfolio.parse_sections(None))
+        return ResponseSnapshot.from_content(result.dict(exclude_unset=True), degraded=result.degraded)
+
+    all_works, categories = await asyncio.gather(works.get_all_works(), skills.get_categories())
+    work_ids = [work.id for work in all_works]
+    # キャッシュ層があれば作品詳細をまとめて取得しておき、作品ごとの問い合わせを避ける
+    for start in range(0, len(work_ids), WORK_PREFETCH_CHUNK):
+        await works.get_works_by_ids(work_ids[start:start + WORK_PREFETCH_CHUNK])
+
+    targets = [
+        ExportTarget("/works", "works", works.get_all_works),
+        ExportTarget("/skills", "skills", skills.get_all_skills),
+        ExportTarget("/skills/categories", "skills/categories", skills.get_categories),
+        ExportTarget("/about", "about", about.get_about_data),
+        ExportTarget("/hero/introduction", "hero/introduction", hero.get_introduction),
+        ExportTarget("/hero/timeline", "hero/timeline", hero.get_timeline),
+        ExportTarget("/portfolio", "portfolio", all_sections),
+    ]
+    targets += [
+        ExportTarget(f"/skills?category={quote(category)}", f"skills/category/{_segment(category)}",
+                     lambda category=category: skills.get_skills_by_category(category))
+        for category in categories
+    ]
+    targets += [
+        ExportTarget(f"/works/{quote(work_id, safe='')}", f"works/{_segment(work_id)}",
+                     lambda work_id=work_id: works.get_work_by_id(work_id))
+        for work_id in work_ids
+    ]
+    return targets
+
+
+class StaticExporter:
+    """ルートごとのレスポンスを内容ハッシュ付きのファイルとして書き出す"""
+
+    def __init__(self, out_dir: str, concurrency: int = 8):
+        self.out_dir = out_dir
+        self.concurrency = concurrency
+        self.previous = load_manifest(out_dir)
+        self.written = 0
+        self.unchanged = 0
+        self.skipped: list[str] = []
+
+    async def export(self, targets: list[ExportTarget]) -> dict[str, Any]:
+        """全ルートを並行して書き出し、新しい manifest を返す（まだ保存しない）"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(target: ExportTarget):
+            async with semaphore:
+                return target.route, await self._export_one(target)
+
+        results = await asyncio.gather(*(run(target) for target in targets))
+        routes = {route: entry for route, entry in sorted(results) if entry is not None}
+        version = hashlib.sha256(
+            json.dumps({route: entry["hash"] for route, entry in routes.items()}, sort_keys=True).encode()
+        ).hexdigest()[:16]
+        return {"version": version, "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), "routes": routes}
+
+    def save_manifest(self, manifest: dict[str, Any], prune: bool = False) -> int:
+        """manifest.json を置き換え、prune なら参照されなくなったファイルを消す（消した数を返す）"""
+        body = json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True).encode()
+        _atomic_write(os.path.join(self.out_dir, MANIFEST_NAME), body)
+        if not prune:
+            return 0
+        removed = 0
+        for name in manifest_files(self.previous) - manifest_files(manifest):
+            try:
+                os.remove(os.path.join(self.out_dir, name))
+                removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+    async def _export_one(self, target: ExportTarget) -> dict[str, Any] | None:
+        try:
+            content = await target.build()
+        except HTTPException as e:
+            if e.status_code != 404:
+                raise
+            # データがないルート（例: about 未登録）は書き出さない
+            self.skipped.append(target.route)
+            return None
+        snapshot = content if isinstance(content, ResponseSnapshot) else ResponseSnapshot.from_content(content)
+        if snapshot.degraded:
+            # 一部の取得に失敗して補った内容は配信させない（manifest は前回のまま）
+            raise RuntimeError(f"{target.route}: upstream partially failed, refusing to export degraded content")
+        digest = hashlib.sha256(snapshot.body).hexdigest()[:16]
+        previous = self.previous.get("routes", {}).get(target.route)
+        if previous is not None and previous["hash"] == digest and self._exists(previous):
+            self.unchanged += 1
+            return previous
+        entry = await anyio.to_thread.run_sync(self._write, target, snapshot, digest)
+        self.written += 1
+        return entry
+
+    def _write(self, target: ExportTarget, snapshot: ResponseSnapshot, digest: str) -> dict[str, Any]:
+        name = f"{target.stem}.{digest}.json"
+        _atomic_write(os.path.join(self.out_dir, name), snapshot.body)
+        encodings = {}
+        for encoding, body in snapshot.precompressed().variants:
+            encoded_name = name + ENCODING_SUFFIXES[encoding]
+            _atomic_write(os.path.join(self.out_dir, encoded_name), body)
+            encodings[encoding] = encoded_name
+        return {"file": name, "hash": digest, "etag": snapshot.etag, "size": len(snapshot.body), "encodings": encodings}
+
+    def _exists(self, entry: dict[str, Any]) -> bool:
+        return all(os.path.exists(os.path.join(self.out_dir, name)) for name in [entry["file"], *entry.get("encodings", {}).values()])
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    started = time.perf_counter()
+    exporter = StaticExporter(args.out, concurrency=args.concurrency)
+    try:
+        targets = await collect_targets()
+        manifest = await exporter.export(targets)
+    finally:
+        await supabase_provider.aclose()
+    removed = exporter.save_manifest(manifest, prune=args.prune)
+    print(
+        f"version {manifest['version']}: {len(manifest['routes'])} routes, {exporter.written} written, "
+        f"{exporter.unchanged} unchanged, {removed} removed, {len(exporter.skipped)} skipped "
+        f"({time.perf_counter() - started:.1f}s) -> {os.path.join(args.out, MANIFEST_NAME)}"
+    )
+    for route in exporter.skipped:
+        print(f"  skipped (404): {route}")
+    return manifest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="GETエンドポイントを静的JSONとして書き出す")
+    parser.add_argument("--out", default="dist/api", help="出力ディレクトリ")
+    parser.add_argument("--concurrency", type=int, default=8, help="同時に作るルート数")
+    parser.add_argument("--prune", action="store_true", help="manifest から外れた古いファイルを消す")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,128 +1,222 @@
-import os
+"""
+Supabaseへの初期データ投入（何度実行しても重複しない）
+
+フィクスチャ（scripts/fixtures/seed.json）と、任意件数の合成データを投入する。
+すべての行は固定のIDを持ち、id をキーに upsert するため、再実行しても行は増えず
+内容だけが更新される。挿入結果のIDを読み戻す往復はない。
+
+- 各テーブルを --chunk-size 行ずつの upsert に分けて送る
+- 依存のないテーブル同士・チャンク同士は並行して送る（同時実行数は --concurrency）
+- education / experience / social_media は about の投入が終わってから送る（外部キー）
+
+RLSで書き込みが制限されている場合は、SUPABASE_KEY に service_role キーを指定する。
+設定（SUPABASE_URL / SUPABASE_KEY）は投入するときだけ読み込むため、--dry-run には不要。
+
+    python -m scripts.init_db
+    python -m scripts.init_db --works 5000 --skills 1000 --timeline 500 --chunk-size 500
+"""
+import argparse
+import asyncio
 import json
-from dotenv import load_dotenv
-from supabase import create_client, Client
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
 
-# 環境変数の読み込み
-load_dotenv()
+from postgrest.types import ReturnMethod
 
-# Supabase接続
-supabase_url = os.getenv("SUPABASE_URL")
-supabase_key = os.getenv("SUPABASE_KEY")
-supabase: Client = create_client(supabase_url, supabase_key)
+DEFAULT_FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "seed.json")
 
-def create_tables():
-    """Supabaseにテーブルを作成する"""
-    
-    print("Supabaseテーブル作成スクリプト")
-    try:
-        # スキルカテゴリの作成
-        supabase.table("skill_categories").insert([
-            {"name": "フロントエンド"},
-            {"name": "バックエンド"},
-            {"name": "デザイン"},
-            {"name": "DevOps"},
-            {"name": "その他"}
-        ]).execute()
-        print("スキルカテゴリを作成しました")
-    except Exception as e:
-        print(f"スキルカテゴリ作成エラー: {str(e)}")
-    
-    # サンプルスキル追加
-    try:
-        # フロントエンドカテゴリのIDを取得
-        cat_response = supabase.table("skill_categories").select("id").eq("name", "フロントエンド").execute()
-        if cat_response.data:
-            frontend_cat_id = cat_response.data[0]["id"]
-            
-            # スキルの追加
-            supabase.table("skills").insert([
-                {"name": "React", "level": 85, "category_id": frontend_cat_id, "icon": "react.svg"},
-                {"name": "TypeScript", "level": 80, "category_id": frontend_cat_id, "icon": "typescript.svg"},
-                {"name": "Next.js", "level": 75, "category_id": frontend_cat_id, "icon": "nextjs.svg"}
-            ]).execute()
-            print("サンプルスキルを追加しました")
-    except Exception as e:
-        print(f"スキル追加エラー: {str(e)}")
-    
-    # サンプルプロフィール追加
-    try:
-        # プロフィール情報の追加
-        about_response = supabase.table("abouts").insert({
-            "name": "青木 駿介",
-            "title": "フルスタック開発者",
-            "summary": "Webアプリケーション開発に情熱を持つエンジニアです。",
-            "profile_image": "/images/profile.jpg",
-            "bio": "3年間のWeb開発経験を持つフルスタック開発者です。UI/UXデザインからバックエンド開発、インフラ構築まで幅広いスキルを持っています。"
-        }).execute()
-        
-        if about_response.data:
-            about_id = about_response.data[0]["id"]
-            
-            # 学歴情報の追加
-            supabase.table("educations").insert({
-                "institution": "早稲田大学",
-                "degree": "学士",
-                "field": "機械工学",
-                "start_date": "2021-04-01",
-                "end_date": "2025-03-31",
-                "about_id": about_id
-            }).execute()
-            
-            # 職歴情報の追加
-            supabase.table("experiences").insert({
-                "company": "株式会社インテリジェントフォース",
-                "position": "AIエンジニア",
-                "start_date": "2024-10-01",
-                "description": "AI開発とバックエンド開発を担当",
-                "achievements": json.dumps(["Azureを活用したRAGの開発", "スケジュール管理システムの開発"]),
-                "about_id": about_id
-            }).execute()
-            
-            # SNS情報の追加
-            supabase.table("social_media").insert([
-                {"platform": "GitHub", "url": "https://github.com/example", "about_id": about_id},
-                {"platform": "Twitter", "url": "https://twitter.com/example", "about_id": about_id}
-            ]).execute()
-            
-            print("サンプルプロフィールを追加しました")
-    except Exception as e:
-        print(f"プロフィール追加エラー: {str(e)}")
-    
-    # サンプルプロジェクト追加
+# 投入順（依存先が先）と、各テーブルが投入を待つテーブル
+SEED_TABLES = (
+    "about",
+    "works",
+    "skills",
+    "hero_introduction",
+    "timeline_items",
+    "education",
+    "experience",
+    "social_media",
+)
+TABLE_DEPENDENCIES = {
+    "education": ("about",),
+    "experience": ("about",),
+    "social_media": ("about",),
+}
+
+SYNTHETIC_CATEGORIES = ["フロントエンド", "バックエンド", "インフラ", "AI", "その他"]
+SYNTHETIC_TECHNOLOGIES = ["Python", "FastAPI", "TypeScript", "Next.js", "React", "Azure", "Supabase", "Docker", "PostgreSQL", "Redis"]
+# 合成データのIDの開始位置（フィクスチャのIDと重ならないようにする）
+SYNTHETIC_ID_OFFSET = 100000
+
+
+def load_fixture(path: str) -> dict[str, list[dict]]:
+    """フィクスチャ（テーブル名 -> 行リストのJSON）を読み込む"""
+    with open(path, encoding="utf-8") as f:
+        tables = json.load(f)
+    unknown = sorted(set(tables) - set(SEED_TABLES))
+    if unknown:
+        raise ValueError(f"Unknown tables in fixture: {', '.join(unknown)}")
+    for table, rows in tables.items():
+        missing = [row for row in rows if "id" not in row]
+        if missing:
+            raise ValueError(f"Every fixture row needs an id ({table}: {len(missing)} rows without id)")
+    return tables
+
+
+def generate_synthetic(works: int = 0, skills: int = 0, timeline: int = 0, seed: int = 0) -> dict[str, list[dict]]:
+    """
+    負荷試験用の合成データを作る
+
+    同じ引数からは同じ行（ID・内容）を作るため、再実行しても重複しない。
+    """
+    rng = random.Random(seed)
+    base = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    tables: dict[str, list[dict]] = {"works": [], "skills": [], "timeline_items": []}
+    for i in range(works):
+        technologies = rng.sample(SYNTHETIC_TECHNOLOGIES, rng.randint(2, 5))
+        tables["works"].append({
+            "id": f"synthetic-work-{i:06d}",
+            "title": f"合成プロジェクト {i}",
+            "description": f"{'・'.join(technologies)} を使った合成データのプロジェクト {i} の説明。" * rng.randint(1, 4),
+            "thumbnail": f"/images/synthetic/work-{i}.jpg",
+            "category": rng.choice(SYNTHETIC_CATEGORIES),
+            "featured": rng.random() < 0.05,
+            "technologies": technologies,
+            "github_link": f"https://github.com/example/synthetic-{i}",
+            "demo_link": None,
+            "blog_link": None,
+            "screenshots": {"ホーム画面": f"/images/synthetic/work-{i}-home.jpg"},
+            "duration": "2024年4月 - 2024年9月",
+            "role": rng.choice(["フロントエンド開発", "バックエンド開発", "フルスタック開発"]),
+            "learnings": "合成データのため学びは特にありません。",
+            "created_at": (base + timedelta(hours=i)).isoformat(),
+        })
+    for i in range(skills):
+        tables["skills"].append({
+            "id": SYNTHETIC_ID_OFFSET + i,
+            "name": f"Skill {i}",
+            "level": rng.randint(1, 100),
+            "category": rng.choice(SYNTHETIC_CATEGORIES),
+            "icon": None,
+            "description": "合成データ",
+        })
+    for i in range(timeline):
+        tables["timeline_items"].append({
+            "id": f"synthetic-{i}",
+            "period": str(2000 + i % 30),
+            "title": f"合成タイムライン {i}",
+            "subtitle": None,
+            "sort_order": SYNTHETIC_ID_OFFSET + i,
+        })
+    return tables
+
+
+def merge_tables(*datasets: dict[str, list[dict]]) -> dict[str, list[dict]]:
+    """テーブルごとに行をまとめる（同じIDは後のものを使う。1回の upsert に同じIDが2回あると失敗するため）"""
+    merged: dict[str, dict] = {}
+    for dataset in datasets:
+        for table, rows in dataset.items():
+            by_id = merged.setdefault(table, {})
+            for row in rows:
+                by_id[row["id"]] = row
+    return {table: list(merged[table].values()) for table in SEED_TABLES if merged.get(table)}
+
+
+def chunk_rows(rows: list[dict], size: int) -> list[list[dict]]:
+    """
+    rows を size 行以下のチャンクに分ける
+
+    PostgRESTの一括挿入はすべての行が同じ列を持つ必要があるため、列の組み合わせごとに分ける。
+    """
+    groups: dict[tuple[str, ...], list[dict]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+    return [group[start:start + size] for group in groups.values() for start in range(0, len(group), size)]
+
+
+class Seeder:
+    """テーブルごとのチャンクを upsert で並行して投入する"""
+
+    def __init__(self, client, chunk_size: int = 500, concurrency: int = 4):
+        # 設定を読み込むため、投入するときまで import しない
+        from app.infra.repository.query_executor import execute
+
+        self._execute = execute
+        self.client = client
+        self.chunk_size = chunk_size
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.requests = 0
+
+    async def seed(self, tables: dict[str, list[dict]]) -> dict[str, int]:
+        """全テーブルを投入し、テーブルごとの行数を返す（依存先の投入が終わるまで待つ）"""
+        tasks: dict[str, asyncio.Task] = {}
+        for table in SEED_TABLES:
+            if table not in tables:
+                continue
+            dependencies = [tasks[name] for name in TABLE_DEPENDENCIES.get(table, ()) if name in tasks]
+            tasks[table] = asyncio.create_task(self._seed_table(table, tables[table], dependencies))
+        try:
+            counts = await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        return dict(zip(tasks, counts))
+
+    async def _seed_table(self, table: str, rows: list[dict], dependencies: list[asyncio.Task]) -> int:
+        if dependencies:
+            await asyncio.gather(*dependencies)
+        started = time.perf_counter()
+        chunks = chunk_rows(rows, self.chunk_size)
+        await asyncio.gather(*(self._upsert(table, chunk) for chunk in chunks))
+        print(f"  {table:<18}{len(rows):>8} rows  {len(chunks):>4} chunks  {time.perf_counter() - started:>6.2f}s")
+        return len(rows)
+
+    async def _upsert(self, table: str, rows: list[dict]) -> None:
+        async with self.semaphore:
+            # 結果の行は使わないため minimal で返させる
+            await self._execute(self.client.table(table).upsert(rows, on_conflict="id", returning=ReturnMethod.minimal))
+            self.requests += 1
+
+
+async def run(args: argparse.Namespace) -> dict[str, int]:
+    datasets = [] if args.no_fixture else [load_fixture(args.fixture)]
+    datasets.append(generate_synthetic(args.works, args.skills, args.timeline, seed=args.seed))
+    tables = merge_tables(*datasets)
+    if args.dry_run:
+        for table, rows in tables.items():
+            print(f"  {table:<18}{len(rows):>8} rows  {len(chunk_rows(rows, args.chunk_size)):>4} chunks")
+        return {table: len(rows) for table, rows in tables.items()}
+
+    from app.infra.supabase_client import supabase_provider
+
+    started = time.perf_counter()
+    seeder = Seeder(supabase_provider.get_async_client(), chunk_size=args.chunk_size, concurrency=args.concurrency)
     try:
-        # プロジェクト情報の追加
-        work_response = supabase.table("works").insert({
-            "id": "sample-project",
-            "title": "サンプルプロジェクト",
-            "description": "これはサンプルプロジェクトの説明です。",
-            "thumbnail": "/images/projects/sample.jpg",
-            "category": "Webアプリ",
-            "duration": "2022年4月 - 2022年6月",
-            "role": "フロントエンド開発者",
-            "github_url": "https://github.com/example/sample",
-            "demo_url": "https://example.com"
-        }).execute()
-        
-        if work_response.data:
-            work_id = work_response.data[0]["id"]
-            
-            # スクリーンショットの追加
-            supabase.table("screenshots").insert([
-                {"url": "/images/projects/sample-1.jpg", "caption": "ホーム画面", "work_id": work_id},
-                {"url": "/images/projects/sample-2.jpg", "caption": "機能紹介", "work_id": work_id}
-            ]).execute()
-            
-            # 使用技術の追加
-            supabase.table("work_technologies").insert([
-                {"work_id": work_id, "technology": "React"},
-                {"work_id": work_id, "technology": "TypeScript"},
-                {"work_id": work_id, "technology": "Node.js"}
-            ]).execute()
-            
-            print("サンプルプロジェクトを追加しました")
-    except Exception as e:
-        print(f"プロジェクト追加エラー: {str(e)}")
+        counts = await seeder.seed(tables)
+    finally:
+        await supabase_provider.aclose()
+    print(f"{sum(counts.values())} rows upserted in {seeder.requests} requests ({time.perf_counter() - started:.2f}s)")
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Supabaseへの初期データ投入（再実行しても重複しない）")
+    parser.add_argument("--fixture", default=DEFAULT_FIXTURE, help="フィクスチャのJSON（テーブル名 -> 行リスト）")
+    parser.add_argument("--no-fixture", action="store_true", help="フィクスチャを投入しない（合成データのみ）")
+    parser.add_argument("--works", type=int, default=0, help="合成する作品数")
+    parser.add_argument("--skills", type=int, default=0, help="合成するスキル数")
+    parser.add_argument("--timeline", type=int, default=0, help="合成するタイムライン項目数")
+    parser.add_argument("--seed", type=int, default=0, help="合成データの乱数シード")
+    parser.add_argument("--chunk-size", type=int, default=500, help="1回の upsert の行数")
+    parser.add_argument("--concurrency", type=int, default=4, help="同時に送る upsert の数")
+    parser.add_argument("--dry-run", action="store_true", help="投入せずに件数だけ表示")
+    args = parser.parse_args()
+    if args.chunk_size < 1 or args.concurrency < 1:
+        parser.error("--chunk-size and --concurrency must be positive")
+    asyncio.run(run(args))
+
 
 if __name__ == "__main__":
-    create_tables() 
+    main()
@@ -0,0 +1,23 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+# app.core.config は import 時に必須の設定を読むため、テスト用の値を先に入れておく
+os.environ.setdefault("SUPABASE_URL", "http://127.0.0.1:54321")
+os.environ.setdefault("SUPABASE_KEY", "test.fake.key")
+
+
+async def _wait_until(predicate, timeout: float = 5.0, interval: float = 0.01) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError(f"Condition not met within {timeout}s")
+        await asyncio.sleep(interval)
+
+
+@pytest.fixture
+def wait_until():
+    """predicate() が真になるまで待つ（timeout 秒を過ぎたら AssertionError）"""
+    return _wait_until
@@ -0,0 +1,48 @@
+"""プロフィール取得：一括取得（埋め込みリソース）と個別取得が同じ結果を返すこと"""
+import asyncio
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from app.core.config import settings
+from app.infra.repository.supabase_about_repository import SupabaseAboutRepository
+from app.infra.supabase_client import supabase_provider
+from app.usecase.about_usecase import AboutUseCase
+from benchmarks.fake_postgrest import FakePostgrestServer, build_dataset
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    dataset = build_dataset()
+    education = dataset["education"][0]
+    # 自己紹介に紐づかない行（about_id が別・未設定）と、並び順を確かめるための2件目
+    dataset["education"] += [
+        {**education, "id": 2, "institution": "高校", "start_date": "2018-04-01", "end_date": "2021-03-31"},
+        {**education, "id": 3, "about_id": None, "institution": "紐づかない学校"},
+    ]
+    dataset["experience"].append({**dataset["experience"][0], "id": 2, "about_id": 2, "company": "別の自己紹介の会社"})
+    dataset["social_media"].append({"id": 2, "about_id": None, "platform": "X", "url": "https://x.com/example", "username": None})
+    with FakePostgrestServer(dataset) as server:
+        monkeypatch.setattr(settings, "SUPABASE_URL", server.url)
+        yield server
+
+
+def get_about(use_aggregate_query: bool) -> dict:
+    async def scenario():
+        try:
+            repository = SupabaseAboutRepository(supabase_provider.get_async_client())
+            return await AboutUseCase(repository, use_aggregate_query=use_aggregate_query).get_about_data()
+        finally:
+            await supabase_provider.aclose()
+
+    return jsonable_encoder(asyncio.run(scenario()))
+
+
+def test_aggregate_and_fan_out_return_the_same_rows(upstream):
+    fan_out = get_about(use_aggregate_query=False)
+    aggregate = get_about(use_aggregate_query=True)
+
+    assert aggregate == fan_out
+    assert [row["id"] for row in fan_out["education"]] == [1, 2]
+    assert [row["id"] for row in fan_out["experience"]] == [1]
+    assert [row["id"] for row in fan_out["social_media"]] == [1]
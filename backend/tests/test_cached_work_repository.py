@@ -0,0 +1,71 @@
+"""作品リポジトリのキャッシュ層（一括取得と作品ごとのエントリ）"""
+import asyncio
+
+from app.domain.entity.work import WorkRecord
+from app.infra.cache.async_ttl_cache import AsyncTTLCache
+from app.infra.repository.cached_work_repository import CachedWorkRepository
+from benchmarks.fake_postgrest import build_dataset
+
+
+class InMemoryWorkRepository:
+    """find_by_ids だけを持つリポジトリ（release が set されるまで応答を止められる）"""
+
+    def __init__(self, works: list[WorkRecord]):
+        self.works = {work.id: work for work in works}
+        self.release = asyncio.Event()
+        self.release.set()
+        self.requested: list[list[str]] = []
+
+    async def find_by_ids(self, work_ids: list[str]) -> list[WorkRecord]:
+        self.requested.append(list(work_ids))
+        await self.release.wait()
+        return [self.works[work_id] for work_id in work_ids if work_id in self.works]
+
+
+def make_repository(max_entries: int = 256) -> tuple[CachedWorkRepository, InMemoryWorkRepository, AsyncTTLCache]:
+    upstream = InMemoryWorkRepository([WorkRecord.from_row(row) for row in build_dataset(works=3)["works"]])
+    cache = AsyncTTLCache("works", ttl=60, max_entries=max_entries)
+    return CachedWorkRepository(upstream, cache), upstream, cache
+
+
+def test_batch_get_fetches_only_uncached_works():
+    async def scenario():
+        repository, upstream, _ = make_repository()
+        await repository.find_by_ids(["work-0"])
+        found = await repository.find_by_ids(["work-0", "work-1"])
+        return [work.id for work in found], upstream.requested
+
+    found, requested = asyncio.run(scenario())
+    assert sorted(found) == ["work-0", "work-1"]
+    assert requested == [["work-0"], ["work-1"]]
+
+
+def test_invalidation_during_batch_get_is_not_overwritten():
+    async def scenario():
+        repository, upstream, cache = make_repository()
+        upstream.release.clear()
+        fetching = asyncio.create_task(repository.find_by_ids(["work-0"]))
+        await asyncio.sleep(0)
+        # 問い合わせ中に管理APIや変更通知で works:work-0 が破棄された
+        cache.invalidate("id:work-0")
+        upstream.release.set()
+        await fetching
+        return cache.lookup("id:work-0")
+
+    # 破棄前に読んだ古い行を戻さない
+    assert asyncio.run(scenario()) == (False, None)
+
+
+def test_unknown_ids_do_not_evict_cached_entries():
+    async def scenario():
+        repository, upstream, cache = make_repository(max_entries=4)
+        cache.set("all", "list")
+        await repository.find_by_ids(["work-0", "work-1"])
+        await repository.find_by_ids([f"missing-{i}" for i in range(100)])
+        await repository.find_by_ids(["missing-0"])
+        return set(cache._entries), len(upstream.requested)
+
+    entries, requests = asyncio.run(scenario())
+    assert entries == {"all", "id:work-0", "id:work-1"}
+    # 見つからないIDは保存しないため、次も問い合わせる
+    assert requests == 3
@@ -0,0 +1,145 @@
+"""変更通知によるキャッシュ破棄（QueueChangeSource / Realtime代替サーバー）"""
+import asyncio
+
+import pytest
+
+from app.infra.cache import change_feed
+from app.infra.cache.cache_registry import cache_registry
+from app.infra.cache.change_feed import ChangeEvent, ChangeFeedListener, ChangeSource, QueueChangeSource, SupabaseRealtimeSource
+from app.infra.cache.invalidation import TABLE_NAMESPACES
+from benchmarks.fake_realtime import FakeRealtimeServer
+
+
+@pytest.fixture(autouse=True)
+def seeded_caches():
+    """各名前空間に一覧と作品ごとのエントリを入れておく"""
+    cache_registry.invalidate(notify=False)
+    works = cache_registry.cache("works")
+    for key in ("all", "id:work-1", "id:work-2"):
+        works.set(key, key)
+    cache_registry.cache("works:snapshot").set("works", b"[]")
+    for namespace in ("skills", "about", "hero"):
+        cache_registry.cache(namespace).set("all", namespace)
+    yield
+    cache_registry.invalidate(notify=False)
+
+
+def cached_keys(name: str) -> set:
+    return set(cache_registry.cache(name)._entries)
+
+
+def test_work_change_invalidates_only_that_work(wait_until):
+    async def scenario():
+        source = QueueChangeSource()
+        listener = ChangeFeedListener(source)
+        listener.start()
+        await wait_until(lambda: listener.subscriptions == 1)
+        source.push("works", "UPDATE", "work-1")
+        await wait_until(lambda: listener.events_handled == 1)
+        await listener.stop()
+
+    asyncio.run(scenario())
+    # 他の作品の詳細は残し、一覧と派生キャッシュは破棄する
+    assert cached_keys("works") == {"id:work-2"}
+    assert cached_keys("works:snapshot") == set()
+    assert cached_keys("skills") == {"all"}
+
+
+def test_other_tables_invalidate_their_namespace(wait_until):
+    async def scenario():
+        source = QueueChangeSource()
+        listener = ChangeFeedListener(source)
+        listener.start()
+        source.push("education", "INSERT", "3")
+        source.push("unrelated_table", "UPDATE", "1")
+        await wait_until(lambda: listener.events_handled == 2)
+        await listener.stop()
+
+    asyncio.run(scenario())
+    assert cached_keys("about") == set()
+    assert cached_keys("works") == {"all", "id:work-1", "id:work-2"}
+    assert cached_keys("hero") == {"all"}
+
+
+def test_resubscribe_invalidates_everything(wait_until):
+    async def scenario():
+        source = QueueChangeSource()
+        listener = ChangeFeedListener(source, reconnect_delay=0.01)
+        listener.start()
+        await wait_until(lambda: listener.subscriptions == 1)
+        before = cached_keys("works")
+        # 切断中の通知は失われるため、再購読時に全体を破棄する
+        source.disconnect()
+        await wait_until(lambda: listener.subscriptions == 2)
+        await listener.stop()
+        return before
+
+    assert asyncio.run(scenario()) == {"all", "id:work-1", "id:work-2"}
+    for name in ("works", "skills", "about", "hero"):
+        assert cached_keys(name) == set()
+
+
+class FlakySource(ChangeSource):
+    """最初の failures 回の接続は失敗し、その後は購読してから切断される"""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.attempts = 0
+
+    async def events(self):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise ConnectionError("refused")
+        yield ChangeEvent("*", change_feed.SUBSCRIBED)
+        raise ConnectionError("dropped")
+
+
+def test_reconnect_backoff_doubles_and_resets(monkeypatch):
+    delays = []
+    sleep = asyncio.sleep
+
+    async def recording_sleep(delay, *args, **kwargs):
+        delays.append(delay)
+        await sleep(0)
+
+    async def scenario():
+        source = FlakySource(failures=5)
+        listener = ChangeFeedListener(source, reconnect_delay=1.0, max_reconnect_delay=8.0)
+        monkeypatch.setattr(change_feed.asyncio, "sleep", recording_sleep)
+        listener.start()
+        # 待機は差し替え前の sleep で行い、記録に混ぜない
+        while len(delays) < 7:
+            await sleep(0)
+        await listener.stop()
+        monkeypatch.undo()
+
+    asyncio.run(scenario())
+    # 失敗が続く間は倍々（上限あり）、購読に成功したら初期値に戻す
+    assert delays[:7] == [1.0, 2.0, 4.0, 8.0, 8.0, 1.0, 1.0]
+
+
+def test_realtime_source_against_fake_server(wait_until):
+    with FakeRealtimeServer() as server:
+        async def scenario():
+            source = SupabaseRealtimeSource(server.url, "test-key", sorted(TABLE_NAMESPACES), heartbeat_interval=0.05)
+            listener = ChangeFeedListener(source, reconnect_delay=0.05)
+            listener.start()
+            await wait_until(lambda: listener.subscriptions == 1)
+            # サーバーの操作は完了まで待つため、クライアントのイベントループを塞がないようスレッドで呼ぶ
+            await asyncio.to_thread(server.notify, "works", "DELETE", {"id": "work-2"})
+            await wait_until(lambda: listener.events_handled == 1)
+            after_change = cached_keys("works")
+
+            cache_registry.cache("works").set("all", "reloaded")
+            await asyncio.to_thread(server.disconnect_all)
+            await wait_until(lambda: listener.subscriptions == 2)
+            await listener.stop()
+            return after_change
+
+        after_change = asyncio.run(scenario())
+        assert server.joins == 2
+
+    # DELETE は old_record のIDで1件だけ破棄する
+    assert after_change == {"id:work-1"}
+    # 再接続後は全体を破棄する
+    assert cached_keys("works") == set()
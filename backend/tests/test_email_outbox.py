@@ -0,0 +1,153 @@
+"""アウトボックス + SMTP接続プールを SMTP代替サーバー（benchmarks.fake_smtp）に対して動かす"""
+import asyncio
+
+import pytest
+
+from app.services.outbox import EmailOutbox, OutboxMessage, SQLiteSpool
+from app.services.smtp_pool import SMTPConnectionPool
+from benchmarks.fake_smtp import FakeSMTPServer
+
+
+@pytest.fixture
+def smtp():
+    with FakeSMTPServer() as server:
+        yield server
+
+
+@pytest.fixture
+def spool_path(tmp_path):
+    return str(tmp_path / "outbox.sqlite3")
+
+
+def make_outbox(server: FakeSMTPServer, spool_path: str, **options) -> tuple[EmailOutbox, SMTPConnectionPool]:
+    host, port = server.address
+    pool = SMTPConnectionPool(host, port, use_tls=False, size=2, timeout=5)
+
+    async def deliver(message: OutboxMessage) -> None:
+        await pool.send("portfolio@example.com", [message.email_to], f"Subject: {message.subject}\n\n{message.html_content}")
+
+    options = {"workers": 2, "max_attempts": 5, "retry_base": 0.05, "retry_max": 0.2, **options}
+    return EmailOutbox(SQLiteSpool(spool_path), deliver, **options), pool
+
+
+def test_delivers_over_reused_connections(smtp, spool_path, wait_until):
+    async def scenario():
+        outbox, pool = make_outbox(smtp, spool_path)
+        for i in range(10):
+            await outbox.enqueue("admin@example.com", f"subject {i}", f"body {i}")
+        await wait_until(lambda: outbox.sent == 10)
+        await outbox.stop()
+        await pool.close()
+        return outbox.spool.counts()
+
+    counts = asyncio.run(scenario())
+    assert counts == {}
+    assert sorted(m.data.splitlines()[0] for m in smtp.messages) == sorted(f"Subject: subject {i}" for i in range(10))
+    # ワーカー数（プールの大きさ）を超えて接続しない
+    assert smtp.connections <= 2
+
+
+def test_retries_transient_failures(smtp, spool_path, wait_until):
+    smtp.fail_next = 2
+
+    async def scenario():
+        outbox, pool = make_outbox(smtp, spool_path, workers=1)
+        await outbox.enqueue("admin@example.com", "retry", "body")
+        await wait_until(lambda: outbox.sent == 1)
+        stats = outbox.stats()
+        await outbox.stop()
+        await pool.close()
+        return stats
+
+    stats = asyncio.run(scenario())
+    assert stats["failed_attempts"] == 2
+    assert stats["dead"] == 0
+    assert len(smtp.messages) == 1
+
+
+def test_gives_up_after_max_attempts(smtp, spool_path, wait_until):
+    smtp.fail_next = 100
+
+    async def scenario():
+        outbox, pool = make_outbox(smtp, spool_path, workers=1, max_attempts=3)
+        await outbox.enqueue("admin@example.com", "dead", "body")
+        await wait_until(lambda: outbox.dead == 1)
+        stats = outbox.stats()
+        await outbox.stop()
+        await pool.close()
+        return outbox.spool.counts(), stats
+
+    counts, stats = asyncio.run(scenario())
+    # 上限に達したメッセージは削除せず dead として残る
+    assert counts == {"dead": 1}
+    assert stats["failed_attempts"] == 3
+    assert smtp.messages == []
+
+
+def test_reconnects_when_server_drops_connection(smtp, spool_path, wait_until):
+    smtp.drop_after = 1
+
+    async def scenario():
+        outbox, pool = make_outbox(smtp, spool_path, workers=1)
+        for i in range(3):
+            await outbox.enqueue("admin@example.com", f"drop {i}", "body")
+        await wait_until(lambda: outbox.sent == 3)
+        stats = outbox.stats()
+        await outbox.stop()
+        await pool.close()
+        return stats
+
+    stats = asyncio.run(scenario())
+    # 切断された接続はプール側で張り直し、アウトボックスの再試行にはならない
+    assert stats["failed_attempts"] == 0
+    assert len(smtp.messages) == 3
+    assert smtp.connections == 3
+
+
+def test_recovers_pending_messages_after_restart(smtp, spool_path, wait_until):
+    smtp.fail_next = 1
+
+    async def first_process():
+        # 1回目の送信に失敗し、再試行を待つ間に停止する
+        outbox, pool = make_outbox(smtp, spool_path, workers=1, retry_base=0.3, retry_max=0.3)
+        await outbox.enqueue("admin@example.com", "restart", "body")
+        await wait_until(lambda: outbox.stats()["failed_attempts"] == 1)
+        await outbox.stop()
+        await pool.close()
+
+    async def second_process():
+        outbox, pool = make_outbox(smtp, spool_path, workers=1)
+        await outbox.start()
+        await wait_until(lambda: outbox.sent == 1)
+        await outbox.stop()
+        await pool.close()
+        return outbox.spool.counts()
+
+    asyncio.run(first_process())
+    assert smtp.messages == []
+    assert SQLiteSpool(spool_path).counts() == {"pending": 1}
+
+    assert asyncio.run(second_process()) == {}
+    assert [m.data.splitlines()[0] for m in smtp.messages] == ["Subject: restart"]
+
+
+def test_waits_for_lease_of_crashed_sender(smtp, spool_path, wait_until):
+    # 別プロセスが送信中（リース中）のまま落ちたメッセージ
+    spool = SQLiteSpool(spool_path)
+    spool.add(OutboxMessage(id="leased", email_to="admin@example.com", subject="leased", html_content="body"))
+    assert spool.claim("leased", lease_seconds=0.5)
+    spool.close()
+
+    async def scenario():
+        outbox, pool = make_outbox(smtp, spool_path, workers=2)
+        await outbox.start()
+        await asyncio.sleep(0.2)
+        during_lease = len(smtp.messages)
+        await wait_until(lambda: outbox.sent == 1)
+        await outbox.stop()
+        await pool.close()
+        return during_lease
+
+    # リースが切れるまでは送らず、切れた後に1回だけ送る
+    assert asyncio.run(scenario()) == 0
+    assert len(smtp.messages) == 1
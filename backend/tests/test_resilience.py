@@ -0,0 +1,151 @@
+"""上流障害時のふるまい（障害を注入した PostgREST 代替サーバー benchmarks.fake_postgrest に対して動かす）"""
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.infra.cache.cache_registry import cache_registry
+from app.infra.repository import query_executor
+from app.infra.repository.supabase_work_repository import SupabaseWorkRepository
+from app.infra.resilience import CircuitBreaker, CircuitOpenError, ResiliencePolicy, UpstreamUnavailableError
+from app.infra.supabase_client import supabase_provider
+from benchmarks.fake_postgrest import FakePostgrestServer, Faults, build_dataset
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """代替サーバーを起動し、Supabase クライアントの接続先にする"""
+    with FakePostgrestServer(build_dataset(works=5), seed=0) as server:
+        monkeypatch.setattr(settings, "SUPABASE_URL", server.url)
+        yield server
+
+
+def use_policy(monkeypatch, **options) -> ResiliencePolicy:
+    """すべてのリポジトリの問い合わせに適用する方針を差し替える"""
+    policy = ResiliencePolicy(**{"retries": 0, "backoff": 0.01, **options})
+    monkeypatch.setattr(query_executor, "upstream_policy", policy)
+    return policy
+
+
+def run(scenario):
+    """scenario(repository) を実行する（クライアントはイベントループごとに作り直す）"""
+    async def main():
+        try:
+            return await scenario(SupabaseWorkRepository(supabase_provider.get_async_client()))
+        finally:
+            await supabase_provider.aclose()
+
+    return asyncio.run(main())
+
+
+async def failures(repository: SupabaseWorkRepository, calls: int) -> list[BaseException]:
+    results = await asyncio.gather(*(repository.find_by_id("work-1") for _ in range(calls)), return_exceptions=True)
+    return [result for result in results if isinstance(result, BaseException)]
+
+
+def test_retries_transient_errors(upstream, monkeypatch):
+    upstream.faults = Faults(error_rate=0.3)
+
+    use_policy(monkeypatch, retries=0)
+    without_retries = run(lambda repository: failures(repository, 100))
+    policy = use_policy(monkeypatch, retries=3)
+    with_retries = run(lambda repository: failures(repository, 100))
+
+    assert len(without_retries) >= 10
+    assert all(isinstance(error, UpstreamUnavailableError) for error in without_retries)
+    # 4回とも失敗する確率は 0.3^4（1%未満）
+    assert len(with_retries) <= 3
+    assert policy.retried > 0
+
+
+def test_deadline_bounds_a_hung_upstream(upstream, monkeypatch):
+    upstream.faults = Faults(slow_rate=1.0, slow_ms=2000)
+    breaker = CircuitBreaker("test", min_calls=2)
+    policy = use_policy(monkeypatch, breaker=breaker, deadline=0.5, attempt_timeout=0.2, retries=5)
+
+    async def scenario(repository):
+        started = time.perf_counter()
+        with pytest.raises(UpstreamUnavailableError):
+            await repository.find_by_id("work-1")
+        return time.perf_counter() - started
+
+    elapsed = run(scenario)
+    assert elapsed < 0.8
+    # 試行ごとの期限切れは一時的な失敗として再試行し、サーキットブレーカーにも数える
+    assert policy.retried >= 1
+    assert breaker.state == "open"
+
+
+def test_circuit_breaker_opens_and_recovers(upstream, monkeypatch):
+    upstream.faults = Faults(down=True)
+    breaker = CircuitBreaker("test", min_calls=10, open_seconds=0.3)
+    use_policy(monkeypatch, breaker=breaker)
+
+    async def scenario(repository):
+        await failures(repository, 20)
+        before = upstream.request_count
+        rejected = await failures(repository, 50)
+        requests_while_open = upstream.request_count - before
+
+        upstream.faults = Faults()
+        await asyncio.sleep(0.3)
+        # half_open の1件が成功すると閉じる
+        await repository.find_by_id("work-1")
+        return rejected, requests_while_open
+
+    rejected, requests_while_open = run(scenario)
+    assert len(rejected) == 50 and all(isinstance(error, CircuitOpenError) for error in rejected)
+    assert requests_while_open == 0
+    assert breaker.state == "closed"
+
+
+def test_hedging_cuts_slow_responses(upstream, monkeypatch):
+    upstream.faults = Faults(slow_rate=0.2, slow_ms=300)
+
+    async def slow_calls(repository) -> int:
+        slow = 0
+        for _ in range(30):
+            started = time.perf_counter()
+            await repository.find_by_id("work-1")
+            slow += time.perf_counter() - started >= 0.3
+        return slow
+
+    use_policy(monkeypatch)
+    plain = run(slow_calls)
+    policy = use_policy(monkeypatch, hedge_delay=0.03)
+    hedged = run(slow_calls)
+
+    # 2本とも遅れたときだけ遅くなる
+    assert hedged < plain
+    assert policy.hedge_wins > 0
+
+
+def test_app_serves_expired_cache_while_upstream_is_down(upstream, monkeypatch):
+    from app.main import app
+
+    use_policy(monkeypatch)
+    cache_registry.invalidate(notify=False)
+
+    async def scenario(_):
+        async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+            fresh = await client.get("/works/work-2")
+            # すべてのキャッシュ（リポジトリ・レスポンスのスナップショット）を stale 期間も過ぎた期限切れにする
+            for name in cache_registry.stats():
+                for entry in cache_registry.cache(name)._entries.values():
+                    entry.fresh_until = entry.stale_until = 0.0
+            upstream.faults = Faults(down=True)
+            return fresh, await client.get("/works/work-2"), await client.get("/works/work-3")
+
+    try:
+        fresh, stale, missing = run(scenario)
+        fallbacks = sum(stats["fallbacks"] for stats in cache_registry.stats().values())
+    finally:
+        cache_registry.invalidate(notify=False)
+    assert fresh.status_code == 200
+    assert stale.status_code == 200 and stale.content == fresh.content
+    assert fallbacks > 0
+    # キャッシュのないルートは 503
+    assert missing.status_code == 503
+    assert missing.json() == {"detail": "Upstream is temporarily unavailable"}
@@ -0,0 +1,103 @@
+"""ローカルスナップショット（StaticSnapshotSource と一時ディレクトリのストアでオフラインに動かす）"""
+import asyncio
+import os
+import time
+
+import pytest
+
+from app.infra.cache.cache_registry import CacheRegistry
+from app.infra.repository.snapshot_work_repository import SnapshotWorkRepository
+from app.infra.snapshot.store import SQLiteSnapshotStore
+from app.infra.snapshot.sync_engine import SnapshotSyncEngine, StaticSnapshotSource
+from benchmarks.fake_postgrest import build_dataset
+
+
+@pytest.fixture
+def store(tmp_path) -> SQLiteSnapshotStore:
+    return SQLiteSnapshotStore(str(tmp_path / "snapshot.sqlite3"))
+
+
+@pytest.fixture
+def source() -> StaticSnapshotSource:
+    return StaticSnapshotSource(build_dataset(works=5))
+
+
+def make_engine(store: SQLiteSnapshotStore, source: StaticSnapshotSource, registry: CacheRegistry | None = None) -> SnapshotSyncEngine:
+    return SnapshotSyncEngine(store, source, interval=3600, registry=registry or CacheRegistry())
+
+
+def test_write_replaces_the_whole_version_or_nothing(store, tmp_path):
+    store.write("v1", {"works": [{"id": "work-1"}], "skills": []})
+    assert store.read_meta().version == "v1"
+
+    # 書き込み途中で失敗しても、保存済みの版はそのまま残る（一時ファイルも残さない）
+    with pytest.raises(TypeError):
+        store.write("v2", {"works": [{"id": "work-2"}], "skills": [{"id": 1, "icon": object()}]})
+    meta, tables = store.read()
+    assert meta.version == "v1"
+    assert tables == {"works": [{"id": "work-1"}], "skills": []}
+    assert os.listdir(tmp_path) == ["snapshot.sqlite3"]
+
+    store.write("v2", {"works": [{"id": "work-2"}, {"id": "work-3"}]})
+    meta, tables = store.read()
+    assert meta.version == "v2"
+    assert tables == {"works": [{"id": "work-2"}, {"id": "work-3"}]}
+
+
+def test_serves_last_good_version_while_source_fails(store, source):
+    async def scenario():
+        engine = make_engine(store, source)
+        await engine.start()
+        version = engine.current.version
+
+        source.fail = ConnectionError("upstream down")
+        with pytest.raises(ConnectionError):
+            await engine.refresh(since=time.time())
+        work = await SnapshotWorkRepository(engine, fallback=None).find_by_id("work-1")
+        await engine.stop()
+        return version, engine.current.version, work
+
+    version, current, work = asyncio.run(scenario())
+    assert current == version
+    assert work is not None and work.id == "work-1"
+
+
+def test_restart_serves_the_stored_version_without_the_source(store, source):
+    async def first_process():
+        engine = make_engine(store, source)
+        await engine.start()
+        await engine.stop()
+        return engine.current.version
+
+    async def restarted_process():
+        # 取得元が止まったまま、保存から interval 以上たって再起動した
+        engine = make_engine(store, source)
+        engine.interval = 0.0
+        await engine.start()
+        work = await SnapshotWorkRepository(engine, fallback=None).find_by_id("work-2")
+        await engine.stop()
+        return engine, work
+
+    version = asyncio.run(first_process())
+    source.fail = ConnectionError("upstream down")
+    engine, work = asyncio.run(restarted_process())
+    assert engine.current.version == version
+    assert engine.stats()["loads"] == 1 and engine.stats()["failures"] == 1
+    assert work is not None and work.id == "work-2"
+
+
+def test_version_change_invalidates_only_changed_namespaces(store, source):
+    registry = CacheRegistry()
+    for namespace in ("works", "skills", "about", "hero"):
+        registry.cache(namespace).set("all", namespace)
+
+    async def scenario():
+        engine = make_engine(store, source, registry)
+        await engine.start()
+        # 学歴（about 名前空間）だけを変える
+        source.tables["education"][0]["description"] = "更新"
+        await engine.refresh(since=time.time())
+        await engine.stop()
+        return {namespace: len(registry.cache(namespace)) for namespace in ("works", "skills", "about", "hero")}
+
+    assert asyncio.run(scenario()) == {"works": 1, "skills": 1, "about": 0, "hero": 1}
@@ -0,0 +1,45 @@
+"""作品検索の索引：一致が多いときの打ち切りが、すべての一致を計算した結果と同じになること"""
+import asyncio
+import dataclasses
+
+import pytest
+
+from app.domain.entity.work import WorkRecord
+from app.infra.search.work_search_index import DIRECT_SCORING_MAX, WorkSearchIndex
+from benchmarks.work_search import QUERIES, build_works
+
+MULTI_QUERIES = QUERIES["multi"] + ["画像認識", "文書検索", "会計自動化", "python docker", "fast 管理"]
+
+
+@pytest.fixture(scope="module")
+def works() -> list[WorkRecord]:
+    works = [WorkRecord.from_row(row) for row in build_works(1500, seed=1)]
+    # 同じ内容の作品を混ぜ、limit 件目の前後に同点を作る（同点はリポジトリの並び順）
+    copies = [dataclasses.replace(work, id=f"{work.id}-copy-{n}") for work in works[:50] for n in range(3)]
+    return works + copies
+
+
+@pytest.fixture(scope="module")
+def exact(works) -> WorkSearchIndex:
+    index = WorkSearchIndex(rank_depth=None)
+    asyncio.run(index.refresh(works))
+    return index
+
+
+def ranked(index: WorkSearchIndex, query: str, limit: int) -> tuple[int, list[tuple[str, float]]]:
+    result = index.search(query, limit)
+    return result.total, [(hit.work.id, hit.score) for hit in result.hits]
+
+
+@pytest.mark.parametrize("rank_depth", [1, 16, 64])
+def test_early_termination_matches_scoring_every_match(works, exact, rank_depth):
+    index = WorkSearchIndex(rank_depth=rank_depth)
+    asyncio.run(index.refresh(works))
+
+    large = 0
+    for query in MULTI_QUERIES:
+        for limit in (1, 20, 100):
+            assert ranked(index, query, limit) == ranked(exact, query, limit), (query, limit)
+        large += index.search(query, 1).total > DIRECT_SCORING_MAX
+    # 打ち切りを使う（一致が多い）検索語を含めて比べている
+    assert large >= 3
@@ -0,0 +1,39 @@
+"""作品一覧：不正なカーソルだけを 400 にする"""
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from app.domain.entity.work import Work, WorkQuery
+from app.infra.repository.supabase_work_repository import decode_cursor
+from app.usecase.work_usecase import WorkUseCase
+
+
+class PageRepository:
+    """find_page だけを持つリポジトリ（カーソルは本物と同じく decode_cursor で読む）"""
+
+    def __init__(self, row: dict):
+        self.row = row
+
+    async def find_page(self, query: WorkQuery):
+        if query.cursor:
+            decode_cursor(query.cursor)
+        return Work(**self.row)
+
+
+def get_page(row: dict, cursor: str | None):
+    return asyncio.run(WorkUseCase(PageRepository(row)).get_works_page(WorkQuery(limit=10, cursor=cursor)))
+
+
+def test_invalid_cursor_is_a_client_error():
+    with pytest.raises(HTTPException) as error:
+        get_page({}, "not-a-cursor")
+    assert error.value.status_code == 400
+    assert error.value.detail == "Invalid cursor"
+
+
+def test_malformed_upstream_row_is_not_blamed_on_the_cursor():
+    # 必須項目の欠けた行（上流のデータの誤り）は 400 にしない
+    with pytest.raises(ValidationError):
+        get_page({"id": "work-1"}, None)